@@ -11,7 +11,8 @@ from app.platform.db.base import Base
 from app.features.auth.models import user
 from app.features.api_keys.models import api_key
 from app.features.wallet.models import wallet
-from app.features.payments.models import transaction
+from app.features.payments.models import payout, transaction
+from app.features.wallet.models import hold, scheduled_transfer
 
 config = context.config
 settings = get_settings()
@@ -0,0 +1,34 @@
+"""wallet history indexes
+
+Revision ID: 3b9f1c2a7d41
+Revises: d2f873264907
+Create Date: 2026-10-19 09:12:44.310527
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9f1c2a7d41'
+down_revision: Union[str, Sequence[str], None] = 'd2f873264907'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('idx_transaction_user_created', 'transactions', ['user_id', 'created_at'], unique=False)
+    op.create_index('idx_transaction_sender_created', 'transactions', ['sender_wallet_id', 'created_at'], unique=False)
+    op.create_index('idx_transaction_recipient_created', 'transactions', ['recipient_wallet_id', 'created_at'], unique=False)
+    op.drop_index('idx_transaction_user_id', table_name='transactions')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('idx_transaction_user_id', 'transactions', ['user_id'], unique=False)
+    op.drop_index('idx_transaction_recipient_created', table_name='transactions')
+    op.drop_index('idx_transaction_sender_created', table_name='transactions')
+    op.drop_index('idx_transaction_user_created', table_name='transactions')
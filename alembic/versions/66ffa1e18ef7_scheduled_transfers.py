@@ -0,0 +1,59 @@
+"""scheduled transfers
+
+Revision ID: 66ffa1e18ef7
+Revises: a232f8fc5926
+Create Date: 2026-10-19 17:51:59.196200
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '66ffa1e18ef7'
+down_revision: Union[str, Sequence[str], None] = 'a232f8fc5926'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('scheduled_transfers',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('sender_wallet_id', sa.UUID(), nullable=False),
+    sa.Column('recipient_wallet_id', sa.UUID(), nullable=False),
+    sa.Column('amount', sa.BigInteger(), nullable=False),
+    sa.Column('interval', sa.Enum('once', 'daily', 'weekly', 'monthly', name='scheduleinterval'), nullable=False),
+    sa.Column('status', sa.Enum('active', 'completed', 'cancelled', 'failed', name='schedulestatus'), nullable=False),
+    sa.Column('next_run_at', sa.DateTime(), nullable=False),
+    sa.Column('remaining_runs', sa.Integer(), nullable=True),
+    sa.Column('last_run_at', sa.DateTime(), nullable=True),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('failure_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['recipient_wallet_id'], ['wallets.id'], ),
+    sa.ForeignKeyConstraint(['sender_wallet_id'], ['wallets.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_scheduled_transfer_user_created', 'scheduled_transfers', ['user_id', 'created_at'], unique=False)
+    op.create_index(
+        'idx_scheduled_transfer_active_due',
+        'scheduled_transfers',
+        ['next_run_at'],
+        unique=False,
+        postgresql_where=sa.text("status = 'active'")
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_scheduled_transfer_active_due', table_name='scheduled_transfers', postgresql_where=sa.text("status = 'active'"))
+    op.drop_index('idx_scheduled_transfer_user_created', table_name='scheduled_transfers')
+    op.drop_table('scheduled_transfers')
+    sa.Enum(name='scheduleinterval').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='schedulestatus').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,48 @@
+"""index audit
+
+Revision ID: 8a41c6e2f5b3
+Revises: 3b9f1c2a7d41
+Create Date: 2026-10-19 18:02:11.480215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a41c6e2f5b3'
+down_revision: Union[str, Sequence[str], None] = '3b9f1c2a7d41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_transaction_email_amount_created',
+            'transactions',
+            ['email', 'amount', 'created_at'],
+            unique=False,
+            postgresql_concurrently=True
+        )
+        op.drop_index('idx_transaction_reference', table_name='transactions', postgresql_concurrently=True)
+        op.drop_index('idx_transaction_status', table_name='transactions', postgresql_concurrently=True)
+        op.drop_index('idx_transaction_type', table_name='transactions', postgresql_concurrently=True)
+        op.drop_index('idx_wallet_number', table_name='wallets', postgresql_concurrently=True)
+        op.drop_index('idx_wallet_user_id', table_name='wallets', postgresql_concurrently=True)
+        op.drop_index('idx_api_key_key', table_name='api_keys', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('idx_api_key_key', 'api_keys', ['key_hash'], unique=False, postgresql_concurrently=True)
+        op.create_index('idx_wallet_user_id', 'wallets', ['user_id'], unique=False, postgresql_concurrently=True)
+        op.create_index('idx_wallet_number', 'wallets', ['wallet_number'], unique=False, postgresql_concurrently=True)
+        op.create_index('idx_transaction_type', 'transactions', ['transaction_type'], unique=False, postgresql_concurrently=True)
+        op.create_index('idx_transaction_status', 'transactions', ['status'], unique=False, postgresql_concurrently=True)
+        op.create_index('idx_transaction_reference', 'transactions', ['reference'], unique=False, postgresql_concurrently=True)
+        op.drop_index('idx_transaction_email_amount_created', table_name='transactions', postgresql_concurrently=True)
@@ -0,0 +1,63 @@
+"""payouts
+
+Revision ID: a232f8fc5926
+Revises: e7a3b95c0d18
+Create Date: 2026-10-19 17:47:26.417413
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a232f8fc5926'
+down_revision: Union[str, Sequence[str], None] = 'e7a3b95c0d18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE transactiontype ADD VALUE IF NOT EXISTS 'withdrawal'")
+    op.create_table('payouts',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('reference', sa.String(length=255), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('wallet_id', sa.UUID(), nullable=False),
+    sa.Column('amount', sa.BigInteger(), nullable=False),
+    sa.Column('bank_code', sa.String(length=20), nullable=False),
+    sa.Column('account_number', sa.String(length=20), nullable=False),
+    sa.Column('account_name', sa.String(length=255), nullable=False),
+    sa.Column('recipient_code', sa.String(length=64), nullable=True),
+    sa.Column('transfer_code', sa.String(length=64), nullable=True),
+    sa.Column('status', sa.Enum('queued', 'submitted', 'success', 'failed', name='payoutstatus'), nullable=False),
+    sa.Column('attempts', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('failure_reason', sa.Text(), nullable=True),
+    sa.Column('submitted_at', sa.DateTime(), nullable=True),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['wallet_id'], ['wallets.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('reference')
+    )
+    op.create_index('idx_payout_user_created', 'payouts', ['user_id', 'created_at'], unique=False)
+    op.create_index(
+        'idx_payout_queued_created',
+        'payouts',
+        ['created_at'],
+        unique=False,
+        postgresql_where=sa.text("status = 'queued'")
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_payout_queued_created', table_name='payouts', postgresql_where=sa.text("status = 'queued'"))
+    op.drop_index('idx_payout_user_created', table_name='payouts')
+    op.drop_table('payouts')
+    sa.Enum(name='payoutstatus').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,33 @@
+"""payout holds do not expire
+
+Revision ID: a7c3e5f19b62
+Revises: d9b4f27a1c85
+Create Date: 2026-10-19 22:14:37.508126
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e5f19b62'
+down_revision: Union[str, Sequence[str], None] = 'd9b4f27a1c85'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column('wallet_holds', 'expires_at', existing_type=sa.DateTime(), nullable=True)
+    op.execute(
+        "UPDATE wallet_holds SET expires_at = NULL "
+        "WHERE status = 'active' AND reference IN (SELECT reference FROM payouts)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("UPDATE wallet_holds SET expires_at = now() + interval '7 days' WHERE expires_at IS NULL")
+    op.alter_column('wallet_holds', 'expires_at', existing_type=sa.DateTime(), nullable=False)
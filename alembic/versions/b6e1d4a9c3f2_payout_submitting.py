@@ -0,0 +1,49 @@
+"""payout submitting status
+
+Revision ID: b6e1d4a9c3f2
+Revises: 66ffa1e18ef7
+Create Date: 2026-10-19 19:12:40.308114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6e1d4a9c3f2'
+down_revision: Union[str, Sequence[str], None] = '66ffa1e18ef7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE payoutstatus ADD VALUE IF NOT EXISTS 'submitting' AFTER 'queued'")
+    op.create_index(
+        'idx_payout_unsent_created',
+        'payouts',
+        ['created_at'],
+        unique=False,
+        postgresql_where=sa.text("status IN ('queued', 'submitting')")
+    )
+    op.drop_index('idx_payout_queued_created', table_name='payouts', postgresql_where=sa.text("status = 'queued'"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("UPDATE payouts SET status = 'queued' WHERE status = 'submitting'")
+    op.create_index(
+        'idx_payout_queued_created',
+        'payouts',
+        ['created_at'],
+        unique=False,
+        postgresql_where=sa.text("status = 'queued'")
+    )
+    op.drop_index(
+        'idx_payout_unsent_created',
+        table_name='payouts',
+        postgresql_where=sa.text("status IN ('queued', 'submitting')")
+    )
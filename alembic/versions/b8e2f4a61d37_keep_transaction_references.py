@@ -0,0 +1,59 @@
+"""keep transaction references
+
+Revision ID: b8e2f4a61d37
+Revises: a7c3e5f19b62
+Create Date: 2026-10-19 22:41:09.316254
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e2f4a61d37'
+down_revision: Union[str, Sequence[str], None] = 'a7c3e5f19b62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('DROP TRIGGER transactions_claim_reference ON transactions')
+    op.execute("""
+        CREATE TRIGGER transactions_claim_reference
+        BEFORE INSERT ON transactions
+        FOR EACH ROW EXECUTE FUNCTION claim_transaction_reference()
+    """)
+    op.execute(
+        'DELETE FROM transaction_references claim '
+        'WHERE NOT EXISTS (SELECT 1 FROM transactions t WHERE t.reference = claim.reference)'
+    )
+    op.execute("""
+        CREATE OR REPLACE FUNCTION reject_transaction_reference_change() RETURNS trigger AS $$
+        BEGIN
+            IF NEW.reference IS DISTINCT FROM OLD.reference THEN
+                RAISE EXCEPTION 'transaction references cannot be changed';
+            END IF;
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER transactions_keep_reference
+        BEFORE UPDATE OF reference ON transactions
+        FOR EACH ROW EXECUTE FUNCTION reject_transaction_reference_change()
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP TRIGGER transactions_keep_reference ON transactions')
+    op.execute('DROP FUNCTION reject_transaction_reference_change()')
+    op.execute('DROP TRIGGER transactions_claim_reference ON transactions')
+    op.execute("""
+        CREATE TRIGGER transactions_claim_reference
+        BEFORE INSERT OR UPDATE OF reference ON transactions
+        FOR EACH ROW EXECUTE FUNCTION claim_transaction_reference()
+    """)
@@ -0,0 +1,103 @@
+"""partition transactions by month
+
+Revision ID: c5d2e8f41a6b
+Revises: 8a41c6e2f5b3
+Create Date: 2026-10-19 19:14:37.204518
+
+"""
+from datetime import date, datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5d2e8f41a6b'
+down_revision: Union[str, Sequence[str], None] = '8a41c6e2f5b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 2
+COLUMNS = (
+    'id, reference, user_id, amount, email, status, transaction_type, authorization_url, '
+    'sender_wallet_id, recipient_wallet_id, paid_at, created_at, updated_at'
+)
+SECONDARY_INDEXES = (
+    ('idx_transaction_user_created', ['user_id', 'created_at']),
+    ('idx_transaction_sender_created', ['sender_wallet_id', 'created_at']),
+    ('idx_transaction_recipient_created', ['recipient_wallet_id', 'created_at']),
+    ('idx_transaction_email_amount_created', ['email', 'amount', 'created_at']),
+)
+
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def _create_table(name: str, primary_key: list[str], **kwargs) -> None:
+    op.create_table(name,
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('reference', sa.String(length=255), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('amount', sa.BigInteger(), nullable=False),
+    sa.Column('email', sa.String(length=255), nullable=True),
+    sa.Column('status', postgresql.ENUM('pending', 'success', 'failed', name='transactionstatus', create_type=False), nullable=False),
+    sa.Column('transaction_type', postgresql.ENUM('deposit', 'transfer', name='transactiontype', create_type=False), nullable=False),
+    sa.Column('authorization_url', sa.Text(), nullable=True),
+    sa.Column('sender_wallet_id', sa.UUID(), nullable=True),
+    sa.Column('recipient_wallet_id', sa.UUID(), nullable=True),
+    sa.Column('paid_at', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['recipient_wallet_id'], ['wallets.id'], ),
+    sa.ForeignKeyConstraint(['sender_wallet_id'], ['wallets.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint(*primary_key, name='transactions_pkey'),
+    **kwargs
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('ALTER TABLE transactions RENAME TO transactions_unpartitioned')
+    op.execute('ALTER TABLE transactions_unpartitioned RENAME CONSTRAINT transactions_pkey TO transactions_unpartitioned_pkey')
+    _create_table('transactions', ['id', 'created_at'], postgresql_partition_by='RANGE (created_at)')
+
+    oldest = op.get_bind().execute(sa.text('SELECT min(created_at) FROM transactions_unpartitioned')).scalar()
+    today = datetime.utcnow()
+    month = date((oldest or today).year, (oldest or today).month, 1)
+    last = date(today.year, today.month, 1)
+    for _ in range(MONTHS_AHEAD):
+        last = _next_month(last)
+    while month <= last:
+        op.execute(
+            f"CREATE TABLE transactions_p{month:%Y_%m} PARTITION OF transactions "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_next_month(month).isoformat()}')"
+        )
+        month = _next_month(month)
+    op.execute('CREATE TABLE transactions_default PARTITION OF transactions DEFAULT')
+
+    op.execute(f'INSERT INTO transactions ({COLUMNS}) SELECT {COLUMNS} FROM transactions_unpartitioned')
+    op.drop_table('transactions_unpartitioned')
+
+    op.create_index('idx_transaction_reference_created', 'transactions', ['reference', 'created_at'], unique=True)
+    for name, columns in SECONDARY_INDEXES:
+        op.create_index(name, 'transactions', columns, unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('ALTER TABLE transactions RENAME TO transactions_partitioned')
+    op.execute('ALTER TABLE transactions_partitioned RENAME CONSTRAINT transactions_pkey TO transactions_partitioned_pkey')
+    for name, _ in SECONDARY_INDEXES:
+        op.execute(f'ALTER INDEX {name} RENAME TO {name}_partitioned')
+    _create_table('transactions', ['id'])
+
+    op.execute(f'INSERT INTO transactions ({COLUMNS}) SELECT {COLUMNS} FROM transactions_partitioned')
+    op.drop_table('transactions_partitioned')
+
+    op.create_index(op.f('ix_transactions_reference'), 'transactions', ['reference'], unique=True)
+    for name, columns in SECONDARY_INDEXES:
+        op.create_index(name, 'transactions', columns, unique=False)
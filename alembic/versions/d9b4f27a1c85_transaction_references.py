@@ -0,0 +1,48 @@
+"""transaction references
+
+Revision ID: d9b4f27a1c85
+Revises: f3a8c1e9b2d4
+Create Date: 2026-10-19 19:48:22.615307
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9b4f27a1c85'
+down_revision: Union[str, Sequence[str], None] = 'f3a8c1e9b2d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('transaction_references',
+    sa.Column('reference', sa.String(length=255), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('reference')
+    )
+    op.execute('INSERT INTO transaction_references (reference, created_at) SELECT reference, created_at FROM transactions')
+    op.execute("""
+        CREATE OR REPLACE FUNCTION claim_transaction_reference() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO transaction_references (reference, created_at) VALUES (NEW.reference, NEW.created_at);
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER transactions_claim_reference
+        BEFORE INSERT OR UPDATE OF reference ON transactions
+        FOR EACH ROW EXECUTE FUNCTION claim_transaction_reference()
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP TRIGGER transactions_claim_reference ON transactions')
+    op.execute('DROP FUNCTION claim_transaction_reference()')
+    op.drop_table('transaction_references')
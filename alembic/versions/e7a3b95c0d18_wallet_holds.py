@@ -0,0 +1,55 @@
+"""wallet holds
+
+Revision ID: e7a3b95c0d18
+Revises: c5d2e8f41a6b
+Create Date: 2026-10-19 20:41:09.615337
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7a3b95c0d18'
+down_revision: Union[str, Sequence[str], None] = 'c5d2e8f41a6b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('wallets', sa.Column('held_balance', sa.BigInteger(), server_default='0', nullable=False))
+    op.create_check_constraint('ck_wallet_held_balance', 'wallets', 'held_balance >= 0 AND held_balance <= balance')
+    op.create_table('wallet_holds',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('wallet_id', sa.UUID(), nullable=False),
+    sa.Column('amount', sa.BigInteger(), nullable=False),
+    sa.Column('reference', sa.String(length=255), nullable=False),
+    sa.Column('status', sa.Enum('active', 'captured', 'released', 'expired', name='holdstatus'), nullable=False),
+    sa.Column('expires_at', sa.DateTime(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['wallet_id'], ['wallets.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('reference')
+    )
+    op.create_index('idx_wallet_hold_wallet_status', 'wallet_holds', ['wallet_id', 'status'], unique=False)
+    op.create_index(
+        'idx_wallet_hold_active_expires',
+        'wallet_holds',
+        ['expires_at'],
+        unique=False,
+        postgresql_where=sa.text("status = 'active'")
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_wallet_hold_active_expires', table_name='wallet_holds', postgresql_where=sa.text("status = 'active'"))
+    op.drop_index('idx_wallet_hold_wallet_status', table_name='wallet_holds')
+    op.drop_table('wallet_holds')
+    sa.Enum(name='holdstatus').drop(op.get_bind(), checkfirst=True)
+    op.drop_constraint('ck_wallet_held_balance', 'wallets', type_='check')
+    op.drop_column('wallets', 'held_balance')
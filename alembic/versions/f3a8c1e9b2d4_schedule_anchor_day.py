@@ -0,0 +1,30 @@
+"""schedule anchor day
+
+Revision ID: f3a8c1e9b2d4
+Revises: b6e1d4a9c3f2
+Create Date: 2026-10-19 19:31:05.742918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a8c1e9b2d4'
+down_revision: Union[str, Sequence[str], None] = 'b6e1d4a9c3f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('scheduled_transfers', sa.Column('anchor_day', sa.SmallInteger(), nullable=True))
+    op.execute("UPDATE scheduled_transfers SET anchor_day = EXTRACT(DAY FROM next_run_at)")
+    op.alter_column('scheduled_transfers', 'anchor_day', nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('scheduled_transfers', 'anchor_day')
@@ -7,6 +7,7 @@ from sqlalchemy import JSON, UUID, Boolean, DateTime, ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.platform.db.base import Base
+from app.platform.db.ids import uuid7
 
 if TYPE_CHECKING:
     from app.features.auth.models.user import User
@@ -19,7 +20,7 @@ class APIKeyPermission(enum.Enum):
 class APIKey(Base):
     __tablename__ = "api_keys"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     key_hash: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -32,7 +33,6 @@ class APIKey(Base):
     user: Mapped["User"] = relationship("User", back_populates="api_keys")
 
     __table_args__ = (
-        Index("idx_api_key_key", "key_hash"),
         Index("idx_api_key_user_active", "user_id", "is_active"),
     )
 
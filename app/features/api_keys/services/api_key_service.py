@@ -8,6 +8,7 @@ from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.features.api_keys.models.api_key import APIKey
+from app.platform.tracing.provider import tracer
 
 pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
 
@@ -20,7 +21,8 @@ class APIKeyService:
 
     @staticmethod
     def verify_key(plain_key: str, hashed_key: str) -> bool:
-        return pwd_context.verify(plain_key, hashed_key)
+        with tracer.start_as_current_span("api_key.verify"):
+            return pwd_context.verify(plain_key, hashed_key)
 
     @staticmethod
     def generate_api_key() -> str:
@@ -6,6 +6,7 @@ from sqlalchemy import UUID, DateTime, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.platform.db.base import Base
+from app.platform.db.ids import uuid7
 
 if TYPE_CHECKING:
     from app.features.api_keys.models.api_key import APIKey
@@ -15,7 +16,7 @@ if TYPE_CHECKING:
 class User(Base):
     __tablename__ = "users"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     google_id: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
@@ -4,7 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.features.auth.schemas import GoogleAuthURLResponse
 from app.features.auth.services.auth_service import AuthService
 from app.platform.auth.jwt_service import JWTService
-from app.platform.db import get_db
+from app.platform.db import get_db, get_read_db
 from app.platform.response.schemas import error_response, success_response
 
 router = APIRouter()
@@ -17,8 +17,8 @@ async def google_login():
 @router.get("/google/callback")
 async def google_callback(code: str, db: AsyncSession = Depends(get_db)):
     try:
-        access_token = await AuthService.exchange_code_for_token(code)
-        user_info = await AuthService.get_google_user_info(access_token)
+        tokens = await AuthService.exchange_code_for_tokens(code)
+        user_info = await AuthService.get_user_info_from_tokens(tokens)
         user = await AuthService.get_or_create_user(db, user_info)
 
         jwt_token = JWTService.create_access_token(
@@ -50,8 +50,9 @@ async def google_callback(code: str, db: AsyncSession = Depends(get_db)):
         return error_response(message=f"Authentication failed: {str(e)}", status_code=500)
 
 @router.get("/user/{user_id}")
-async def get_user(user_id: str, db: AsyncSession = Depends(get_db)):
+async def get_user(user_id: str, db: AsyncSession = Depends(get_read_db)):
     try:
+        db.info["user_id"] = user_id
         user = await AuthService.get_user_by_id(db, user_id)
         if not user:
             return error_response(message="User not found", status_code=404)
@@ -1,14 +1,24 @@
+from datetime import datetime
+from typing import Any
 from urllib.parse import urlencode
 
 import httpx
-from sqlalchemy import select
+from jose import JWTError, jwt
+from sqlalchemy import exists, or_, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.features.auth.models.user import User
 from app.features.auth.schemas.auth import GoogleUserInfo
+from app.features.auth.services.google_jwks import google_jwks
 from app.features.wallet.services.wallet_service import WalletService
 from app.platform.config.settings import settings
+from app.platform.db import track_write
+from app.platform.db.ids import uuid7
+from app.platform.db.upsert import dialect_insert
+from app.platform.metrics.instruments import track_outbound
+from app.platform.tracing.provider import OUTBOUND_EVENT_HOOKS
 
+GOOGLE_ISSUERS = ["https://accounts.google.com", "accounts.google.com"]
 
 class AuthService:
 
@@ -26,9 +36,14 @@ class AuthService:
 
     @staticmethod
     async def exchange_code_for_token(code: str) -> str:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://oauth2.googleapis.com/token",
+        tokens = await AuthService.exchange_code_for_tokens(code)
+        return tokens["access_token"]
+
+    @staticmethod
+    async def exchange_code_for_tokens(code: str) -> dict[str, Any]:
+        async with httpx.AsyncClient(event_hooks=OUTBOUND_EVENT_HOOKS) as client:
+            response = await track_outbound("google", "token", client.post(
+                settings.GOOGLE_TOKEN_URL,
                 data={
                     "code": code,
                     "client_id": settings.GOOGLE_CLIENT_ID,
@@ -36,21 +51,20 @@ class AuthService:
                     "redirect_uri": settings.GOOGLE_REDIRECT_URI,
                     "grant_type": "authorization_code"
                 }
-            )
+            ))
 
             if response.status_code != 200:
                 raise Exception(f"Failed to exchange code for token: {response.text}")
 
-            data = response.json()
-            return data["access_token"]
+            return response.json()
 
     @staticmethod
     async def get_google_user_info(access_token: str) -> GoogleUserInfo:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://www.googleapis.com/oauth2/v1/userinfo",
+        async with httpx.AsyncClient(event_hooks=OUTBOUND_EVENT_HOOKS) as client:
+            response = await track_outbound("google", "userinfo", client.get(
+                settings.GOOGLE_USERINFO_URL,
                 headers={"Authorization": f"Bearer {access_token}"}
-            )
+            ))
 
             if response.status_code != 200:
                 raise Exception(f"Failed to get user info: {response.text}")
@@ -59,32 +73,95 @@ class AuthService:
             return GoogleUserInfo(**data)
 
     @staticmethod
-    async def get_or_create_user(db: AsyncSession, user_info: GoogleUserInfo) -> User:
-        result = await db.execute(
-            select(User).where(User.google_id == user_info.sub)
+    async def verify_id_token(id_token: str, access_token: str | None = None) -> GoogleUserInfo:
+        try:
+            kid = jwt.get_unverified_header(id_token).get("kid")
+            key = await google_jwks.get_key(kid) if kid else None
+            if key is None:
+                raise ValueError("Unknown id_token signing key")
+
+            claims = jwt.decode(
+                id_token,
+                key,
+                algorithms=["RS256"],
+                audience=settings.GOOGLE_CLIENT_ID,
+                issuer=GOOGLE_ISSUERS,
+                access_token=access_token
+            )
+        except JWTError as e:
+            raise ValueError(f"Invalid id_token: {e}") from None
+
+        if not claims.get("email_verified"):
+            raise ValueError("Google account email is not verified")
+
+        return GoogleUserInfo(
+            sub=claims["sub"],
+            email=claims["email"],
+            name=claims.get("name") or claims["email"],
+            picture=claims.get("picture")
         )
-        user = result.scalar_one_or_none()
 
-        if user:
-            user.email = user_info.email
-            user.name = user_info.name
-            user.picture = user_info.picture
-            await db.commit()
-            await db.refresh(user)
-            return user
+    @staticmethod
+    async def get_user_info_from_tokens(tokens: dict[str, Any]) -> GoogleUserInfo:
+        if tokens.get("id_token"):
+            return await AuthService.verify_id_token(tokens["id_token"], tokens.get("access_token"))
+        return await AuthService.get_google_user_info(tokens["access_token"])
+
+    @staticmethod
+    async def get_or_create_user(db: AsyncSession, user_info: GoogleUserInfo) -> User:
+        now = datetime.utcnow()
+        new_user_id = uuid7()
 
-        user = User(
+        insert_user = dialect_insert(db, User).values(
+            id=new_user_id,
             email=user_info.email,
             name=user_info.name,
             google_id=user_info.sub,
-            picture=user_info.picture
+            picture=user_info.picture,
+            created_at=now,
+            updated_at=now
         )
+        upsert_user = insert_user.on_conflict_do_update(
+            index_elements=[User.google_id],
+            set_={
+                "email": insert_user.excluded.email,
+                "name": insert_user.excluded.name,
+                "picture": insert_user.excluded.picture,
+                "updated_at": now
+            },
+            where=or_(
+                User.email.is_distinct_from(insert_user.excluded.email),
+                User.name.is_distinct_from(insert_user.excluded.name),
+                User.picture.is_distinct_from(insert_user.excluded.picture)
+            )
+        ).returning(*User.__table__.columns)
+
+        if db.get_bind().dialect.name == "postgresql":
+            written = upsert_user.cte("written")
+            result = await db.execute(
+                select(User).from_statement(
+                    union_all(
+                        select(written),
+                        select(User.__table__).where(
+                            User.google_id == user_info.sub,
+                            ~exists(select(written.c.id))
+                        )
+                    )
+                )
+            )
+        else:
+            result = await db.execute(select(User).from_statement(upsert_user))
 
-        db.add(user)
-        await db.commit()
-        await db.refresh(user)
-
-        await WalletService.create_wallet(db, user.id)
+        user = result.scalar_one_or_none()
+        if user is None:
+            result = await db.execute(select(User).where(User.google_id == user_info.sub))
+            user = result.scalar_one()
+
+        if user.id == new_user_id:
+            await WalletService.create_wallet(db, user.id)
+        elif user.updated_at == now:
+            track_write(db, user.id)
+            await db.commit()
 
         return user
 
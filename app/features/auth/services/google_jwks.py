@@ -0,0 +1,92 @@
+import asyncio
+import logging
+import re
+import time
+from typing import Any
+
+import httpx
+
+from app.platform.config.settings import settings
+from app.platform.metrics.instruments import track_outbound
+from app.platform.tracing.provider import OUTBOUND_EVENT_HOOKS
+
+logger = logging.getLogger(__name__)
+
+MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+class GoogleJWKSCache:
+
+    def __init__(
+        self,
+        url: str,
+        default_ttl_seconds: float = 3600,
+        min_ttl_seconds: float = 60,
+        refresh_ahead_seconds: float = 300,
+        transport: httpx.AsyncBaseTransport | None = None
+    ):
+        self.url = url
+        self.default_ttl_seconds = default_ttl_seconds
+        self.min_ttl_seconds = min_ttl_seconds
+        self.refresh_ahead_seconds = refresh_ahead_seconds
+        self.transport = transport
+        self.fetches = 0
+        self._keys: dict[str, dict[str, Any]] = {}
+        self._expires_at = 0.0
+        self._refresh_at = 0.0
+        self._fetched_at = -float("inf")
+        self._lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task | None = None
+
+    async def get_key(self, kid: str) -> dict[str, Any] | None:
+        now = time.monotonic()
+        if not self._keys or now >= self._expires_at:
+            await self.refresh()
+        elif now >= self._refresh_at:
+            self._schedule_refresh()
+
+        key = self._keys.get(kid)
+        if key is None:
+            await self.refresh(force=True)
+            key = self._keys.get(kid)
+        return key
+
+    async def refresh(self, force: bool = False) -> None:
+        fetches_before = self.fetches
+        async with self._lock:
+            if self.fetches != fetches_before:
+                return
+            now = time.monotonic()
+            if force and now - self._fetched_at < self.min_ttl_seconds:
+                return
+            if not force and self._keys and now < self._refresh_at:
+                return
+
+            async with httpx.AsyncClient(transport=self.transport, event_hooks=OUTBOUND_EVENT_HOOKS) as client:
+                response = await track_outbound("google", "jwks", client.get(self.url))
+                response.raise_for_status()
+
+            self._keys = {key["kid"]: key for key in response.json()["keys"]}
+            ttl = self._ttl(response.headers)
+            self._fetched_at = time.monotonic()
+            self._expires_at = self._fetched_at + ttl
+            self._refresh_at = self._expires_at - min(self.refresh_ahead_seconds, ttl / 2)
+            self.fetches += 1
+
+    def _ttl(self, headers: httpx.Headers) -> float:
+        match = MAX_AGE_PATTERN.search(headers.get("cache-control", ""))
+        if not match:
+            return self.default_ttl_seconds
+        age = int(headers.get("age", "0") or 0)
+        return max(self.min_ttl_seconds, int(match.group(1)) - age)
+
+    def _schedule_refresh(self) -> None:
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._background_refresh())
+
+    async def _background_refresh(self) -> None:
+        try:
+            await self.refresh()
+        except Exception:
+            logger.warning("Background refresh of Google JWKS failed", exc_info=True)
+
+google_jwks = GoogleJWKSCache(settings.GOOGLE_JWKS_URL)
@@ -1,3 +1,4 @@
-from app.features.payments.models.transaction import Transaction, TransactionStatus
+from app.features.payments.models.payout import Payout, PayoutStatus
+from app.features.payments.models.transaction import Transaction, TransactionReference, TransactionStatus
 
-__all__ = ["Transaction", "TransactionStatus"]
+__all__ = ["Transaction", "TransactionReference", "TransactionStatus", "Payout", "PayoutStatus"]
@@ -0,0 +1,52 @@
+import enum
+import uuid
+from datetime import datetime
+
+from sqlalchemy import UUID, BigInteger, DateTime, ForeignKey, Index, Integer, String, Text, text
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.platform.db.base import Base
+from app.platform.db.ids import uuid7
+
+
+class PayoutStatus(enum.Enum):
+    queued = "queued"
+    submitting = "submitting"
+    submitted = "submitted"
+    success = "success"
+    failed = "failed"
+
+class Payout(Base):
+    __tablename__ = "payouts"
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    reference: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    wallet_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("wallets.id"), nullable=False)
+    amount: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    bank_code: Mapped[str] = mapped_column(String(20), nullable=False)
+    account_number: Mapped[str] = mapped_column(String(20), nullable=False)
+    account_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    recipient_code: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    transfer_code: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    status: Mapped[PayoutStatus] = mapped_column(SQLEnum(PayoutStatus), default=PayoutStatus.queued, nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    failure_reason: Mapped[str | None] = mapped_column(Text, nullable=True)
+    submitted_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index("idx_payout_user_created", "user_id", "created_at"),
+        Index(
+            "idx_payout_unsent_created",
+            "created_at",
+            postgresql_where=text("status IN ('queued', 'submitting')"),
+            sqlite_where=text("status IN ('queued', 'submitting')")
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return f"<Payout(id={self.id}, reference={self.reference}, amount={self.amount}, status={self.status.value})>"
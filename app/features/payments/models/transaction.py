@@ -3,11 +3,13 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import UUID, BigInteger, DateTime, ForeignKey, Index, String, Text
+from sqlalchemy import DDL, UUID, BigInteger, DateTime, ForeignKey, Index, String, Text, event
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.platform.db.base import Base
+from app.platform.db.ids import uuid7
+from app.platform.db.partitions import MonthlyPartitions
 
 if TYPE_CHECKING:
     from app.features.auth.models.user import User
@@ -21,12 +23,13 @@ class TransactionStatus(enum.Enum):
 class TransactionType(enum.Enum):
     deposit = "deposit"
     transfer = "transfer"
+    withdrawal = "withdrawal"
 
 class Transaction(Base):
     __tablename__ = "transactions"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    reference: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    reference: Mapped[str] = mapped_column(String(255), nullable=False)
     user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     amount: Mapped[int] = mapped_column(BigInteger, nullable=False)
     email: Mapped[str | None] = mapped_column(String(255), nullable=True)
@@ -36,7 +39,7 @@ class Transaction(Base):
     sender_wallet_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("wallets.id"), nullable=True)
     recipient_wallet_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("wallets.id"), nullable=True)
     paid_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, primary_key=True, default=datetime.utcnow, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
     user: Mapped["User"] = relationship("User", back_populates="transactions")
@@ -44,11 +47,68 @@ class Transaction(Base):
     recipient_wallet: Mapped[Optional["Wallet"]] = relationship("Wallet", foreign_keys=[recipient_wallet_id], backref="received_transactions")
 
     __table_args__ = (
-        Index("idx_transaction_reference", "reference"),
-        Index("idx_transaction_status", "status"),
-        Index("idx_transaction_user_id", "user_id"),
-        Index("idx_transaction_type", "transaction_type"),
+        Index("idx_transaction_reference_created", "reference", "created_at", unique=True),
+        Index("idx_transaction_user_created", "user_id", "created_at"),
+        Index("idx_transaction_sender_created", "sender_wallet_id", "created_at"),
+        Index("idx_transaction_recipient_created", "recipient_wallet_id", "created_at"),
+        Index("idx_transaction_email_amount_created", "email", "amount", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
 
     def __repr__(self) -> str:
         return f"<Transaction(id={self.id}, reference={self.reference}, type={self.transaction_type.value}, status={self.status.value}, amount={self.amount})>"
+
+class TransactionReference(Base):
+    __tablename__ = "transaction_references"
+
+    reference: Mapped[str] = mapped_column(String(255), primary_key=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<TransactionReference(reference={self.reference}, created_at={self.created_at})>"
+
+transaction_partitions = MonthlyPartitions(Transaction.__tablename__)
+
+event.listen(Transaction.__table__, "after_create", DDL("""
+    CREATE OR REPLACE FUNCTION claim_transaction_reference() RETURNS trigger AS $$
+    BEGIN
+        INSERT INTO transaction_references (reference, created_at) VALUES (NEW.reference, NEW.created_at);
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+""").execute_if(dialect="postgresql"))
+event.listen(Transaction.__table__, "after_create", DDL("""
+    CREATE OR REPLACE FUNCTION reject_transaction_reference_change() RETURNS trigger AS $$
+    BEGIN
+        IF NEW.reference IS DISTINCT FROM OLD.reference THEN
+            RAISE EXCEPTION 'transaction references cannot be changed';
+        END IF;
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+""").execute_if(dialect="postgresql"))
+event.listen(Transaction.__table__, "after_create", DDL("""
+    CREATE TRIGGER transactions_claim_reference
+    BEFORE INSERT ON transactions
+    FOR EACH ROW EXECUTE FUNCTION claim_transaction_reference()
+""").execute_if(dialect="postgresql"))
+event.listen(Transaction.__table__, "after_create", DDL("""
+    CREATE TRIGGER transactions_keep_reference
+    BEFORE UPDATE OF reference ON transactions
+    FOR EACH ROW EXECUTE FUNCTION reject_transaction_reference_change()
+""").execute_if(dialect="postgresql"))
+event.listen(Transaction.__table__, "after_create", DDL("""
+    CREATE TRIGGER transactions_claim_reference
+    BEFORE INSERT ON transactions
+    BEGIN
+        INSERT INTO transaction_references (reference, created_at) VALUES (NEW.reference, NEW.created_at);
+    END
+""").execute_if(dialect="sqlite"))
+event.listen(Transaction.__table__, "after_create", DDL("""
+    CREATE TRIGGER transactions_keep_reference
+    BEFORE UPDATE OF reference ON transactions
+    WHEN NEW.reference IS NOT OLD.reference
+    BEGIN
+        SELECT RAISE(ABORT, 'transaction references cannot be changed');
+    END
+""").execute_if(dialect="sqlite"))
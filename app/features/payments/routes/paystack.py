@@ -1,21 +1,24 @@
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, Request
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.features.payments.models.transaction import Transaction, TransactionStatus
+from app.features.payments.models.transaction import TransactionStatus
 from app.features.payments.schemas.payment import PaymentInitiateRequest as InitializeTransactionRequest
 from app.features.payments.schemas.payment import PaymentInitiateResponse as InitializeTransactionResponse
+from app.features.payments.services.payout_service import FINAL_PAYOUT_STATUSES, PayoutService
 from app.features.payments.services.paystack_service import PaystackService
+from app.features.payments.utils.helpers import paystack_created_since, reference_created_since
+from app.features.wallet.services.transaction_service import WalletTransactionService
 from app.features.wallet.services.wallet_service import WalletService
 from app.platform.db import get_db
+from app.platform.metrics.instruments import webhook_events_total
 from app.platform.response.schemas import ErrorCode, error_response, success_response
 
 router = APIRouter()
 
 @router.post("/initialize")
-async def initialize_payment(request: InitializeTransactionRequest, db: AsyncSession = Depends(get_db)):
+async def initialize_payment(request: InitializeTransactionRequest):
     try:
         result = await PaystackService.initialize_transaction(
             amount=request.amount,
@@ -44,16 +47,16 @@ async def paystack_webhook(request: Request, db: AsyncSession = Depends(get_db))
         payload = await request.json()
         event = payload.get("event")
         data = payload.get("data", {})
+        webhook_events_total.labels(event or "unknown").inc()
 
         if event == "charge.success":
             reference = data.get("reference")
-
-            result = await db.execute(
-                select(Transaction)
-                .where(Transaction.reference == reference)
-                .with_for_update()
+            transaction = await WalletTransactionService.get_transaction_by_reference(
+                db,
+                reference,
+                since=reference_created_since(reference) or paystack_created_since(data),
+                for_update=True
             )
-            transaction = result.scalar_one_or_none()
 
             if not transaction:
                 return error_response(
@@ -90,6 +93,36 @@ async def paystack_webhook(request: Request, db: AsyncSession = Depends(get_db))
                 status_code=200
             )
 
+        if event in ("transfer.success", "transfer.failed"):
+            payout = await PayoutService.get_payout_by_reference(db, data.get("reference"), for_update=True)
+
+            if not payout:
+                return error_response(
+                    message="Payout not found",
+                    status_code=404,
+                    error_code=ErrorCode.TRANSACTION_NOT_FOUND
+                )
+
+            if payout.status in FINAL_PAYOUT_STATUSES:
+                return success_response(
+                    message="Payout already processed",
+                    data={"status": True},
+                    status_code=200
+                )
+
+            await PayoutService.complete_payout(
+                db,
+                payout,
+                succeeded=event == "transfer.success",
+                reason=None if event == "transfer.success" else data.get("gateway_response") or event
+            )
+
+            return success_response(
+                message="Webhook processed successfully",
+                data={"status": True},
+                status_code=200
+            )
+
         return success_response(
             message="Event received",
             data={"status": True},
@@ -0,0 +1,362 @@
+import asyncio
+import logging
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any
+
+import httpx
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.features.payments.models.payout import Payout, PayoutStatus
+from app.features.payments.models.transaction import Transaction, TransactionStatus, TransactionType
+from app.features.payments.services.paystack_service import PaystackService
+from app.features.payments.utils.helpers import generate_transaction_reference
+from app.features.wallet.models.hold import HoldStatus, WalletHold
+from app.features.wallet.services.hold_service import WalletHoldService
+from app.features.wallet.services.transaction_service import WalletTransactionService
+from app.platform.config.settings import settings
+from app.platform.metrics.instruments import payout_batch_size, payouts_total
+
+logger = logging.getLogger(__name__)
+
+FINAL_PAYOUT_STATUSES = (PayoutStatus.success, PayoutStatus.failed)
+FAILED_TRANSFER_STATUSES = ("failed", "reversed", "abandoned", "blocked", "rejected")
+
+class PayoutService:
+
+    @staticmethod
+    async def request_withdrawal(
+        db: AsyncSession,
+        user_id: uuid.UUID,
+        wallet_id: uuid.UUID,
+        amount: int,
+        bank_code: str,
+        account_number: str,
+        account_name: str
+    ) -> Payout:
+        if amount <= 0:
+            raise ValueError("Amount must be greater than 0")
+
+        reference = generate_transaction_reference()
+        payout = Payout(
+            reference=reference,
+            user_id=user_id,
+            wallet_id=wallet_id,
+            amount=amount,
+            bank_code=bank_code,
+            account_number=account_number,
+            account_name=account_name,
+            status=PayoutStatus.queued
+        )
+        db.add(Transaction(
+            reference=reference,
+            user_id=user_id,
+            amount=amount,
+            status=TransactionStatus.pending,
+            transaction_type=TransactionType.withdrawal,
+            sender_wallet_id=wallet_id
+        ))
+        db.add(payout)
+
+        try:
+            await WalletHoldService.place_hold(db, wallet_id, amount, reference, expires=False)
+        except ValueError:
+            await db.rollback()
+            raise
+
+        payouts_total.labels(PayoutStatus.queued.value).inc()
+        return payout
+
+    @staticmethod
+    async def get_payout_by_reference(
+        db: AsyncSession,
+        reference: str,
+        for_update: bool = False
+    ) -> Payout | None:
+        query = select(Payout).where(Payout.reference == reference)
+        if for_update:
+            query = query.with_for_update()
+        result = await db.execute(query)
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def dispatch_batch(
+        db: AsyncSession,
+        batch_size: int,
+        window_seconds: float,
+        now: datetime | None = None
+    ) -> int:
+        now = now or datetime.utcnow()
+        batch, unconfirmed = await PayoutService._claim(db, batch_size, window_seconds, now)
+        if not batch:
+            return 0
+
+        resent = [payout for payout in batch if payout.reference in unconfirmed]
+        outcomes = await PayoutService._lookup(resent)
+        for payout in resent:
+            if payout.reference not in outcomes and payout.attempts >= settings.PAYOUT_MAX_ATTEMPTS:
+                outcomes[payout.reference] = (
+                    PayoutStatus.failed, f"Paystack did not accept the transfer after {payout.attempts} attempts"
+                )
+        outcomes.update(await PayoutService._submit([payout for payout in batch if payout.reference not in outcomes]))
+        await PayoutService._record(db, batch, outcomes, now)
+        return sum(status is not PayoutStatus.queued for status, _ in outcomes.values())
+
+    @staticmethod
+    async def complete_payout(
+        db: AsyncSession,
+        payout: Payout,
+        succeeded: bool,
+        reason: str | None = None
+    ) -> Payout:
+        if payout.status in FINAL_PAYOUT_STATUSES:
+            raise ValueError("Payout already processed")
+
+        now = datetime.utcnow()
+        PayoutService._mark_completed(
+            payout, PayoutStatus.success if succeeded else PayoutStatus.failed, reason, now
+        )
+        await PayoutService._settle_funds(db, payout, now)
+        return payout
+
+    @staticmethod
+    async def run_dispatcher(
+        session_factory: async_sessionmaker,
+        batch_size: int,
+        window_seconds: float,
+        poll_interval_seconds: float
+    ) -> None:
+        while True:
+            dispatched = 0
+            try:
+                async with session_factory() as db:
+                    dispatched = await PayoutService.dispatch_batch(db, batch_size, window_seconds)
+            except (DBAPIError, OSError):
+                logger.exception("Could not dispatch queued payouts")
+            if dispatched < batch_size:
+                await asyncio.sleep(poll_interval_seconds)
+
+    @staticmethod
+    async def _claim(
+        db: AsyncSession,
+        batch_size: int,
+        window_seconds: float,
+        now: datetime
+    ) -> tuple[list[Payout], set[str]]:
+        stale_before = now - timedelta(seconds=settings.PAYOUT_SUBMIT_TIMEOUT_SECONDS)
+        result = await db.execute(
+            select(Payout)
+            .where(or_(
+                Payout.status == PayoutStatus.queued,
+                and_(Payout.status == PayoutStatus.submitting, Payout.updated_at < stale_before)
+            ))
+            .order_by(Payout.created_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        batch = list(result.scalars().all())
+
+        if not batch or (len(batch) < batch_size and batch[0].created_at > now - timedelta(seconds=window_seconds)):
+            await db.rollback()
+            return [], set()
+
+        unconfirmed = {
+            payout.reference
+            for payout in batch
+            if payout.status is PayoutStatus.submitting or payout.attempts
+        }
+        for payout in batch:
+            payout.status = PayoutStatus.submitting
+            payout.updated_at = now
+        await db.commit()
+        return batch, unconfirmed
+
+    @staticmethod
+    async def _lookup(payouts: list[Payout]) -> dict[str, tuple[PayoutStatus, str | None]]:
+        outcomes = {}
+        results = await asyncio.gather(
+            *(PaystackService.verify_transfer(payout.reference) for payout in payouts),
+            return_exceptions=True
+        )
+        for payout, transfer in zip(payouts, results, strict=True):
+            if isinstance(transfer, httpx.HTTPError):
+                logger.warning("Could not verify payout %s with Paystack: %s", payout.reference, transfer)
+                outcomes[payout.reference] = (PayoutStatus.queued, None)
+            elif isinstance(transfer, BaseException):
+                raise transfer
+            elif transfer is not None:
+                outcomes[payout.reference] = PayoutService._transfer_outcome(payout, transfer)
+        return outcomes
+
+    @staticmethod
+    async def _submit(batch: list[Payout]) -> dict[str, tuple[PayoutStatus, str | None]]:
+        outcomes = {}
+        if not batch:
+            return outcomes
+
+        accounts = {
+            (payout.bank_code, payout.account_number): payout
+            for payout in batch
+            if payout.recipient_code is None
+        }
+        if accounts:
+            try:
+                created = await PaystackService.create_transfer_recipients([
+                    {
+                        "bank_code": payout.bank_code,
+                        "account_number": payout.account_number,
+                        "account_name": payout.account_name
+                    }
+                    for payout in accounts.values()
+                ])
+            except httpx.HTTPError:
+                logger.exception("Could not create transfer recipients for %s payouts", len(accounts))
+                for payout in batch:
+                    if payout.recipient_code is None:
+                        payout.attempts += 1
+                        outcomes[payout.reference] = (PayoutStatus.queued, None)
+                created = {}
+            recipient_codes = {
+                (recipient["details"]["bank_code"], recipient["details"]["account_number"]): recipient["recipient_code"]
+                for recipient in created.get("success", [])
+            }
+            for payout in batch:
+                if payout.recipient_code is None:
+                    payout.recipient_code = recipient_codes.get((payout.bank_code, payout.account_number))
+                if payout.recipient_code is None and payout.reference not in outcomes:
+                    outcomes[payout.reference] = (PayoutStatus.failed, "Transfer recipient could not be created")
+
+        ready = [payout for payout in batch if payout.reference not in outcomes]
+        if not ready:
+            return outcomes
+
+        for payout in ready:
+            payout.attempts += 1
+        payout_batch_size.observe(len(ready))
+        try:
+            transfers = await PaystackService.initiate_bulk_transfer([
+                PayoutService._transfer_request(payout) for payout in ready
+            ])
+        except httpx.HTTPStatusError as e:
+            if not e.response.is_client_error:
+                logger.exception("Paystack bulk transfer failed for %s payouts", len(ready))
+                return outcomes | {payout.reference: (PayoutStatus.queued, None) for payout in ready}
+            logger.warning("Paystack rejected a bulk transfer of %s payouts: %s", len(ready), e.response.text)
+            return outcomes | await PayoutService._submit_each(ready)
+        except httpx.HTTPError:
+            logger.exception("Paystack bulk transfer failed for %s payouts", len(ready))
+            return outcomes | {payout.reference: (PayoutStatus.queued, None) for payout in ready}
+
+        accepted = {transfer["reference"]: transfer for transfer in transfers}
+        for payout in ready:
+            if payout.reference in accepted:
+                outcomes[payout.reference] = PayoutService._transfer_outcome(payout, accepted[payout.reference])
+        return outcomes | await PayoutService._submit_each(
+            [payout for payout in ready if payout.reference not in accepted]
+        )
+
+    @staticmethod
+    async def _submit_each(payouts: list[Payout]) -> dict[str, tuple[PayoutStatus, str | None]]:
+        outcomes = await PayoutService._lookup(payouts)
+        unknown = [payout for payout in payouts if payout.reference not in outcomes]
+        results = await asyncio.gather(
+            *(PaystackService.initiate_transfer(PayoutService._transfer_request(payout)) for payout in unknown),
+            return_exceptions=True
+        )
+        for payout, transfer in zip(unknown, results, strict=True):
+            if isinstance(transfer, httpx.HTTPStatusError) and transfer.response.is_client_error:
+                outcomes[payout.reference] = (
+                    PayoutStatus.failed, f"Paystack rejected the transfer: {transfer.response.text}"
+                )
+            elif isinstance(transfer, httpx.HTTPError):
+                logger.warning("Paystack transfer failed for payout %s: %s", payout.reference, transfer)
+                outcomes[payout.reference] = (PayoutStatus.queued, None)
+            elif isinstance(transfer, BaseException):
+                raise transfer
+            else:
+                outcomes[payout.reference] = PayoutService._transfer_outcome(payout, transfer)
+        return outcomes
+
+    @staticmethod
+    def _transfer_request(payout: Payout) -> dict[str, Any]:
+        return {
+            "amount": payout.amount,
+            "recipient": payout.recipient_code,
+            "reference": payout.reference,
+            "reason": "Wallet withdrawal"
+        }
+
+    @staticmethod
+    def _transfer_outcome(payout: Payout, transfer: dict[str, Any]) -> tuple[PayoutStatus, str | None]:
+        payout.transfer_code = transfer.get("transfer_code") or payout.transfer_code
+        status = transfer.get("status")
+        if status == "success":
+            return PayoutStatus.success, None
+        if status in FAILED_TRANSFER_STATUSES:
+            return PayoutStatus.failed, transfer.get("gateway_response") or f"Paystack reported the transfer as {status}"
+        return PayoutStatus.submitted, None
+
+    @staticmethod
+    async def _record(
+        db: AsyncSession,
+        batch: list[Payout],
+        outcomes: dict[str, tuple[PayoutStatus, str | None]],
+        now: datetime
+    ) -> None:
+        groups = defaultdict(list)
+        for payout in batch:
+            groups[outcomes[payout.reference]].append(payout.id)
+
+        completed = []
+        for (status, reason), ids in groups.items():
+            values = {"status": status}
+            if status is PayoutStatus.submitted:
+                values["submitted_at"] = now
+            elif status in FINAL_PAYOUT_STATUSES:
+                values.update(failure_reason=reason, completed_at=now)
+            result = await db.execute(
+                update(Payout)
+                .where(Payout.id.in_(ids), Payout.status == PayoutStatus.submitting)
+                .values(**values)
+                .returning(Payout)
+                .execution_options(synchronize_session="fetch")
+            )
+            updated = result.scalars().all()
+            if status is PayoutStatus.submitted:
+                payouts_total.labels(status.value).inc(len(updated))
+            elif status in FINAL_PAYOUT_STATUSES:
+                completed.extend(updated)
+        await db.commit()
+
+        for payout in completed:
+            await PayoutService._settle_funds(db, payout, now)
+
+    @staticmethod
+    def _mark_completed(payout: Payout, status: PayoutStatus, reason: str | None, now: datetime) -> None:
+        payout.status = status
+        payout.failure_reason = reason
+        payout.completed_at = now
+
+    @staticmethod
+    async def _settle_funds(db: AsyncSession, payout: Payout, now: datetime) -> None:
+        succeeded = payout.status is PayoutStatus.success
+        transaction = await WalletTransactionService.get_transaction_by_reference(db, payout.reference)
+        if transaction:
+            transaction.status = TransactionStatus.success if succeeded else TransactionStatus.failed
+            if succeeded:
+                transaction.paid_at = now
+
+        result = await db.execute(select(WalletHold).where(WalletHold.reference == payout.reference))
+        hold = result.scalar_one_or_none()
+        if hold and hold.status is HoldStatus.active:
+            if succeeded:
+                await WalletHoldService.capture_hold(db, hold.id)
+            else:
+                await WalletHoldService.release_hold(db, hold.id)
+        else:
+            logger.error("Payout %s was settled without an active hold", payout.reference)
+            await db.commit()
+        payouts_total.labels(payout.status.value).inc()
@@ -1,16 +1,18 @@
 import hashlib
 import hmac
-import uuid
 from typing import Any
 
 import httpx
 
+from app.features.payments.utils.helpers import generate_transaction_reference
 from app.platform.config.settings import get_settings
+from app.platform.metrics.instruments import track_outbound
+from app.platform.tracing.provider import OUTBOUND_EVENT_HOOKS
 
 settings = get_settings()
 
 class PaystackService:
-    BASE_URL = "https://api.paystack.co"
+    BASE_URL = settings.PAYSTACK_BASE_URL
 
     @staticmethod
     def _get_headers() -> dict[str, str]:
@@ -21,10 +23,10 @@ class PaystackService:
 
     @staticmethod
     async def initialize_transaction(amount: int, email: str) -> dict[str, Any]:
-        reference = f"TXN_{uuid.uuid4().hex}"
+        reference = generate_transaction_reference()
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
+        async with httpx.AsyncClient(event_hooks=OUTBOUND_EVENT_HOOKS) as client:
+            response = await track_outbound("paystack", "initialize_transaction", client.post(
                 f"{PaystackService.BASE_URL}/transaction/initialize",
                 headers=PaystackService._get_headers(),
                 json={
@@ -32,7 +34,7 @@ class PaystackService:
                     "amount": amount,
                     "reference": reference
                 }
-            )
+            ))
             response.raise_for_status()
             data = response.json()
 
@@ -43,11 +45,75 @@ class PaystackService:
 
     @staticmethod
     async def verify_transaction(reference: str) -> dict[str, Any]:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
+        async with httpx.AsyncClient(event_hooks=OUTBOUND_EVENT_HOOKS) as client:
+            response = await track_outbound("paystack", "verify_transaction", client.get(
                 f"{PaystackService.BASE_URL}/transaction/verify/{reference}",
                 headers=PaystackService._get_headers()
-            )
+            ))
+            response.raise_for_status()
+            return response.json()["data"]
+
+    @staticmethod
+    async def create_transfer_recipients(recipients: list[dict[str, str]]) -> dict[str, Any]:
+        async with httpx.AsyncClient(event_hooks=OUTBOUND_EVENT_HOOKS) as client:
+            response = await track_outbound("paystack", "create_transfer_recipients", client.post(
+                f"{PaystackService.BASE_URL}/transferrecipient/bulk",
+                headers=PaystackService._get_headers(),
+                json={
+                    "batch": [
+                        {
+                            "type": "nuban",
+                            "name": recipient["account_name"],
+                            "account_number": recipient["account_number"],
+                            "bank_code": recipient["bank_code"],
+                            "currency": settings.PAYOUT_CURRENCY
+                        }
+                        for recipient in recipients
+                    ]
+                }
+            ))
+            response.raise_for_status()
+            return response.json()["data"]
+
+    @staticmethod
+    async def initiate_bulk_transfer(transfers: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        async with httpx.AsyncClient(event_hooks=OUTBOUND_EVENT_HOOKS) as client:
+            response = await track_outbound("paystack", "initiate_bulk_transfer", client.post(
+                f"{PaystackService.BASE_URL}/transfer/bulk",
+                headers=PaystackService._get_headers(),
+                json={
+                    "currency": settings.PAYOUT_CURRENCY,
+                    "source": "balance",
+                    "transfers": transfers
+                }
+            ))
+            response.raise_for_status()
+            return response.json()["data"]
+
+    @staticmethod
+    async def initiate_transfer(transfer: dict[str, Any]) -> dict[str, Any]:
+        async with httpx.AsyncClient(event_hooks=OUTBOUND_EVENT_HOOKS) as client:
+            response = await track_outbound("paystack", "initiate_transfer", client.post(
+                f"{PaystackService.BASE_URL}/transfer",
+                headers=PaystackService._get_headers(),
+                json={
+                    "currency": settings.PAYOUT_CURRENCY,
+                    "source": "balance",
+                    **transfer
+                }
+            ))
+            response.raise_for_status()
+            return response.json()["data"]
+
+    @staticmethod
+    async def verify_transfer(reference: str) -> dict[str, Any] | None:
+        async with httpx.AsyncClient(event_hooks=OUTBOUND_EVENT_HOOKS) as client:
+            response = await track_outbound("paystack", "verify_transfer", client.get(
+                f"{PaystackService.BASE_URL}/transfer/verify/{reference}",
+                headers=PaystackService._get_headers()
+            ))
+            if response.status_code == 404:
+                return None
             response.raise_for_status()
             return response.json()["data"]
 
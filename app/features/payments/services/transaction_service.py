@@ -1,9 +1,10 @@
 from datetime import datetime, timedelta
 
-from sqlalchemy import and_, select
+from sqlalchemy import Select, and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.features.payments.models.transaction import Transaction, TransactionStatus
+from app.features.payments.utils.helpers import reference_created_since
 
 
 class TransactionService:
@@ -30,10 +31,19 @@ class TransactionService:
         return transaction
 
     @staticmethod
-    async def get_transaction_by_reference(db: AsyncSession, reference: str) -> Transaction | None:
-        result = await db.execute(
-            select(Transaction).where(Transaction.reference == reference)
-        )
+    async def get_transaction_by_reference(
+        db: AsyncSession,
+        reference: str,
+        since: datetime | None = None
+    ) -> Transaction | None:
+        query = select(Transaction).where(Transaction.reference == reference)
+        since = since or reference_created_since(reference)
+        if since is not None:
+            result = await db.execute(query.where(Transaction.created_at >= since))
+            transaction = result.scalar_one_or_none()
+            if transaction is not None:
+                return transaction
+        result = await db.execute(query)
         return result.scalar_one_or_none()
 
     @staticmethod
@@ -45,7 +55,12 @@ class TransactionService:
     ) -> Transaction | None:
         cutoff_time = datetime.utcnow() - timedelta(minutes=minutes)
 
-        result = await db.execute(
+        result = await db.execute(TransactionService.recent_transaction_query(email, amount, cutoff_time))
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    def recent_transaction_query(email: str, amount: int, cutoff_time: datetime) -> Select:
+        return (
             select(Transaction)
             .where(
                 and_(
@@ -58,7 +73,6 @@ class TransactionService:
             .order_by(Transaction.created_at.desc())
             .limit(1)
         )
-        return result.scalar_one_or_none()
 
     @staticmethod
     async def update_transaction_status(
@@ -1,11 +1,42 @@
 import uuid
+from datetime import UTC, datetime, timedelta
+
+from app.platform.db.ids import uuid7, uuid7_datetime
+
+REFERENCE_PREFIX = "TXN_"
+REFERENCE_CLOCK_SKEW = timedelta(minutes=5)
+PAYSTACK_CLOCK_SKEW = timedelta(days=1)
 
 
 def generate_transaction_reference() -> str:
-    return f"TXN_{uuid.uuid4().hex}"
+    return f"{REFERENCE_PREFIX}{uuid7().hex}"
+
+def reference_created_since(reference: str | None) -> datetime | None:
+    if not isinstance(reference, str) or not reference.startswith(REFERENCE_PREFIX):
+        return None
+    try:
+        issued_at = uuid7_datetime(uuid.UUID(reference.removeprefix(REFERENCE_PREFIX)))
+    except ValueError:
+        return None
+    return issued_at - REFERENCE_CLOCK_SKEW if issued_at else None
 
 def kobo_to_naira(amount: int) -> float:
     return amount / 100
 
 def naira_to_kobo(amount: float) -> int:
     return int(amount * 100)
+
+def to_naive_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(UTC).replace(tzinfo=None)
+
+def paystack_created_since(data: dict) -> datetime | None:
+    created_at = data.get("created_at") or data.get("createdAt")
+    if not isinstance(created_at, str):
+        return None
+    try:
+        created = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return to_naive_utc(created) - PAYSTACK_CLOCK_SKEW
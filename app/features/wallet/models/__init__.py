@@ -1,3 +1,5 @@
+from app.features.wallet.models.hold import HoldStatus, WalletHold
+from app.features.wallet.models.scheduled_transfer import ScheduledTransfer, ScheduleInterval, ScheduleStatus
 from app.features.wallet.models.wallet import Wallet
 
-__all__ = ["Wallet"]
+__all__ = ["Wallet", "WalletHold", "HoldStatus", "ScheduledTransfer", "ScheduleInterval", "ScheduleStatus"]
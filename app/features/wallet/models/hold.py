@@ -0,0 +1,42 @@
+import enum
+import uuid
+from datetime import datetime
+
+from sqlalchemy import UUID, BigInteger, DateTime, ForeignKey, Index, String, text
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.platform.db.base import Base
+from app.platform.db.ids import uuid7
+
+
+class HoldStatus(enum.Enum):
+    active = "active"
+    captured = "captured"
+    released = "released"
+    expired = "expired"
+
+class WalletHold(Base):
+    __tablename__ = "wallet_holds"
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    wallet_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("wallets.id"), nullable=False)
+    amount: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    reference: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
+    status: Mapped[HoldStatus] = mapped_column(SQLEnum(HoldStatus), default=HoldStatus.active, nullable=False)
+    expires_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index("idx_wallet_hold_wallet_status", "wallet_id", "status"),
+        Index(
+            "idx_wallet_hold_active_expires",
+            "expires_at",
+            postgresql_where=text("status = 'active'"),
+            sqlite_where=text("status = 'active'")
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return f"<WalletHold(id={self.id}, wallet_id={self.wallet_id}, amount={self.amount}, status={self.status.value})>"
@@ -0,0 +1,67 @@
+import calendar
+import enum
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import UUID, BigInteger, DateTime, ForeignKey, Index, Integer, SmallInteger, Text, text
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.platform.db.base import Base
+from app.platform.db.ids import uuid7
+
+
+class ScheduleInterval(enum.Enum):
+    once = "once"
+    daily = "daily"
+    weekly = "weekly"
+    monthly = "monthly"
+
+    def advance(self, value: datetime, anchor_day: int | None = None) -> datetime | None:
+        if self is ScheduleInterval.once:
+            return None
+        if self is ScheduleInterval.daily:
+            return value + timedelta(days=1)
+        if self is ScheduleInterval.weekly:
+            return value + timedelta(weeks=1)
+        year, month = divmod(value.year * 12 + value.month, 12)
+        month += 1
+        return value.replace(year=year, month=month, day=min(anchor_day or value.day, calendar.monthrange(year, month)[1]))
+
+class ScheduleStatus(enum.Enum):
+    active = "active"
+    completed = "completed"
+    cancelled = "cancelled"
+    failed = "failed"
+
+class ScheduledTransfer(Base):
+    __tablename__ = "scheduled_transfers"
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    sender_wallet_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("wallets.id"), nullable=False)
+    recipient_wallet_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("wallets.id"), nullable=False)
+    amount: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    interval: Mapped[ScheduleInterval] = mapped_column(SQLEnum(ScheduleInterval), nullable=False)
+    status: Mapped[ScheduleStatus] = mapped_column(SQLEnum(ScheduleStatus), default=ScheduleStatus.active, nullable=False)
+    next_run_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    anchor_day: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    remaining_runs: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    last_run_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    failure_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index("idx_scheduled_transfer_user_created", "user_id", "created_at"),
+        Index(
+            "idx_scheduled_transfer_active_due",
+            "next_run_at",
+            postgresql_where=text("status = 'active'"),
+            sqlite_where=text("status = 'active'")
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return f"<ScheduledTransfer(id={self.id}, amount={self.amount}, interval={self.interval.value}, status={self.status.value})>"
@@ -3,10 +3,13 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import UUID, BigInteger, DateTime, ForeignKey, Index, String
+from sqlalchemy import UUID, BigInteger, CheckConstraint, DateTime, ForeignKey, String
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.features.wallet.utils.wallet_number import WALLET_NUMBER_LENGTH, luhn_check_digit
 from app.platform.db.base import Base
+from app.platform.db.ids import uuid7
 
 if TYPE_CHECKING:
     from app.features.auth.models.user import User
@@ -14,23 +17,28 @@ if TYPE_CHECKING:
 class Wallet(Base):
     __tablename__ = "wallets"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), unique=True, nullable=False)
     wallet_number: Mapped[str] = mapped_column(String(13), unique=True, index=True, nullable=False)
     balance: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    held_balance: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0", nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
     user: Mapped["User"] = relationship("User", back_populates="wallet")
 
     __table_args__ = (
-        Index("idx_wallet_number", "wallet_number"),
-        Index("idx_wallet_user_id", "user_id"),
+        CheckConstraint("held_balance >= 0 AND held_balance <= balance", name="ck_wallet_held_balance"),
     )
 
+    @hybrid_property
+    def available_balance(self) -> int:
+        return self.balance - self.held_balance
+
     @staticmethod
     def generate_wallet_number() -> str:
-        return ''.join([str(secrets.randbelow(10)) for _ in range(13)])
+        body = f"{secrets.randbelow(10 ** (WALLET_NUMBER_LENGTH - 1)):0{WALLET_NUMBER_LENGTH - 1}d}"
+        return body + luhn_check_digit(body)
 
     def __repr__(self) -> str:
-        return f"<Wallet(id={self.id}, wallet_number={self.wallet_number}, balance={self.balance})>"
+        return f"<Wallet(id={self.id}, wallet_number={self.wallet_number}, balance={self.balance}, held_balance={self.held_balance})>"
@@ -1,24 +1,49 @@
 import uuid
+from datetime import datetime
+from typing import Literal
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.features.auth.models.user import User
+from app.features.payments.services.payout_service import PayoutService
 from app.features.payments.services.paystack_service import PaystackService
+from app.features.payments.utils.helpers import generate_transaction_reference, to_naive_utc
+from app.features.wallet.models.scheduled_transfer import ScheduledTransfer
 from app.features.wallet.schemas.wallet import (
     BalanceResponse,
     DepositRequest,
     DepositResponse,
+    ScheduledTransferRequest,
+    ScheduledTransferResponse,
     TransferRequest,
+    WithdrawalRequest,
+    WithdrawalResponse,
 )
+from app.features.wallet.services.scheduled_transfer_service import ScheduledTransferService
 from app.features.wallet.services.transaction_service import WalletTransactionService
 from app.features.wallet.services.wallet_service import WalletService
+from app.features.wallet.utils.statement import STATEMENT_MEDIA_TYPES, encode_statement, transaction_direction
 from app.platform.auth.dependencies import require_permission
-from app.platform.db import get_db
+from app.platform.db import ReadSessionLocal, get_db, get_read_db
 from app.platform.response.schemas import ErrorCode, error_response, success_response
 
 router = APIRouter()
 
+def schedule_response(schedule: ScheduledTransfer, recipient_wallet: str) -> dict:
+    return ScheduledTransferResponse(
+        id=str(schedule.id),
+        recipient_wallet=recipient_wallet,
+        amount=schedule.amount,
+        interval=schedule.interval.value,
+        status=schedule.status.value,
+        next_run_at=schedule.next_run_at,
+        remaining_runs=schedule.remaining_runs,
+        last_run_at=schedule.last_run_at,
+        last_error=schedule.last_error
+    ).model_dump()
+
 @router.post("/deposit")
 async def deposit_to_wallet(
     request: DepositRequest,
@@ -113,22 +138,26 @@ async def get_deposit_status(
 
 @router.get("/balance")
 async def get_wallet_balance(
-    user_and_auth: tuple[User, str] = Depends(require_permission("read")),
-    db: AsyncSession = Depends(get_db)
+    user_and_auth: tuple[User, str] = Depends(require_permission("read", read_only=True)),
+    db: AsyncSession = Depends(get_read_db)
 ):
     user, auth_type = user_and_auth
 
     try:
-        wallet = await WalletService.get_wallet_by_user_id(db, user.id)
+        wallet_balance = await WalletService.get_balance(db, user.id)
 
-        if not wallet:
+        if not wallet_balance:
             return error_response(
                 message="Wallet not found",
                 status_code=404,
                 error_code=ErrorCode.WALLET_NOT_FOUND
             )
 
-        response = BalanceResponse(balance=wallet.balance)
+        response = BalanceResponse(
+            balance=wallet_balance.balance,
+            held_balance=wallet_balance.held_balance,
+            available_balance=wallet_balance.available_balance
+        )
 
         return success_response(
             message="Balance retrieved successfully",
@@ -176,7 +205,7 @@ async def transfer_funds(
                 error_code=ErrorCode.INVALID_WALLET_NUMBER
             )
 
-        if sender_wallet.balance < request.amount:
+        if sender_wallet.available_balance < request.amount:
             return error_response(
                 message="Insufficient balance",
                 status_code=400,
@@ -190,7 +219,7 @@ async def transfer_funds(
             amount=request.amount
         )
 
-        reference = f"TXN_{uuid.uuid4()}"
+        reference = generate_transaction_reference()
         transaction = await WalletTransactionService.create_transfer_transaction(
             db=db,
             user_id=user.id,
@@ -236,22 +265,209 @@ async def transfer_funds(
             status_code=500
         )
 
+@router.post("/withdraw")
+async def withdraw_funds(
+    request: WithdrawalRequest,
+    user_and_auth: tuple[User, str] = Depends(require_permission("transfer")),
+    db: AsyncSession = Depends(get_db)
+):
+    user, auth_type = user_and_auth
+
+    try:
+        wallet = await WalletService.get_wallet_by_user_id(db, user.id)
+
+        if not wallet:
+            return error_response(
+                message="Wallet not found",
+                status_code=404,
+                error_code=ErrorCode.WALLET_NOT_FOUND
+            )
+
+        payout = await PayoutService.request_withdrawal(
+            db=db,
+            user_id=user.id,
+            wallet_id=wallet.id,
+            amount=request.amount,
+            bank_code=request.bank_code,
+            account_number=request.account_number,
+            account_name=request.account_name
+        )
+
+        response = WithdrawalResponse(
+            reference=payout.reference,
+            amount=payout.amount,
+            status=payout.status.value
+        )
+
+        return success_response(
+            message="Withdrawal queued successfully",
+            data=response.model_dump(),
+            status_code=202
+        )
+
+    except ValueError as e:
+        error_msg = str(e)
+        if "Insufficient balance" in error_msg:
+            error_code = ErrorCode.INSUFFICIENT_BALANCE
+        elif "Amount" in error_msg:
+            error_code = ErrorCode.INVALID_AMOUNT
+        else:
+            error_code = None
+
+        return error_response(
+            message=error_msg,
+            status_code=400,
+            error_code=error_code
+        )
+    except Exception as e:
+        return error_response(
+            message=f"Withdrawal failed: {str(e)}",
+            status_code=500
+        )
+
+@router.post("/schedules")
+async def create_scheduled_transfer(
+    request: ScheduledTransferRequest,
+    user_and_auth: tuple[User, str] = Depends(require_permission("transfer")),
+    db: AsyncSession = Depends(get_db)
+):
+    user, auth_type = user_and_auth
+
+    try:
+        sender_wallet = await WalletService.get_wallet_by_user_id(db, user.id)
+
+        if not sender_wallet:
+            return error_response(
+                message="Sender wallet not found",
+                status_code=404,
+                error_code=ErrorCode.WALLET_NOT_FOUND
+            )
+
+        recipient_wallet = await WalletService.get_wallet_by_number(db, request.wallet_number)
+
+        if not recipient_wallet:
+            return error_response(
+                message="Recipient wallet not found",
+                status_code=404,
+                error_code=ErrorCode.WALLET_NOT_FOUND
+            )
+
+        schedule = await ScheduledTransferService.create_schedule(
+            db=db,
+            user_id=user.id,
+            sender_wallet_id=sender_wallet.id,
+            recipient_wallet_id=recipient_wallet.id,
+            amount=request.amount,
+            interval=request.interval,
+            start_at=to_naive_utc(request.start_at) if request.start_at else None,
+            occurrences=request.occurrences
+        )
+
+        return success_response(
+            message="Scheduled transfer created successfully",
+            data=schedule_response(schedule, recipient_wallet.wallet_number),
+            status_code=201
+        )
+
+    except ValueError as e:
+        error_msg = str(e)
+        if "same wallet" in error_msg:
+            error_code = ErrorCode.INVALID_WALLET_NUMBER
+        elif "Amount" in error_msg:
+            error_code = ErrorCode.INVALID_AMOUNT
+        else:
+            error_code = None
+
+        return error_response(
+            message=error_msg,
+            status_code=400,
+            error_code=error_code
+        )
+    except Exception as e:
+        return error_response(
+            message=f"Failed to create scheduled transfer: {str(e)}",
+            status_code=500
+        )
+
+@router.get("/schedules")
+async def list_scheduled_transfers(
+    user_and_auth: tuple[User, str] = Depends(require_permission("read", read_only=True)),
+    db: AsyncSession = Depends(get_read_db)
+):
+    user, auth_type = user_and_auth
+
+    try:
+        schedules = await ScheduledTransferService.get_user_schedules(db, user.id)
+
+        return success_response(
+            message="Scheduled transfers retrieved successfully",
+            data=[schedule_response(schedule, wallet_number) for schedule, wallet_number in schedules],
+            status_code=200
+        )
+
+    except Exception as e:
+        return error_response(
+            message=f"Failed to retrieve scheduled transfers: {str(e)}",
+            status_code=500
+        )
+
+@router.delete("/schedules/{schedule_id}")
+async def cancel_scheduled_transfer(
+    schedule_id: uuid.UUID,
+    user_and_auth: tuple[User, str] = Depends(require_permission("transfer")),
+    db: AsyncSession = Depends(get_db)
+):
+    user, auth_type = user_and_auth
+
+    try:
+        schedule = await ScheduledTransferService.cancel_schedule(db, user.id, schedule_id)
+
+        return success_response(
+            message="Scheduled transfer cancelled successfully",
+            data={"id": str(schedule.id), "status": schedule.status.value},
+            status_code=200
+        )
+
+    except ValueError as e:
+        return error_response(
+            message=str(e),
+            status_code=404
+        )
+    except Exception as e:
+        return error_response(
+            message=f"Failed to cancel scheduled transfer: {str(e)}",
+            status_code=500
+        )
+
 @router.get("/transactions")
 async def get_transaction_history(
-    user_and_auth: tuple[User, str] = Depends(require_permission("read")),
-    db: AsyncSession = Depends(get_db)
+    since: datetime | None = None,
+    user_and_auth: tuple[User, str] = Depends(require_permission("read", read_only=True)),
+    db: AsyncSession = Depends(get_read_db)
 ):
     user, auth_type = user_and_auth
 
     try:
-        transactions = await WalletTransactionService.get_user_transactions(db, user.id)
+        wallet = await WalletService.get_wallet_by_user_id(db, user.id)
+
+        if not wallet:
+            return error_response(
+                message="Wallet not found",
+                status_code=404,
+                error_code=ErrorCode.WALLET_NOT_FOUND
+            )
+
+        transactions = await WalletTransactionService.get_wallet_transactions(
+            db, user.id, wallet.id, since=to_naive_utc(since) if since else None
+        )
 
         history = [
             {
-                "type": txn.transaction_type.value,
+                "type": txn.transaction_type,
+                "direction": transaction_direction(txn, wallet.id),
                 "amount": txn.amount,
-                "status": txn.status.value,
-                "created_at": txn.created_at.isoformat(),
+                "status": txn.status,
+                "created_at": txn.created_at,
                 "reference": txn.reference
             }
             for txn in transactions
@@ -268,3 +484,29 @@ async def get_transaction_history(
             message=f"Failed to retrieve transaction history: {str(e)}",
             status_code=500
         )
+
+@router.get("/transactions/export")
+async def export_transaction_history(
+    export_format: Literal["csv", "ndjson"] = Query("csv", alias="format"),
+    since: datetime | None = None,
+    user_and_auth: tuple[User, str] = Depends(require_permission("read", read_only=True))
+):
+    user, auth_type = user_and_auth
+
+    async def statement_chunks():
+        async with ReadSessionLocal(isolation_level=None) as session:
+            session.info["user_id"] = user.id
+            wallet = await WalletService.get_wallet_by_user_id(session, user.id)
+            if not wallet:
+                return
+            batches = WalletTransactionService.stream_wallet_transactions(
+                session, user.id, wallet.id, since=to_naive_utc(since) if since else None
+            )
+            async for chunk in encode_statement(batches, export_format, wallet.id):
+                yield chunk
+
+    return StreamingResponse(
+        statement_chunks(),
+        media_type=STATEMENT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="statement.{export_format}"'}
+    )
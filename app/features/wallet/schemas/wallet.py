@@ -2,6 +2,9 @@ from datetime import datetime
 
 from pydantic import BaseModel, field_validator
 
+from app.features.wallet.models.scheduled_transfer import ScheduleInterval
+from app.features.wallet.utils.wallet_number import validate_wallet_number
+
 
 class DepositRequest(BaseModel):
     amount: int
@@ -24,10 +27,67 @@ class TransferRequest(BaseModel):
     @field_validator('wallet_number')
     @classmethod
     def validate_wallet_number(cls, v: str) -> str:
-        if len(v) != 13 or not v.isdigit():
-            raise ValueError('Wallet number must be exactly 13 digits')
+        return validate_wallet_number(v)
+
+    @field_validator('amount')
+    @classmethod
+    def validate_amount(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError('Amount must be greater than 0')
+        return v
+
+class WithdrawalRequest(BaseModel):
+    amount: int
+    bank_code: str
+    account_number: str
+    account_name: str
+
+    @field_validator('amount')
+    @classmethod
+    def validate_amount(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError('Amount must be greater than 0')
+        return v
+
+    @field_validator('bank_code')
+    @classmethod
+    def validate_bank_code(cls, v: str) -> str:
+        if not v.isdigit() or len(v) > 20:
+            raise ValueError('Bank code must be numeric')
+        return v
+
+    @field_validator('account_number')
+    @classmethod
+    def validate_account_number(cls, v: str) -> str:
+        if not v.isdigit() or len(v) != 10:
+            raise ValueError('Account number must be 10 digits')
+        return v
+
+    @field_validator('account_name')
+    @classmethod
+    def validate_account_name(cls, v: str) -> str:
+        v = v.strip()
+        if not v or len(v) > 255:
+            raise ValueError('Account name is required')
         return v
 
+class WithdrawalResponse(BaseModel):
+    reference: str
+    amount: int
+    status: str
+
+class ScheduledTransferRequest(BaseModel):
+    wallet_number: str
+    amount: int
+    interval: ScheduleInterval
+    start_at: datetime | None = None
+    occurrences: int | None = None
+
+    @field_validator('wallet_number')
+    @classmethod
+    def validate_wallet_number(cls, v: str) -> str:
+        return validate_wallet_number(v)
+
     @field_validator('amount')
     @classmethod
     def validate_amount(cls, v: int) -> int:
@@ -35,12 +95,32 @@ class TransferRequest(BaseModel):
             raise ValueError('Amount must be greater than 0')
         return v
 
+    @field_validator('occurrences')
+    @classmethod
+    def validate_occurrences(cls, v: int | None) -> int | None:
+        if v is not None and v <= 0:
+            raise ValueError('Occurrences must be greater than 0')
+        return v
+
+class ScheduledTransferResponse(BaseModel):
+    id: str
+    recipient_wallet: str
+    amount: int
+    interval: str
+    status: str
+    next_run_at: datetime
+    remaining_runs: int | None
+    last_run_at: datetime | None
+    last_error: str | None
+
 class TransferResponse(BaseModel):
     status: str
     message: str
 
 class BalanceResponse(BaseModel):
     balance: int
+    held_balance: int
+    available_balance: int
 
 class TransactionHistoryItem(BaseModel):
     type: str
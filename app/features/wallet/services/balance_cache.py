@@ -0,0 +1,147 @@
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any, NamedTuple
+
+from app.platform.config.settings import get_settings
+from app.platform.db.notify import NotificationChannel
+
+settings = get_settings()
+
+class CachedBalance(NamedTuple):
+    wallet_id: uuid.UUID
+    balance: int
+    held_balance: int = 0
+
+    @property
+    def available_balance(self) -> int:
+        return self.balance - self.held_balance
+
+class BalanceCache:
+
+    def __init__(self, max_entries: int, ttl_seconds: float, enabled: bool = True):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries: OrderedDict[str, tuple[float, CachedBalance]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._stale_inflight: set[str] = set()
+        self._channel: NotificationChannel | None = None
+
+    def attach_channel(self, channel: NotificationChannel) -> None:
+        self._channel = channel
+        channel.subscribe(self._on_remote_invalidation)
+
+    def get(self, user_id: uuid.UUID | str) -> CachedBalance | None:
+        key = str(user_id)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def invalidate(self, user_id: uuid.UUID | str) -> None:
+        if not self.enabled:
+            return
+        key = str(user_id)
+        self._evict(key)
+        if self._channel is not None:
+            self._channel.publish(key)
+
+    async def get_or_load(
+        self,
+        user_id: uuid.UUID | str,
+        loader: Callable[[], Awaitable[CachedBalance | None]]
+    ) -> CachedBalance | None:
+        if not self.enabled:
+            return await loader()
+
+        key = str(user_id)
+        cached = self.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+            return await self.get_or_load(key, loader)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+            stale = key in self._stale_inflight
+            self._stale_inflight.discard(key)
+
+        if value is not None and not stale:
+            self._store(key, value)
+        future.set_result(value)
+        return value
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hit_ratio": round((self.hits + self.coalesced) / lookups, 4) if lookups else 0.0
+        }
+
+    def _store(self, key: str, value: CachedBalance) -> None:
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _evict(self, key: str) -> None:
+        if self._entries.pop(key, None) is not None:
+            self.invalidations += 1
+        self._mark_inflight_stale(key)
+
+    def _mark_inflight_stale(self, key: str) -> None:
+        if key in self._inflight:
+            self._stale_inflight.add(key)
+
+    def _on_remote_invalidation(self, user_ids: list[str]) -> None:
+        for user_id in user_ids:
+            self._evict(user_id)
+
+balance_cache = BalanceCache(
+    max_entries=settings.BALANCE_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.BALANCE_CACHE_TTL_SECONDS,
+    enabled=settings.BALANCE_CACHE_ENABLED
+)
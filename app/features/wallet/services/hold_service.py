@@ -0,0 +1,150 @@
+import asyncio
+import logging
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, update
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.features.wallet.models.hold import HoldStatus, WalletHold
+from app.features.wallet.models.wallet import Wallet
+from app.features.wallet.services.balance_cache import balance_cache
+from app.platform.config.settings import settings
+from app.platform.db import track_write
+from app.platform.metrics.instruments import wallet_holds_total
+
+logger = logging.getLogger(__name__)
+
+class WalletHoldService:
+
+    @staticmethod
+    async def place_hold(
+        db: AsyncSession,
+        wallet_id: uuid.UUID,
+        amount: int,
+        reference: str,
+        ttl_seconds: float | None = None,
+        expires: bool = True
+    ) -> WalletHold:
+        if amount <= 0:
+            raise ValueError("Amount must be greater than 0")
+
+        now = datetime.utcnow()
+        result = await db.execute(
+            update(Wallet)
+            .where(Wallet.id == wallet_id, Wallet.available_balance >= amount)
+            .values(held_balance=Wallet.held_balance + amount, updated_at=now)
+            .returning(Wallet.user_id)
+        )
+        user_id = result.scalar_one_or_none()
+
+        if user_id is None:
+            exists = await db.scalar(select(Wallet.id).where(Wallet.id == wallet_id))
+            raise ValueError("Insufficient balance" if exists else "Wallet not found")
+
+        hold = WalletHold(
+            wallet_id=wallet_id,
+            amount=amount,
+            reference=reference,
+            status=HoldStatus.active,
+            expires_at=now + timedelta(seconds=ttl_seconds or settings.WALLET_HOLD_TTL_SECONDS) if expires else None
+        )
+        db.add(hold)
+        track_write(db, user_id)
+        await db.commit()
+        balance_cache.invalidate(user_id)
+        wallet_holds_total.labels(HoldStatus.active.value).inc()
+        return hold
+
+    @staticmethod
+    async def capture_hold(db: AsyncSession, hold_id: uuid.UUID) -> WalletHold:
+        return await WalletHoldService._close_hold(db, hold_id, HoldStatus.captured)
+
+    @staticmethod
+    async def release_hold(db: AsyncSession, hold_id: uuid.UUID) -> WalletHold:
+        return await WalletHoldService._close_hold(db, hold_id, HoldStatus.released)
+
+    @staticmethod
+    async def _close_hold(db: AsyncSession, hold_id: uuid.UUID, status: HoldStatus) -> WalletHold:
+        now = datetime.utcnow()
+        result = await db.execute(
+            update(WalletHold)
+            .where(WalletHold.id == hold_id, WalletHold.status == HoldStatus.active)
+            .values(status=status, updated_at=now)
+            .returning(WalletHold)
+        )
+        hold = result.scalar_one_or_none()
+
+        if hold is None:
+            raise ValueError("Hold is not active")
+
+        values = {"held_balance": Wallet.held_balance - hold.amount, "updated_at": now}
+        if status is HoldStatus.captured:
+            values["balance"] = Wallet.balance - hold.amount
+        result = await db.execute(
+            update(Wallet)
+            .where(Wallet.id == hold.wallet_id)
+            .values(**values)
+            .returning(Wallet.user_id)
+        )
+        user_id = result.scalar_one()
+        track_write(db, user_id)
+        await db.commit()
+        balance_cache.invalidate(user_id)
+        wallet_holds_total.labels(status.value).inc()
+        return hold
+
+    @staticmethod
+    async def expire_holds(db: AsyncSession, limit: int, now: datetime | None = None) -> int:
+        now = now or datetime.utcnow()
+        stale = (
+            select(WalletHold.id)
+            .where(WalletHold.status == HoldStatus.active, WalletHold.expires_at <= now)
+            .order_by(WalletHold.expires_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .cte("stale_holds")
+        )
+        result = await db.execute(
+            update(WalletHold)
+            .where(WalletHold.id == stale.c.id)
+            .values(status=HoldStatus.expired, updated_at=now)
+            .returning(WalletHold.wallet_id, WalletHold.amount)
+            .execution_options(synchronize_session=False)
+        )
+        released = Counter()
+        expired = 0
+        for wallet_id, amount in result:
+            released[wallet_id] += amount
+            expired += 1
+
+        user_ids = []
+        for wallet_id in sorted(released):
+            result = await db.execute(
+                update(Wallet)
+                .where(Wallet.id == wallet_id)
+                .values(held_balance=Wallet.held_balance - released[wallet_id], updated_at=now)
+                .returning(Wallet.user_id)
+            )
+            user_ids.append(result.scalar_one())
+            track_write(db, user_ids[-1])
+        await db.commit()
+
+        for user_id in user_ids:
+            balance_cache.invalidate(user_id)
+        if expired:
+            wallet_holds_total.labels(HoldStatus.expired.value).inc(expired)
+        return expired
+
+    @staticmethod
+    async def run_expiry(session_factory: async_sessionmaker, interval_seconds: float, batch_size: int) -> None:
+        while True:
+            try:
+                async with session_factory() as db:
+                    while await WalletHoldService.expire_holds(db, batch_size) == batch_size:
+                        pass
+            except (DBAPIError, OSError):
+                logger.exception("Could not expire stale wallet holds")
+            await asyncio.sleep(interval_seconds)
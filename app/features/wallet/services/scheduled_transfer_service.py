@@ -0,0 +1,172 @@
+import asyncio
+import logging
+import time
+import uuid
+from collections import Counter
+from datetime import datetime
+
+from sqlalchemy import Row, select, update
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.features.payments.utils.helpers import generate_transaction_reference
+from app.features.wallet.models.scheduled_transfer import ScheduledTransfer, ScheduleInterval, ScheduleStatus
+from app.features.wallet.models.wallet import Wallet
+from app.features.wallet.services.balance_cache import balance_cache
+from app.features.wallet.services.transaction_service import WalletTransactionService
+from app.features.wallet.services.wallet_service import WalletService
+from app.platform.metrics.instruments import (
+    scheduled_transfer_batch_duration_seconds,
+    scheduled_transfer_lag_seconds,
+    scheduled_transfer_runs_total,
+)
+
+logger = logging.getLogger(__name__)
+
+class ScheduledTransferService:
+
+    @staticmethod
+    async def create_schedule(
+        db: AsyncSession,
+        user_id: uuid.UUID,
+        sender_wallet_id: uuid.UUID,
+        recipient_wallet_id: uuid.UUID,
+        amount: int,
+        interval: ScheduleInterval,
+        start_at: datetime | None = None,
+        occurrences: int | None = None
+    ) -> ScheduledTransfer:
+        if amount <= 0:
+            raise ValueError("Amount must be greater than 0")
+
+        if sender_wallet_id == recipient_wallet_id:
+            raise ValueError("Cannot transfer to same wallet")
+
+        if occurrences is not None and occurrences <= 0:
+            raise ValueError("Occurrences must be greater than 0")
+
+        start_at = start_at or datetime.utcnow()
+        schedule = ScheduledTransfer(
+            user_id=user_id,
+            sender_wallet_id=sender_wallet_id,
+            recipient_wallet_id=recipient_wallet_id,
+            amount=amount,
+            interval=interval,
+            status=ScheduleStatus.active,
+            next_run_at=start_at,
+            anchor_day=start_at.day,
+            remaining_runs=1 if interval is ScheduleInterval.once else occurrences
+        )
+        db.add(schedule)
+        await db.commit()
+        return schedule
+
+    @staticmethod
+    async def get_user_schedules(db: AsyncSession, user_id: uuid.UUID) -> list[Row]:
+        result = await db.execute(
+            select(ScheduledTransfer, Wallet.wallet_number)
+            .join(Wallet, Wallet.id == ScheduledTransfer.recipient_wallet_id)
+            .where(ScheduledTransfer.user_id == user_id)
+            .order_by(ScheduledTransfer.created_at.desc())
+        )
+        return list(result.all())
+
+    @staticmethod
+    async def cancel_schedule(db: AsyncSession, user_id: uuid.UUID, schedule_id: uuid.UUID) -> ScheduledTransfer:
+        result = await db.execute(
+            update(ScheduledTransfer)
+            .where(
+                ScheduledTransfer.id == schedule_id,
+                ScheduledTransfer.user_id == user_id,
+                ScheduledTransfer.status == ScheduleStatus.active
+            )
+            .values(status=ScheduleStatus.cancelled, updated_at=datetime.utcnow())
+            .returning(ScheduledTransfer)
+        )
+        schedule = result.scalar_one_or_none()
+
+        if schedule is None:
+            raise ValueError("Active schedule not found")
+
+        await db.commit()
+        return schedule
+
+    @staticmethod
+    async def execute_due(db: AsyncSession, batch_size: int, now: datetime | None = None) -> int:
+        now = now or datetime.utcnow()
+        started = time.perf_counter()
+        result = await db.execute(
+            select(ScheduledTransfer)
+            .where(ScheduledTransfer.status == ScheduleStatus.active, ScheduledTransfer.next_run_at <= now)
+            .order_by(ScheduledTransfer.next_run_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        schedules = list(result.scalars().all())
+
+        if not schedules:
+            await db.rollback()
+            return 0
+
+        wallets = await WalletService.lock_wallets(
+            db,
+            {schedule.sender_wallet_id for schedule in schedules} | {schedule.recipient_wallet_id for schedule in schedules}
+        )
+        outcomes = Counter()
+        for schedule in schedules:
+            scheduled_transfer_lag_seconds.observe(max((now - schedule.next_run_at).total_seconds(), 0.0))
+            sender_wallet = wallets.get(schedule.sender_wallet_id)
+            recipient_wallet = wallets.get(schedule.recipient_wallet_id)
+            try:
+                if not sender_wallet or not recipient_wallet:
+                    raise ValueError("Wallet not found")
+                WalletService.apply_transfer(sender_wallet, recipient_wallet, schedule.amount)
+            except ValueError as e:
+                schedule.last_error = str(e)
+                schedule.failure_count += 1
+                outcomes["failed"] += 1
+            else:
+                db.add(WalletTransactionService.build_transfer_transaction(
+                    schedule.user_id,
+                    sender_wallet.id,
+                    recipient_wallet.id,
+                    schedule.amount,
+                    generate_transaction_reference()
+                ))
+                schedule.last_error = None
+                if schedule.remaining_runs is not None:
+                    schedule.remaining_runs -= 1
+                outcomes["success"] += 1
+            ScheduledTransferService._advance(schedule, now)
+        await db.commit()
+
+        for wallet in wallets.values():
+            balance_cache.invalidate(wallet.user_id)
+        for outcome, count in outcomes.items():
+            scheduled_transfer_runs_total.labels(outcome).inc(count)
+        scheduled_transfer_batch_duration_seconds.observe(time.perf_counter() - started)
+        return len(schedules)
+
+    @staticmethod
+    async def run_executor(session_factory: async_sessionmaker, batch_size: int, interval_seconds: float) -> None:
+        while True:
+            executed = 0
+            try:
+                async with session_factory() as db:
+                    executed = await ScheduledTransferService.execute_due(db, batch_size)
+            except (DBAPIError, OSError):
+                logger.exception("Could not execute due scheduled transfers")
+            if executed < batch_size:
+                await asyncio.sleep(interval_seconds)
+
+    @staticmethod
+    def _advance(schedule: ScheduledTransfer, now: datetime) -> None:
+        schedule.last_run_at = now
+        next_run_at = schedule.interval.advance(schedule.next_run_at, schedule.anchor_day)
+        while next_run_at is not None and next_run_at <= now:
+            next_run_at = schedule.interval.advance(next_run_at, schedule.anchor_day)
+
+        if next_run_at is None or schedule.remaining_runs == 0:
+            schedule.status = ScheduleStatus.completed if schedule.last_error is None else ScheduleStatus.failed
+        else:
+            schedule.next_run_at = next_run_at
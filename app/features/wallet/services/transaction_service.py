@@ -1,9 +1,12 @@
 import uuid
+from collections.abc import AsyncGenerator, Sequence
+from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import CompoundSelect, Row, and_, desc, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.features.payments.models.transaction import Transaction, TransactionStatus, TransactionType
+from app.features.payments.utils.helpers import reference_created_since
 
 
 class WalletTransactionService:
@@ -49,7 +52,24 @@ class WalletTransactionService:
         if existing:
             raise ValueError("Transfer already processed")
 
-        transaction = Transaction(
+        transaction = WalletTransactionService.build_transfer_transaction(
+            user_id, sender_wallet_id, recipient_wallet_id, amount, reference
+        )
+
+        db.add(transaction)
+        await db.commit()
+        await db.refresh(transaction)
+        return transaction
+
+    @staticmethod
+    def build_transfer_transaction(
+        user_id: uuid.UUID,
+        sender_wallet_id: uuid.UUID,
+        recipient_wallet_id: uuid.UUID,
+        amount: int,
+        reference: str
+    ) -> Transaction:
+        return Transaction(
             reference=reference,
             user_id=user_id,
             amount=amount,
@@ -59,25 +79,94 @@ class WalletTransactionService:
             recipient_wallet_id=recipient_wallet_id
         )
 
-        db.add(transaction)
-        await db.commit()
-        await db.refresh(transaction)
-        return transaction
+    @staticmethod
+    async def get_user_transactions(
+        db: AsyncSession,
+        user_id: uuid.UUID,
+        since: datetime | None = None
+    ) -> list[Transaction]:
+        query = select(Transaction).where(Transaction.user_id == user_id)
+        if since is not None:
+            query = query.where(Transaction.created_at >= since)
+        result = await db.execute(query.order_by(Transaction.created_at.desc()))
+        return list(result.scalars().all())
+
+    @staticmethod
+    def wallet_history_query(
+        user_id: uuid.UUID,
+        wallet_id: uuid.UUID,
+        *columns,
+        since: datetime | None = None
+    ) -> CompoundSelect:
+        selected = columns or (Transaction,)
+        initiated = select(*selected).where(Transaction.user_id == user_id)
+        received = select(*selected).where(
+            and_(
+                Transaction.recipient_wallet_id == wallet_id,
+                Transaction.user_id != user_id
+            )
+        )
+        if since is not None:
+            initiated = initiated.where(Transaction.created_at >= since)
+            received = received.where(Transaction.created_at >= since)
+        return union_all(initiated, received).order_by(desc("created_at"))
 
     @staticmethod
-    async def get_user_transactions(db: AsyncSession, user_id: uuid.UUID) -> list[Transaction]:
+    async def get_wallet_transactions(
+        db: AsyncSession,
+        user_id: uuid.UUID,
+        wallet_id: uuid.UUID,
+        since: datetime | None = None
+    ) -> list[Transaction]:
         result = await db.execute(
-            select(Transaction)
-            .where(Transaction.user_id == user_id)
-            .order_by(Transaction.created_at.desc())
+            select(Transaction).from_statement(
+                WalletTransactionService.wallet_history_query(user_id, wallet_id, since=since)
+            )
         )
         return list(result.scalars().all())
 
     @staticmethod
-    async def get_transaction_by_reference(db: AsyncSession, reference: str) -> Transaction | None:
-        result = await db.execute(
-            select(Transaction).where(Transaction.reference == reference)
+    async def stream_wallet_transactions(
+        db: AsyncSession,
+        user_id: uuid.UUID,
+        wallet_id: uuid.UUID,
+        batch_size: int = 1000,
+        since: datetime | None = None
+    ) -> AsyncGenerator[Sequence[Row]]:
+        result = await db.stream(
+            WalletTransactionService.wallet_history_query(
+                user_id,
+                wallet_id,
+                Transaction.transaction_type,
+                Transaction.amount,
+                Transaction.status,
+                Transaction.recipient_wallet_id,
+                Transaction.created_at,
+                Transaction.reference,
+                since=since
+            )
+            .execution_options(yield_per=batch_size)
         )
+        async for rows in result.partitions():
+            yield rows
+
+    @staticmethod
+    async def get_transaction_by_reference(
+        db: AsyncSession,
+        reference: str,
+        since: datetime | None = None,
+        for_update: bool = False
+    ) -> Transaction | None:
+        query = select(Transaction).where(Transaction.reference == reference)
+        if for_update:
+            query = query.with_for_update()
+        since = since or reference_created_since(reference)
+        if since is not None:
+            result = await db.execute(query.where(Transaction.created_at >= since))
+            transaction = result.scalar_one_or_none()
+            if transaction is not None:
+                return transaction
+        result = await db.execute(query)
         return result.scalar_one_or_none()
     
     @staticmethod
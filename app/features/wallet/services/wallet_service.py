@@ -1,36 +1,40 @@
 import uuid
+from collections.abc import Iterable
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.features.wallet.models.wallet import Wallet
+from app.features.wallet.services.balance_cache import CachedBalance, balance_cache
+from app.features.wallet.utils.wallet_number import validate_wallet_number
+from app.platform.config.settings import settings
+from app.platform.db import track_write
+from app.platform.db.upsert import dialect_insert
 
 
 class WalletService:
 
     @staticmethod
     async def create_wallet(db: AsyncSession, user_id: uuid.UUID) -> Wallet:
-        wallet_number = Wallet.generate_wallet_number()
-
-        existing = await db.execute(
-            select(Wallet).where(Wallet.wallet_number == wallet_number)
-        )
-        while existing.scalar_one_or_none() is not None:
-            wallet_number = Wallet.generate_wallet_number()
-            existing = await db.execute(
-                select(Wallet).where(Wallet.wallet_number == wallet_number)
+        for _ in range(settings.WALLET_NUMBER_MAX_ATTEMPTS):
+            result = await db.execute(
+                dialect_insert(db, Wallet)
+                .values(
+                    user_id=user_id,
+                    wallet_number=Wallet.generate_wallet_number(),
+                    balance=0
+                )
+                .on_conflict_do_nothing(index_elements=[Wallet.wallet_number])
+                .returning(Wallet)
             )
+            wallet = result.scalar_one_or_none()
 
-        wallet = Wallet(
-            user_id=user_id,
-            wallet_number=wallet_number,
-            balance=0
-        )
+            if wallet:
+                track_write(db, user_id)
+                await db.commit()
+                return wallet
 
-        db.add(wallet)
-        await db.commit()
-        await db.refresh(wallet)
-        return wallet
+        raise RuntimeError("Could not allocate a unique wallet number")
 
     @staticmethod
     async def get_wallet_by_user_id(db: AsyncSession, user_id: uuid.UUID) -> Wallet | None:
@@ -39,10 +43,17 @@ class WalletService:
         )
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def get_balance(db: AsyncSession, user_id: uuid.UUID) -> CachedBalance | None:
+        async def load_balance() -> CachedBalance | None:
+            wallet = await WalletService.get_wallet_by_user_id(db, user_id)
+            return CachedBalance(wallet.id, wallet.balance, wallet.held_balance) if wallet else None
+
+        return await balance_cache.get_or_load(user_id, load_balance)
+
     @staticmethod
     async def get_wallet_by_number(db: AsyncSession, wallet_number: str) -> Wallet | None:
-        if len(wallet_number) != 13 or not wallet_number.isdigit():
-            raise ValueError("Wallet number must be exactly 13 digits")
+        validate_wallet_number(wallet_number)
 
         result = await db.execute(
             select(Wallet).where(Wallet.wallet_number == wallet_number)
@@ -64,6 +75,7 @@ class WalletService:
 
         wallet.balance += amount
         await db.commit()
+        balance_cache.invalidate(wallet.user_id)
         await db.refresh(wallet)
         return wallet
 
@@ -80,11 +92,12 @@ class WalletService:
         if not wallet:
             raise ValueError("Wallet not found")
 
-        if wallet.balance < amount:
+        if wallet.available_balance < amount:
             raise ValueError("Insufficient balance")
 
         wallet.balance -= amount
         await db.commit()
+        balance_cache.invalidate(wallet.user_id)
         await db.refresh(wallet)
         return wallet
 
@@ -101,30 +114,42 @@ class WalletService:
         if sender_wallet_id == recipient_wallet_id:
             raise ValueError("Cannot transfer to same wallet")
 
-        sender_result = await db.execute(
-            select(Wallet).where(Wallet.id == sender_wallet_id).with_for_update()
-        )
-        sender_wallet = sender_result.scalar_one_or_none()
+        wallets = await WalletService.lock_wallets(db, [sender_wallet_id, recipient_wallet_id])
+        sender_wallet = wallets.get(sender_wallet_id)
 
         if not sender_wallet:
             raise ValueError("Sender wallet not found")
 
-        if sender_wallet.balance < amount:
-            raise ValueError("Insufficient balance")
-
-        recipient_result = await db.execute(
-            select(Wallet).where(Wallet.id == recipient_wallet_id).with_for_update()
-        )
-        recipient_wallet = recipient_result.scalar_one_or_none()
+        recipient_wallet = wallets.get(recipient_wallet_id)
 
         if not recipient_wallet:
             raise ValueError("Recipient wallet not found")
 
-        sender_wallet.balance -= amount
-        recipient_wallet.balance += amount
+        WalletService.apply_transfer(sender_wallet, recipient_wallet, amount)
 
         await db.commit()
+        balance_cache.invalidate(sender_wallet.user_id)
+        balance_cache.invalidate(recipient_wallet.user_id)
         await db.refresh(sender_wallet)
         await db.refresh(recipient_wallet)
 
         return (sender_wallet, recipient_wallet)
+
+    @staticmethod
+    async def lock_wallets(db: AsyncSession, wallet_ids: Iterable[uuid.UUID]) -> dict[uuid.UUID, Wallet]:
+        result = await db.execute(
+            select(Wallet)
+            .where(Wallet.id.in_(set(wallet_ids)))
+            .order_by(Wallet.id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        return {wallet.id: wallet for wallet in result.scalars()}
+
+    @staticmethod
+    def apply_transfer(sender_wallet: Wallet, recipient_wallet: Wallet, amount: int) -> None:
+        if sender_wallet.available_balance < amount:
+            raise ValueError("Insufficient balance")
+
+        sender_wallet.balance -= amount
+        recipient_wallet.balance += amount
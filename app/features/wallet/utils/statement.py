@@ -0,0 +1,55 @@
+import csv
+import io
+import json
+import uuid
+from collections.abc import AsyncIterator, Iterable
+from typing import Any
+
+STATEMENT_COLUMNS = ("type", "direction", "amount", "status", "created_at", "reference")
+
+STATEMENT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson"
+}
+
+def transaction_direction(row: Any, wallet_id: uuid.UUID | None) -> str:
+    if row.transaction_type.value == "deposit" or row.recipient_wallet_id == wallet_id:
+        return "credit"
+    return "debit"
+
+def statement_row_values(row: Any, wallet_id: uuid.UUID | None) -> tuple:
+    return (
+        row.transaction_type.value,
+        transaction_direction(row, wallet_id),
+        row.amount,
+        row.status.value,
+        row.created_at.isoformat(),
+        row.reference
+    )
+
+def encode_csv_rows(rows: Iterable[Any], wallet_id: uuid.UUID | None, include_header: bool = False) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if include_header:
+        writer.writerow(STATEMENT_COLUMNS)
+    writer.writerows(statement_row_values(row, wallet_id) for row in rows)
+    return buffer.getvalue().encode("utf-8")
+
+def encode_ndjson_rows(rows: Iterable[Any], wallet_id: uuid.UUID | None) -> bytes:
+    return "".join(
+        json.dumps(dict(zip(STATEMENT_COLUMNS, statement_row_values(row, wallet_id), strict=True))) + "\n"
+        for row in rows
+    ).encode("utf-8")
+
+async def encode_statement(
+    batches: AsyncIterator[Iterable[Any]],
+    export_format: str,
+    wallet_id: uuid.UUID | None
+) -> AsyncIterator[bytes]:
+    if export_format == "csv":
+        yield encode_csv_rows((), wallet_id, include_header=True)
+        async for rows in batches:
+            yield encode_csv_rows(rows, wallet_id)
+    else:
+        async for rows in batches:
+            yield encode_ndjson_rows(rows, wallet_id)
@@ -0,0 +1,26 @@
+from app.platform.config.settings import get_settings
+
+settings = get_settings()
+
+WALLET_NUMBER_LENGTH = 13
+
+def luhn_check_digit(digits: str) -> str:
+    total = 0
+    for position, char in enumerate(reversed(digits)):
+        digit = ord(char) - 48
+        if position % 2 == 0:
+            digit *= 2
+            if digit > 9:
+                digit -= 9
+        total += digit
+    return str((10 - total % 10) % 10)
+
+def has_valid_check_digit(wallet_number: str) -> bool:
+    return wallet_number[-1] == luhn_check_digit(wallet_number[:-1])
+
+def validate_wallet_number(wallet_number: str) -> str:
+    if len(wallet_number) != WALLET_NUMBER_LENGTH or not wallet_number.isdigit():
+        raise ValueError("Wallet number must be exactly 13 digits")
+    if settings.WALLET_NUMBER_CHECK_DIGIT_ENFORCED and not has_valid_check_digit(wallet_number):
+        raise ValueError("Wallet number check digit is invalid")
+    return wallet_number
@@ -1,20 +1,98 @@
+import asyncio
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api_routers.v1 import api_router
+from app.features.payments.models.transaction import transaction_partitions
+from app.features.payments.services.payout_service import PayoutService
+from app.features.wallet.services.balance_cache import balance_cache
+from app.features.wallet.services.hold_service import WalletHoldService
+from app.features.wallet.services.scheduled_transfer_service import ScheduledTransferService
 from app.platform.config.settings import get_settings
-from app.platform.db.base import engine
+from app.platform.db.base import AsyncSessionLocal, engine, replica_engines, replica_router
+from app.platform.db.notify import NotificationChannel
+from app.platform.db.pool import collect_pool_metrics, pool_status
+from app.platform.db.profiling import QueryStatsMiddleware
+from app.platform.metrics.event_loop import EventLoopMonitor
+from app.platform.metrics.middleware import MetricsMiddleware
+from app.platform.metrics.registry import registry
+from app.platform.tracing.middleware import TracingMiddleware
+from app.platform.tracing.provider import build_exporter, configure_tracing
 
 settings = get_settings()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    tracer_provider = None
+    if settings.TRACING_ENABLED:
+        tracer_provider = configure_tracing(
+            build_exporter(settings.TRACING_EXPORTER, settings.TRACING_OTLP_ENDPOINT),
+            settings.TRACING_SAMPLE_RATIO,
+            settings.APP_NAME
+        )
     async with engine.begin() as conn:
         await conn.run_sync(lambda _: None)
+    loop_monitor = EventLoopMonitor(
+        settings.EVENT_LOOP_MONITOR_INTERVAL_SECONDS,
+        settings.EVENT_LOOP_BLOCK_THRESHOLD_MS / 1000,
+        capture_stacks=settings.DEBUG
+    )
+    loop_monitor.start()
+    partition_maintenance = asyncio.create_task(
+        transaction_partitions.maintain(
+            engine,
+            settings.TRANSACTION_PARTITION_MONTHS_AHEAD,
+            settings.TRANSACTION_PARTITION_CHECK_INTERVAL_SECONDS
+        )
+    )
+    hold_expiry = asyncio.create_task(
+        WalletHoldService.run_expiry(
+            AsyncSessionLocal,
+            settings.WALLET_HOLD_EXPIRY_INTERVAL_SECONDS,
+            settings.WALLET_HOLD_EXPIRY_BATCH_SIZE
+        )
+    )
+    payout_dispatcher = asyncio.create_task(
+        PayoutService.run_dispatcher(
+            AsyncSessionLocal,
+            settings.PAYOUT_BATCH_SIZE,
+            settings.PAYOUT_BATCH_WINDOW_SECONDS,
+            settings.PAYOUT_POLL_INTERVAL_SECONDS
+        )
+    )
+    schedule_executor = asyncio.create_task(
+        ScheduledTransferService.run_executor(
+            AsyncSessionLocal,
+            settings.SCHEDULED_TRANSFER_BATCH_SIZE,
+            settings.SCHEDULED_TRANSFER_POLL_INTERVAL_SECONDS
+        )
+    )
+    lag_monitor = None
+    if replica_router.replicas:
+        lag_monitor = asyncio.create_task(
+            replica_router.monitor_lag(settings.REPLICA_LAG_CHECK_INTERVAL_SECONDS)
+        )
+    invalidation_channel = None
+    if settings.BALANCE_CACHE_INVALIDATION_CHANNEL:
+        invalidation_channel = NotificationChannel(engine, settings.BALANCE_CACHE_INVALIDATION_CHANNEL)
+        balance_cache.attach_channel(invalidation_channel)
+        await invalidation_channel.start()
     yield
+    tasks = [partition_maintenance, hold_expiry, payout_dispatcher, schedule_executor]
+    if lag_monitor:
+        tasks.append(lag_monitor)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    if invalidation_channel:
+        await invalidation_channel.stop()
+    await loop_monitor.stop()
+    await replica_router.dispose()
     await engine.dispose()
+    if tracer_provider:
+        tracer_provider.shutdown()
 
 app = FastAPI(
     title=settings.APP_NAME,
@@ -32,12 +110,30 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(QueryStatsMiddleware, server_timing=settings.DEBUG)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(TracingMiddleware)
+
 app.include_router(api_router)
 
+registry.add_collector(lambda: collect_pool_metrics(engine, replica_engines))
+
 @app.get("/health")
 async def health_check():
     return {
         "status": "healthy",
         "app_name": settings.APP_NAME,
-        "version": "1.0.0"
+        "version": "1.0.0",
+        "balance_cache": balance_cache.stats()
+    }
+
+@app.get("/metrics")
+async def metrics():
+    return Response(registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+@app.get("/metrics/pool")
+async def pool_metrics():
+    return {
+        "primary": pool_status(engine),
+        "replicas": [pool_status(replica) for replica in replica_engines]
     }
@@ -1,3 +1,4 @@
+import uuid
 
 from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
@@ -7,7 +8,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.features.api_keys.services.api_key_service import APIKeyService
 from app.features.auth.models.user import User
 from app.platform.auth.jwt_service import JWTService
-from app.platform.db import get_db
+from app.platform.db import get_db, get_read_db
+from app.platform.metrics.instruments import auth_requests_total
 
 security = HTTPBearer(auto_error=False)
 
@@ -25,13 +27,14 @@ async def get_current_user(
 
     try:
         payload = JWTService.decode_access_token(token)
-        user_id: str = payload.get("user_id")
+        user_id = payload.get("user_id")
 
         if user_id is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid authentication credentials"
             )
+        user_id = uuid.UUID(user_id)
 
     except ValueError:
         raise HTTPException(
@@ -39,6 +42,7 @@ async def get_current_user(
             detail="Could not validate credentials"
         ) from None
 
+    db.info["user_id"] = user_id
     result = await db.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
 
@@ -77,6 +81,7 @@ async def get_current_user_or_api_key(
                 detail="API key has expired"
             )
 
+        db.info["user_id"] = api_key.user_id
         result = await db.execute(select(User).where(User.id == api_key.user_id))
         user = result.scalar_one_or_none()
 
@@ -86,10 +91,12 @@ async def get_current_user_or_api_key(
                 detail="User not found"
             )
 
+        auth_requests_total.labels("api_key").inc()
         return (user, "api_key")
 
     if credentials:
         user = await get_current_user(credentials, db)
+        auth_requests_total.labels("jwt").inc()
         return (user, "jwt")
 
     raise HTTPException(
@@ -97,11 +104,11 @@ async def get_current_user_or_api_key(
         detail="Missing authentication credentials"
     )
 
-def require_permission(permission: str):
+def require_permission(permission: str, read_only: bool = False):
     async def permission_checker(
         credentials: HTTPAuthorizationCredentials = Depends(security),
         x_api_key: str | None = Header(None),
-        db: AsyncSession = Depends(get_db)
+        db: AsyncSession = Depends(get_read_db if read_only else get_db)
     ) -> tuple[User, str]:
         user, auth_type = await get_current_user_or_api_key(credentials, x_api_key, db)
 
@@ -5,19 +5,68 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = False
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_ECHO: bool = False
+    SLOW_QUERY_THRESHOLD_MS: float = 200.0
+    DATABASE_REPLICA_URLS: list[str] = []
+    REPLICA_MAX_LAG_SECONDS: float = 5.0
+    REPLICA_LAG_CHECK_INTERVAL_SECONDS: float = 5.0
+    READ_YOUR_WRITES_SECONDS: float = 10.0
+    TRANSACTION_PARTITION_MONTHS_AHEAD: int = 2
+    TRANSACTION_PARTITION_CHECK_INTERVAL_SECONDS: float = 3600.0
+    TRANSACTION_ARCHIVE_SCHEMA: str = "archive"
 
     GOOGLE_CLIENT_ID: str
     GOOGLE_CLIENT_SECRET: str
     GOOGLE_REDIRECT_URI: str
+    GOOGLE_TOKEN_URL: str = "https://oauth2.googleapis.com/token"
+    GOOGLE_USERINFO_URL: str = "https://www.googleapis.com/oauth2/v1/userinfo"
+    GOOGLE_JWKS_URL: str = "https://www.googleapis.com/oauth2/v3/certs"
 
     PAYSTACK_SECRET_KEY: str
     PAYSTACK_PUBLIC_KEY: str
     PAYSTACK_WEBHOOK_SECRET: str
+    PAYSTACK_BASE_URL: str = "https://api.paystack.co"
 
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_HOURS: int = 24
 
+    BALANCE_CACHE_ENABLED: bool = True
+    BALANCE_CACHE_MAX_ENTRIES: int = 10_000
+    BALANCE_CACHE_TTL_SECONDS: float = 30.0
+    BALANCE_CACHE_INVALIDATION_CHANNEL: str = ""
+
+    WALLET_HOLD_TTL_SECONDS: float = 900.0
+    WALLET_HOLD_EXPIRY_INTERVAL_SECONDS: float = 30.0
+    WALLET_HOLD_EXPIRY_BATCH_SIZE: int = 500
+
+    PAYOUT_BATCH_SIZE: int = 100
+    PAYOUT_BATCH_WINDOW_SECONDS: float = 5.0
+    PAYOUT_POLL_INTERVAL_SECONDS: float = 1.0
+    PAYOUT_SUBMIT_TIMEOUT_SECONDS: float = 300.0
+    PAYOUT_MAX_ATTEMPTS: int = 5
+    PAYOUT_CURRENCY: str = "NGN"
+
+    SCHEDULED_TRANSFER_BATCH_SIZE: int = 200
+    SCHEDULED_TRANSFER_POLL_INTERVAL_SECONDS: float = 1.0
+
+    WALLET_NUMBER_MAX_ATTEMPTS: int = 5
+    WALLET_NUMBER_CHECK_DIGIT_ENFORCED: bool = False
+
+    TRACING_ENABLED: bool = False
+    TRACING_EXPORTER: str = "console"
+    TRACING_OTLP_ENDPOINT: str = ""
+    TRACING_SAMPLE_RATIO: float = 0.05
+
+    EVENT_LOOP_MONITOR_INTERVAL_SECONDS: float = 0.5
+    EVENT_LOOP_BLOCK_THRESHOLD_MS: float = 100.0
+
     APP_NAME: str = "Google-Paystack-API"
     DEBUG: bool = True
     FRONTEND_URL: str = "http://localhost:3000"
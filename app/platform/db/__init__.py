@@ -1,3 +1,21 @@
-from app.platform.db.base import AsyncSessionLocal, Base, engine, get_db
+from app.platform.db.base import (
+    AsyncSessionLocal,
+    Base,
+    ReadSessionLocal,
+    engine,
+    get_db,
+    get_read_db,
+    replica_router,
+)
+from app.platform.db.routing import track_write
 
-__all__ = ["Base", "engine", "AsyncSessionLocal", "get_db"]
+__all__ = [
+    "Base",
+    "engine",
+    "AsyncSessionLocal",
+    "ReadSessionLocal",
+    "get_db",
+    "get_read_db",
+    "replica_router",
+    "track_write"
+]
@@ -1,26 +1,71 @@
 from collections.abc import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
 from app.platform.config.settings import get_settings
+from app.platform.db.pool import InstrumentedAsyncAdaptedQueuePool, instrument_pool
+from app.platform.db.profiling import instrument_queries
+from app.platform.db.routing import PrimarySession, ReplicaRouter, RoutingSession
+from app.platform.tracing.sql import instrument_query_spans
 
 settings = get_settings()
 
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    future=True
+def build_engine(url: str) -> AsyncEngine:
+    database_url = make_url(url)
+    options = {}
+    if database_url.get_backend_name() != "sqlite":
+        options.update(
+            poolclass=InstrumentedAsyncAdaptedQueuePool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+            pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+            pool_pre_ping=settings.DB_POOL_PRE_PING
+        )
+    if database_url.get_driver_name() == "asyncpg":
+        options["connect_args"] = {
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE
+        }
+
+    built = create_async_engine(database_url, echo=settings.DB_ECHO, **options)
+    instrument_pool(built)
+    instrument_queries(built, settings.SLOW_QUERY_THRESHOLD_MS / 1000)
+    instrument_query_spans(built)
+    return built
+
+engine = build_engine(settings.DATABASE_URL)
+
+replica_engines = [build_engine(url) for url in settings.DATABASE_REPLICA_URLS]
+
+replica_router = ReplicaRouter(
+    primary=engine,
+    replicas=replica_engines,
+    max_lag_seconds=settings.REPLICA_MAX_LAG_SECONDS,
+    read_your_writes_seconds=settings.READ_YOUR_WRITES_SECONDS
 )
+replica_router.track_writes(PrimarySession)
 
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
+    sync_session_class=PrimarySession,
     expire_on_commit=False,
     autocommit=False,
     autoflush=False
 )
 
+ReadSessionLocal = async_sessionmaker(
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    router=replica_router,
+    isolation_level="AUTOCOMMIT",
+    expire_on_commit=False,
+    autoflush=False
+)
+
 class Base(DeclarativeBase):
     pass
 
@@ -28,9 +73,13 @@ async def get_db() -> AsyncGenerator[AsyncSession]:
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            await session.commit()
+            if session.in_transaction():
+                await session.commit()
         except Exception:
-            await session.rollback()
+            if session.in_transaction():
+                await session.rollback()
             raise
-        finally:
-            await session.close()
+
+async def get_read_db() -> AsyncGenerator[AsyncSession]:
+    async with ReadSessionLocal() as session:
+        yield session
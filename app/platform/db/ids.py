@@ -0,0 +1,37 @@
+import os
+import threading
+import time
+import uuid
+from datetime import UTC, datetime
+
+COUNTER_BITS = 12
+COUNTER_SEED_MASK = (1 << (COUNTER_BITS - 1)) - 1
+RANDOM_BITS = 62
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+def _seed_counter() -> int:
+    return int.from_bytes(os.urandom(2)) & COUNTER_SEED_MASK
+
+def uuid7() -> uuid.UUID:
+    global _last_ms, _counter
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            _counter = _seed_counter()
+        else:
+            _counter += 1
+            if _counter >> COUNTER_BITS:
+                _last_ms += 1
+                _counter = _seed_counter()
+        timestamp_ms, counter = _last_ms, _counter
+    random_bits = int.from_bytes(os.urandom(8)) >> (64 - RANDOM_BITS)
+    return uuid.UUID(int=(timestamp_ms << 80) | (0x7 << 76) | (counter << 64) | (0b10 << 62) | random_bits)
+
+def uuid7_datetime(value: uuid.UUID) -> datetime | None:
+    if value.version != 7:
+        return None
+    return datetime.fromtimestamp((value.int >> 80) / 1000, UTC).replace(tzinfo=None)
@@ -0,0 +1,77 @@
+import asyncio
+import logging
+import uuid
+from collections.abc import Callable
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+MAX_PAYLOAD_BYTES = 7900
+
+class NotificationChannel:
+
+    def __init__(self, engine: AsyncEngine, channel: str):
+        self.engine = engine
+        self.channel = channel
+        self.instance_id = uuid.uuid4().hex
+        self._handlers: list[Callable[[list[str]], None]] = []
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        self._connection: AsyncConnection | None = None
+        self._sender: asyncio.Task | None = None
+
+    def subscribe(self, handler: Callable[[list[str]], None]) -> None:
+        self._handlers.append(handler)
+
+    def publish(self, message: str) -> None:
+        if self._sender is not None:
+            self._queue.put_nowait(message)
+
+    async def start(self) -> None:
+        self._connection = await self.engine.connect()
+        raw_connection = await self._connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        await driver_connection.add_listener(self.channel, self._on_notification)
+        self._sender = asyncio.create_task(self._send_loop(driver_connection))
+
+    async def stop(self) -> None:
+        if self._sender is not None:
+            self._sender.cancel()
+            self._sender = None
+        if self._connection is not None:
+            await self._connection.close()
+            self._connection = None
+
+    def _on_notification(self, connection, pid: int, channel: str, payload: str) -> None:
+        instance_id, _, body = payload.partition(":")
+        if instance_id == self.instance_id or not body:
+            return
+        messages = body.split(",")
+        for handler in self._handlers:
+            handler(messages)
+
+    async def _send_loop(self, driver_connection) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            for payload in self._payloads(batch):
+                try:
+                    await driver_connection.execute("SELECT pg_notify($1, $2)", self.channel, payload)
+                except Exception:
+                    logger.warning("Failed to publish on channel %s", self.channel, exc_info=True)
+
+    def _payloads(self, messages: list[str]) -> list[str]:
+        payloads = []
+        current: list[str] = []
+        size = len(self.instance_id) + 1
+        for message in dict.fromkeys(messages):
+            if current and size + len(message) + 1 > MAX_PAYLOAD_BYTES:
+                payloads.append(f"{self.instance_id}:{','.join(current)}")
+                current = []
+                size = len(self.instance_id) + 1
+            current.append(message)
+            size += len(message) + 1
+        if current:
+            payloads.append(f"{self.instance_id}:{','.join(current)}")
+        return payloads
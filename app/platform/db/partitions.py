@@ -0,0 +1,146 @@
+import asyncio
+import logging
+import re
+from dataclasses import dataclass
+from datetime import date, datetime
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+BOUND_PATTERN = re.compile(r"FROM \('([^']+)'\) TO \('([^']+)'\)")
+
+def month_start(value: date | datetime) -> date:
+    return date(value.year, value.month, 1)
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+@dataclass
+class Partition:
+    name: str
+    lower: date | None
+    upper: date | None
+
+    @property
+    def is_default(self) -> bool:
+        return self.lower is None
+
+class MonthlyPartitions:
+
+    def __init__(self, table: str, column: str = "created_at"):
+        self.table = table
+        self.column = column
+
+    def partition_name(self, month: date) -> str:
+        return f"{self.table}_p{month:%Y_%m}"
+
+    @property
+    def default_name(self) -> str:
+        return f"{self.table}_default"
+
+    async def is_partitioned(self, conn: AsyncConnection) -> bool:
+        if conn.dialect.name != "postgresql":
+            return False
+        result = await conn.execute(
+            text("SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:table)"),
+            {"table": self.table}
+        )
+        return result.scalar() is not None
+
+    async def existing(self, conn: AsyncConnection) -> list[Partition]:
+        result = await conn.execute(
+            text("""
+                SELECT child.relname, pg_get_expr(child.relpartbound, child.oid)
+                FROM pg_inherits
+                JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                WHERE pg_inherits.inhparent = to_regclass(:table)
+            """),
+            {"table": self.table}
+        )
+        partitions = []
+        for name, bound in result:
+            match = BOUND_PATTERN.search(bound)
+            if match:
+                lower, upper = (datetime.fromisoformat(value).date() for value in match.groups())
+                partitions.append(Partition(name, lower, upper))
+            else:
+                partitions.append(Partition(name, None, None))
+        return sorted(partitions, key=lambda partition: partition.lower or date.max)
+
+    async def ensure(self, conn: AsyncConnection, first_month: date, last_month: date) -> list[str]:
+        existing = await self.existing(conn)
+        covered = {partition.lower for partition in existing}
+        default = next((partition for partition in existing if partition.is_default), None)
+        created = []
+        month = month_start(first_month)
+        while month <= last_month:
+            if month not in covered:
+                name = self.partition_name(month)
+                bounds = f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+                if default:
+                    await self._split_default(conn, default, name, bounds, month)
+                else:
+                    await conn.execute(text(f"CREATE TABLE {name} PARTITION OF {self.table} {bounds}"))
+                created.append(name)
+            month = add_months(month, 1)
+        if not default:
+            await conn.execute(text(f"CREATE TABLE {self.default_name} PARTITION OF {self.table} DEFAULT"))
+            created.append(self.default_name)
+        return created
+
+    async def _split_default(self, conn: AsyncConnection, default: Partition, name: str, bounds: str, month: date) -> None:
+        await conn.execute(text(f"CREATE TABLE {name} (LIKE {self.table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+        await conn.execute(
+            text(f"""
+                WITH moved AS (
+                    DELETE FROM {default.name}
+                    WHERE {self.column} >= :lower AND {self.column} < :upper
+                    RETURNING *
+                )
+                INSERT INTO {name} SELECT * FROM moved
+            """),
+            {"lower": month, "upper": add_months(month, 1)}
+        )
+        await conn.execute(text(f"ALTER TABLE {self.table} ATTACH PARTITION {name} {bounds}"))
+
+    async def ensure_ahead(self, conn: AsyncConnection, months_ahead: int, today: date | None = None) -> list[str]:
+        current = month_start(today or datetime.utcnow())
+        return await self.ensure(conn, current, add_months(current, months_ahead))
+
+    async def archive(
+        self,
+        conn: AsyncConnection,
+        before: date,
+        schema: str,
+        tablespace: str | None = None,
+        lock_timeout_ms: int = 5000
+    ) -> list[str]:
+        archived = []
+        for partition in await self.existing(conn):
+            if partition.is_default or partition.upper > before:
+                continue
+            await conn.execute(text(f"SET LOCAL lock_timeout = {int(lock_timeout_ms)}"))
+            await conn.execute(text(f"ALTER TABLE {self.table} DETACH PARTITION {partition.name}"))
+            await conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {schema}"))
+            await conn.execute(text(f"ALTER TABLE {partition.name} SET SCHEMA {schema}"))
+            if tablespace:
+                await conn.execute(text(f"ALTER TABLE {schema}.{partition.name} SET TABLESPACE {tablespace}"))
+            await conn.commit()
+            archived.append(f"{schema}.{partition.name}")
+        return archived
+
+    async def maintain(self, engine: AsyncEngine, months_ahead: int, interval_seconds: float) -> None:
+        while True:
+            try:
+                async with engine.begin() as conn:
+                    if await self.is_partitioned(conn):
+                        created = await self.ensure_ahead(conn, months_ahead)
+                        if created:
+                            logger.info("Created %s partitions: %s", self.table, ", ".join(created))
+            except (DBAPIError, OSError):
+                logger.exception("Could not create upcoming %s partitions", self.table)
+            await asyncio.sleep(interval_seconds)
@@ -0,0 +1,140 @@
+import time
+from typing import Any
+
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.platform.metrics.instruments import (
+    db_pool_checkouts_total,
+    db_pool_connections,
+    db_pool_connects_total,
+    db_pool_invalidations_total,
+    db_pool_peak_checked_out,
+    db_pool_saturation,
+    db_pool_size,
+    db_pool_timeouts_total,
+    db_pool_wait_seconds_max,
+    db_pool_wait_seconds_total,
+)
+
+
+class PoolMetrics:
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.peak_checked_out = 0
+        self.peak_overflow = 0
+
+    def record_wait(self, seconds: float) -> None:
+        self.wait_seconds_total += seconds
+        if seconds > self.wait_seconds_max:
+            self.wait_seconds_max = seconds
+
+    def record_checkout(self, checked_out: int, overflow: int) -> None:
+        self.checkouts += 1
+        if checked_out > self.peak_checked_out:
+            self.peak_checked_out = checked_out
+        if overflow > self.peak_overflow:
+            self.peak_overflow = overflow
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        finally:
+            self.metrics.record_wait(time.perf_counter() - started)
+
+    def recreate(self) -> QueuePool:
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def max_overflow(self) -> int:
+        return self._max_overflow
+
+def instrument_pool(engine: AsyncEngine) -> None:
+    sync_engine = engine.sync_engine
+
+    def on_connect(dbapi_connection, connection_record) -> None:
+        pool = sync_engine.pool
+        if isinstance(pool, InstrumentedAsyncAdaptedQueuePool):
+            pool.metrics.connects += 1
+
+    def on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+        pool = sync_engine.pool
+        if isinstance(pool, InstrumentedAsyncAdaptedQueuePool):
+            pool.metrics.record_checkout(pool.checkedout(), max(pool.overflow(), 0))
+
+    def on_invalidate(dbapi_connection, connection_record, exception) -> None:
+        pool = sync_engine.pool
+        if isinstance(pool, InstrumentedAsyncAdaptedQueuePool):
+            pool.metrics.invalidations += 1
+
+    event.listen(sync_engine, "connect", on_connect)
+    event.listen(sync_engine, "checkout", on_checkout)
+    event.listen(sync_engine, "invalidate", on_invalidate)
+
+def pool_status(engine: AsyncEngine) -> dict[str, Any]:
+    pool = engine.sync_engine.pool
+    if not isinstance(pool, InstrumentedAsyncAdaptedQueuePool):
+        return {"pool": type(pool).__name__}
+
+    metrics = pool.metrics
+    capacity = pool.size() + max(pool.max_overflow(), 0)
+    checked_out = pool.checkedout()
+    waits = metrics.checkouts + metrics.timeouts
+    return {
+        "pool": type(pool).__name__,
+        "size": pool.size(),
+        "max_overflow": pool.max_overflow(),
+        "timeout_seconds": pool.timeout(),
+        "checked_in": pool.checkedin(),
+        "checked_out": checked_out,
+        "overflow": max(pool.overflow(), 0),
+        "saturation": round(checked_out / capacity, 4) if capacity else 0.0,
+        "peak_checked_out": metrics.peak_checked_out,
+        "peak_overflow": metrics.peak_overflow,
+        "checkouts": metrics.checkouts,
+        "connects": metrics.connects,
+        "invalidations": metrics.invalidations,
+        "timeouts": metrics.timeouts,
+        "wait_ms_avg": round(metrics.wait_seconds_total / waits * 1000, 3) if waits else 0.0,
+        "wait_ms_max": round(metrics.wait_seconds_max * 1000, 3)
+    }
+
+def collect_pool_metrics(primary: AsyncEngine, replicas: list[AsyncEngine]) -> None:
+    engines = {"primary": primary, **{f"replica_{i}": replica for i, replica in enumerate(replicas)}}
+    for name, engine in engines.items():
+        pool = engine.sync_engine.pool
+        if not isinstance(pool, InstrumentedAsyncAdaptedQueuePool):
+            continue
+
+        metrics = pool.metrics
+        capacity = pool.size() + max(pool.max_overflow(), 0)
+        db_pool_connections.labels(name, "checked_in").set(pool.checkedin())
+        db_pool_connections.labels(name, "checked_out").set(pool.checkedout())
+        db_pool_connections.labels(name, "overflow").set(max(pool.overflow(), 0))
+        db_pool_size.labels(name).set(pool.size())
+        db_pool_saturation.labels(name).set(pool.checkedout() / capacity if capacity else 0.0)
+        db_pool_peak_checked_out.labels(name).set(metrics.peak_checked_out)
+        db_pool_wait_seconds_max.labels(name).set(metrics.wait_seconds_max)
+        db_pool_checkouts_total.labels(name).value = metrics.checkouts
+        db_pool_connects_total.labels(name).value = metrics.connects
+        db_pool_invalidations_total.labels(name).value = metrics.invalidations
+        db_pool_timeouts_total.labels(name).value = metrics.timeouts
+        db_pool_wait_seconds_total.labels(name).value = metrics.wait_seconds_total
@@ -0,0 +1,87 @@
+import logging
+import time
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.platform.metrics.instruments import http_requests_without_db_total
+
+logger = logging.getLogger(__name__)
+
+class QueryStats:
+    __slots__ = ("count", "seconds", "scope", "statements", "parent")
+
+    def __init__(self, scope: Scope | None = None, capture: bool = False, parent: "QueryStats | None" = None):
+        self.count = 0
+        self.seconds = 0.0
+        self.scope = scope
+        self.statements: list[str] | None = [] if capture else None
+        self.parent = parent
+
+    @property
+    def route(self) -> str:
+        if self.scope is None:
+            return "-"
+        return getattr(self.scope.get("route"), "path", self.scope.get("path", "-"))
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        if self.statements is not None:
+            self.statements.append(statement)
+        if self.parent is not None:
+            self.parent.record(statement, seconds)
+
+current_query_stats: ContextVar[QueryStats | None] = ContextVar("current_query_stats", default=None)
+
+def instrument_queries(engine: AsyncEngine, slow_query_seconds: float) -> None:
+    sync_engine = engine.sync_engine
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        context.query_started = time.perf_counter()
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        elapsed = time.perf_counter() - context.query_started
+        stats = current_query_stats.get()
+        if stats is not None:
+            stats.record(statement, elapsed)
+        if elapsed >= slow_query_seconds:
+            logger.warning(
+                "Slow query (%.1f ms) on %s: %s",
+                elapsed * 1000,
+                stats.route if stats is not None else "-",
+                " ".join(statement.split())
+            )
+
+    event.listen(sync_engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", after_cursor_execute)
+
+class QueryStatsMiddleware:
+
+    def __init__(self, app: ASGIApp, server_timing: bool = False):
+        self.app = app
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(scope, parent=current_query_stats.get())
+        token = current_query_stats.set(stats)
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", f'db;dur={stats.seconds * 1000:.1f};desc="{stats.count} queries"')
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing if self.server_timing else send)
+        finally:
+            current_query_stats.reset(token)
+            if stats.count == 0:
+                http_requests_without_db_total.labels(getattr(scope.get("route"), "path", "unmatched")).inc()
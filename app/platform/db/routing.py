@@ -0,0 +1,142 @@
+import asyncio
+import itertools
+import logging
+import math
+import time
+import uuid
+from typing import Any
+
+from sqlalchemy import Engine, event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+REPLICA_LAG_QUERY = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+class ReplicaRouter:
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: list[AsyncEngine],
+        max_lag_seconds: float,
+        read_your_writes_seconds: float,
+        max_tracked_writers: int = 100_000
+    ):
+        self.primary = primary
+        self.replicas = replicas
+        self.max_lag_seconds = max_lag_seconds
+        self.read_your_writes_seconds = max(read_your_writes_seconds, max_lag_seconds)
+        self.max_tracked_writers = max_tracked_writers
+        self.replica_lag: dict[AsyncEngine, float] = dict.fromkeys(replicas, 0.0)
+        self._recent_writes: dict[str, float] = {}
+        self._counter = itertools.count()
+        self._isolated_engines: dict[tuple[AsyncEngine, str], Engine] = {}
+
+    def mark_write(self, user_id: uuid.UUID | str) -> None:
+        now = time.monotonic()
+        if len(self._recent_writes) >= self.max_tracked_writers:
+            self._recent_writes = {key: expires for key, expires in self._recent_writes.items() if expires > now}
+        self._recent_writes[str(user_id)] = now + self.read_your_writes_seconds
+
+    def has_recent_write(self, user_id: uuid.UUID | str) -> bool:
+        expires = self._recent_writes.get(str(user_id))
+        if expires is None:
+            return False
+        if expires <= time.monotonic():
+            self._recent_writes.pop(str(user_id), None)
+            return False
+        return True
+
+    def healthy_replicas(self) -> list[AsyncEngine]:
+        return [replica for replica in self.replicas if self.replica_lag[replica] <= self.max_lag_seconds]
+
+    def engine_for_read(self, user_id: uuid.UUID | str | None = None) -> AsyncEngine:
+        if user_id is not None and self.has_recent_write(user_id):
+            return self.primary
+
+        healthy = self.healthy_replicas()
+        if not healthy:
+            return self.primary
+
+        return healthy[next(self._counter) % len(healthy)]
+
+    def bind_for_read(self, user_id: uuid.UUID | str | None = None, isolation_level: str | None = None) -> Engine:
+        engine = self.engine_for_read(user_id)
+        if isolation_level is None:
+            return engine.sync_engine
+        key = (engine, isolation_level)
+        bind = self._isolated_engines.get(key)
+        if bind is None:
+            bind = self._isolated_engines[key] = engine.sync_engine.execution_options(isolation_level=isolation_level)
+        return bind
+
+    async def measure_lag(self, replica: AsyncEngine) -> float:
+        if replica.dialect.name != "postgresql":
+            return 0.0
+
+        try:
+            async with replica.connect() as conn:
+                result = await conn.execute(REPLICA_LAG_QUERY)
+                return float(result.scalar_one())
+        except Exception:
+            logger.warning("Replica %s is unreachable", replica.url.render_as_string(), exc_info=True)
+            return math.inf
+
+    async def refresh_lag(self) -> None:
+        for replica in self.replicas:
+            self.replica_lag[replica] = await self.measure_lag(replica)
+
+    async def monitor_lag(self, interval_seconds: float) -> None:
+        while True:
+            await self.refresh_lag()
+            await asyncio.sleep(interval_seconds)
+
+    def track_writes(self, session_class: type[Session]) -> None:
+        event.listen(session_class, "after_flush", self._collect_written_users)
+        event.listen(session_class, "after_commit", self._mark_committed_writes)
+        event.listen(session_class, "after_rollback", self._discard_written_users)
+
+    def _collect_written_users(self, session: Session, flush_context: Any) -> None:
+        for instance in itertools.chain(session.new, session.dirty, session.deleted):
+            user_id = getattr(instance, "user_id", None)
+            if user_id is not None:
+                session.info.setdefault("written_user_ids", set()).add(user_id)
+
+    def _mark_committed_writes(self, session: Session) -> None:
+        for user_id in session.info.pop("written_user_ids", ()):
+            self.mark_write(user_id)
+
+    def _discard_written_users(self, session: Session) -> None:
+        session.info.pop("written_user_ids", None)
+
+    async def dispose(self) -> None:
+        for replica in self.replicas:
+            await replica.dispose()
+
+class PrimarySession(Session):
+    pass
+
+class RoutingSession(Session):
+
+    def __init__(self, *args: Any, router: ReplicaRouter, isolation_level: str | None = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.router = router
+        self.isolation_level = isolation_level
+        self._read_bind: Engine | None = None
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kwargs: Any):
+        user_id = self.info.get("user_id")
+        if self._read_bind is None or (user_id is not None and self.router.has_recent_write(user_id)):
+            self._read_bind = self.router.bind_for_read(user_id, self.isolation_level)
+        return self._read_bind
+
+def track_write(db: AsyncSession | Session, user_id: uuid.UUID | str) -> None:
+    db.info.setdefault("written_user_ids", set()).add(user_id)
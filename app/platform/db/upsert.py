@@ -0,0 +1,10 @@
+from typing import Any
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def dialect_insert(db: AsyncSession, entity: Any):
+    if db.get_bind().dialect.name == "sqlite":
+        return sqlite.insert(entity)
+    return postgresql.insert(entity)
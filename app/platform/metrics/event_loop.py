@@ -0,0 +1,76 @@
+import asyncio
+import contextlib
+import logging
+import sys
+import threading
+import time
+import traceback
+
+from app.platform.metrics.instruments import event_loop_blocked_total, event_loop_lag_seconds
+
+logger = logging.getLogger(__name__)
+
+class EventLoopMonitor:
+
+    def __init__(self, interval_seconds: float, block_threshold_seconds: float, capture_stacks: bool = False):
+        self.interval_seconds = interval_seconds
+        self.block_threshold_seconds = block_threshold_seconds
+        self.capture_stacks = capture_stacks
+        self.last_blocked_stack: str | None = None
+        self._heartbeat = time.monotonic()
+        self._loop_thread_id: int | None = None
+        self._task: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.create_task(self._run())
+        if self.capture_stacks:
+            self._watchdog = threading.Thread(target=self._watch, name="event-loop-watchdog", daemon=True)
+            self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join)
+            self._watchdog = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval_seconds
+            await asyncio.sleep(self.interval_seconds)
+            lag = max(loop.time() - expected, 0.0)
+            self._heartbeat = time.monotonic()
+            event_loop_lag_seconds.observe(lag)
+            if lag >= self.block_threshold_seconds:
+                event_loop_blocked_total.inc()
+                if not self.capture_stacks:
+                    logger.warning("Event loop was blocked for %.1f ms", lag * 1000)
+
+    def _watch(self) -> None:
+        reported_heartbeat = None
+        poll_seconds = min(self.block_threshold_seconds / 2, self.interval_seconds)
+        while not self._stopped.wait(poll_seconds):
+            heartbeat = self._heartbeat
+            stalled = time.monotonic() - heartbeat - self.interval_seconds
+            if stalled < self.block_threshold_seconds or heartbeat == reported_heartbeat:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            reported_heartbeat = heartbeat
+            self.last_blocked_stack = "".join(traceback.format_stack(frame))
+            logger.warning(
+                "Event loop blocked for at least %.1f ms in:\n%s",
+                stalled * 1000,
+                self.last_blocked_stack
+            )
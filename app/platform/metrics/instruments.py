@@ -0,0 +1,174 @@
+import time
+from collections.abc import Awaitable
+
+import httpx
+from opentelemetry.trace import SpanKind, Status, StatusCode
+
+from app.platform.metrics.registry import registry
+from app.platform.tracing.provider import tracer
+
+http_requests_total = registry.counter(
+    "http_requests_total",
+    "HTTP requests by method, route template and status code",
+    ("method", "route", "status")
+)
+
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by method and route template",
+    ("method", "route")
+)
+
+http_requests_without_db_total = registry.counter(
+    "http_requests_without_db_total",
+    "HTTP requests that finished without executing any SQL, by route template",
+    ("route",)
+)
+
+outbound_requests_total = registry.counter(
+    "outbound_requests_total",
+    "Calls to external services by service, operation and outcome",
+    ("service", "operation", "outcome")
+)
+
+outbound_request_duration_seconds = registry.histogram(
+    "outbound_request_duration_seconds",
+    "Latency of calls to external services",
+    ("service", "operation")
+)
+
+webhook_events_total = registry.counter(
+    "webhook_events_total",
+    "Verified Paystack webhook events by event type",
+    ("event",)
+)
+
+auth_requests_total = registry.counter(
+    "auth_requests_total",
+    "Authenticated requests by credential type",
+    ("method",)
+)
+
+event_loop_lag_seconds = registry.histogram(
+    "event_loop_lag_seconds",
+    "Delay between when the event loop monitor was due to wake and when it ran",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+)
+
+event_loop_blocked_total = registry.counter(
+    "event_loop_blocked_total",
+    "Event loop monitor wake-ups delayed past the blocking threshold"
+)
+
+wallet_holds_total = registry.counter(
+    "wallet_holds_total",
+    "Wallet hold transitions by resulting status",
+    ("status",)
+)
+
+payouts_total = registry.counter(
+    "payouts_total",
+    "Payout transitions by resulting status",
+    ("status",)
+)
+
+db_pool_connections = registry.gauge(
+    "db_pool_connections",
+    "Pooled database connections by engine and state (checked_in, checked_out, overflow)",
+    ("engine", "state")
+)
+
+db_pool_size = registry.gauge(
+    "db_pool_size",
+    "Configured pool size by engine, excluding overflow",
+    ("engine",)
+)
+
+db_pool_saturation = registry.gauge(
+    "db_pool_saturation",
+    "Checked out connections as a fraction of pool size plus max overflow",
+    ("engine",)
+)
+
+db_pool_peak_checked_out = registry.gauge(
+    "db_pool_peak_checked_out",
+    "Most connections checked out at once since startup",
+    ("engine",)
+)
+
+db_pool_wait_seconds_max = registry.gauge(
+    "db_pool_wait_seconds_max",
+    "Longest wait for a pooled connection since startup",
+    ("engine",)
+)
+
+db_pool_checkouts_total = registry.counter(
+    "db_pool_checkouts_total",
+    "Connections checked out of the pool",
+    ("engine",)
+)
+
+db_pool_connects_total = registry.counter(
+    "db_pool_connects_total",
+    "New database connections opened by the pool",
+    ("engine",)
+)
+
+db_pool_invalidations_total = registry.counter(
+    "db_pool_invalidations_total",
+    "Pooled connections invalidated after an error",
+    ("engine",)
+)
+
+db_pool_timeouts_total = registry.counter(
+    "db_pool_timeouts_total",
+    "Checkouts that gave up after the pool timeout",
+    ("engine",)
+)
+
+db_pool_wait_seconds_total = registry.counter(
+    "db_pool_wait_seconds_total",
+    "Time spent waiting for pooled connections",
+    ("engine",)
+)
+
+payout_batch_size = registry.histogram(
+    "payout_batch_size",
+    "Payouts sent to Paystack per bulk transfer call",
+    buckets=(1, 5, 10, 25, 50, 100)
+)
+
+scheduled_transfer_runs_total = registry.counter(
+    "scheduled_transfer_runs_total",
+    "Scheduled transfer executions by outcome",
+    ("outcome",)
+)
+
+scheduled_transfer_lag_seconds = registry.histogram(
+    "scheduled_transfer_lag_seconds",
+    "Delay between when a scheduled transfer was due and when the executor ran it",
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0, 3600.0)
+)
+
+scheduled_transfer_batch_duration_seconds = registry.histogram(
+    "scheduled_transfer_batch_duration_seconds",
+    "Time to claim, execute and commit one batch of due scheduled transfers"
+)
+
+async def track_outbound(service: str, operation: str, request: Awaitable[httpx.Response]) -> httpx.Response:
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        with tracer.start_as_current_span(f"{service} {operation}", kind=SpanKind.CLIENT) as span:
+            response = await request
+            outcome = f"{response.status_code // 100}xx"
+            if span.is_recording():
+                span.set_attribute("server.address", response.request.url.host)
+                span.set_attribute("http.request.method", response.request.method)
+                span.set_attribute("http.response.status_code", response.status_code)
+                if response.status_code >= 400:
+                    span.set_status(Status(StatusCode.ERROR))
+            return response
+    finally:
+        outbound_request_duration_seconds.labels(service, operation).observe(time.perf_counter() - started)
+        outbound_requests_total.labels(service, operation, outcome).inc()
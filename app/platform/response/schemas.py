@@ -1,5 +1,6 @@
 from typing import Any
 
+import orjson
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
@@ -27,16 +28,24 @@ class ErrorResponse(BaseModel):
     error_code: str | None = None
     data: Any | None = None
 
+def _serialize_default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+class EnvelopeResponse(JSONResponse):
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_serialize_default, option=orjson.OPT_NON_STR_KEYS)
+
 def success_response(message: str, data: Any = None, status_code: int = 200) -> JSONResponse:
-    response = SuccessResponse(message=message, data=data)
-    return JSONResponse(
+    return EnvelopeResponse(
         status_code=status_code,
-        content=response.model_dump()
+        content={"status": "success", "message": message, "data": data}
     )
 
 def error_response(message: str, status_code: int = 400, error_code: str | None = None, data: Any = None) -> JSONResponse:
-    response = ErrorResponse(message=message, error_code=error_code, data=data)
-    return JSONResponse(
+    return EnvelopeResponse(
         status_code=status_code,
-        content=response.model_dump()
+        content={"status": "error", "message": message, "error_code": error_code, "data": data}
     )
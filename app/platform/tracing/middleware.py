@@ -0,0 +1,41 @@
+from opentelemetry import propagate, trace
+from opentelemetry.trace import SpanKind, Status, StatusCode
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.platform.tracing.provider import tracer
+
+
+class TracingMiddleware:
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or trace.get_current_span().get_span_context().is_valid:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        carrier = {key.decode("latin-1"): value.decode("latin-1") for key, value in scope["headers"]}
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        with tracer.start_as_current_span(method, context=propagate.extract(carrier), kind=SpanKind.SERVER) as span:
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                if span.is_recording():
+                    route = getattr(scope.get("route"), "path", None)
+                    span.update_name(f"{method} {route or 'unmatched'}")
+                    span.set_attribute("http.request.method", method)
+                    span.set_attribute("url.path", scope["path"])
+                    span.set_attribute("http.response.status_code", status_code)
+                    if route:
+                        span.set_attribute("http.route", route)
+                    if status_code >= 500:
+                        span.set_status(Status(StatusCode.ERROR))
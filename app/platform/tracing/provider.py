@@ -0,0 +1,38 @@
+import httpx
+from opentelemetry import propagate, trace
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter, SimpleSpanProcessor, SpanExporter
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+tracer = trace.get_tracer("app")
+
+def build_exporter(name: str, endpoint: str = "") -> SpanExporter:
+    if name == "console":
+        return ConsoleSpanExporter()
+    if name == "otlp":
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        except ImportError:
+            raise RuntimeError("TRACING_EXPORTER=otlp requires opentelemetry-exporter-otlp-proto-http") from None
+        return OTLPSpanExporter(endpoint=endpoint) if endpoint else OTLPSpanExporter()
+    raise ValueError(f"Unknown tracing exporter: {name}")
+
+def configure_tracing(
+    exporter: SpanExporter,
+    sample_ratio: float,
+    service_name: str,
+    batch: bool = True
+) -> TracerProvider:
+    provider = TracerProvider(
+        sampler=ParentBased(TraceIdRatioBased(sample_ratio)),
+        resource=Resource.create({"service.name": service_name})
+    )
+    provider.add_span_processor(BatchSpanProcessor(exporter) if batch else SimpleSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+    return provider
+
+async def inject_trace_context(request: httpx.Request) -> None:
+    propagate.inject(request.headers)
+
+OUTBOUND_EVENT_HOOKS = {"request": [inject_trace_context]}
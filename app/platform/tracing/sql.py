@@ -0,0 +1,43 @@
+from opentelemetry import trace
+from opentelemetry.trace import SpanKind, Status, StatusCode
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.platform.tracing.provider import tracer
+
+
+def instrument_query_spans(engine: AsyncEngine) -> None:
+    sync_engine = engine.sync_engine
+    system = sync_engine.dialect.name
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        if not trace.get_current_span().is_recording():
+            return
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "QUERY"
+        context.trace_span = tracer.start_span(
+            operation,
+            kind=SpanKind.CLIENT,
+            attributes={
+                "db.system.name": system,
+                "db.operation.name": operation,
+                "db.query.text": statement
+            }
+        )
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        span = getattr(context, "trace_span", None)
+        if span is not None:
+            span.end()
+            context.trace_span = None
+
+    def handle_error(exception_context) -> None:
+        span = getattr(exception_context.execution_context, "trace_span", None)
+        if span is not None:
+            span.record_exception(exception_context.original_exception)
+            span.set_status(Status(StatusCode.ERROR))
+            span.end()
+            exception_context.execution_context.trace_span = None
+
+    event.listen(sync_engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", after_cursor_execute)
+    event.listen(sync_engine, "handle_error", handle_error)
@@ -0,0 +1,92 @@
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import time
+from collections.abc import Callable
+
+
+def calibrate(fn: Callable[[], object], min_round_seconds: float) -> int:
+    loops = 1
+    while True:
+        started = time.perf_counter_ns()
+        for _ in range(loops):
+            fn()
+        elapsed = (time.perf_counter_ns() - started) / 1e9
+        if elapsed >= min_round_seconds:
+            return loops
+        loops *= 2 if elapsed == 0 else max(2, min(10, int(min_round_seconds / elapsed) + 1))
+
+def time_rounds(fn: Callable[[], object], loops: int, rounds: int) -> list[float]:
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            started = time.perf_counter_ns()
+            for _ in range(loops):
+                fn()
+            samples.append((time.perf_counter_ns() - started) / loops)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return samples
+
+def measure(fn: Callable[[], object], rounds: int, min_round_seconds: float) -> dict:
+    loops = calibrate(fn, min_round_seconds)
+    time_rounds(fn, loops, 1)
+    samples = sorted(time_rounds(fn, loops, rounds))
+    median = statistics.median(samples)
+    quartiles = statistics.quantiles(samples, n=4) if len(samples) > 1 else [median, median, median]
+    return {
+        "loops": loops,
+        "rounds": rounds,
+        "median_ns": round(median, 1),
+        "min_ns": round(samples[0], 1),
+        "iqr_ns": round(quartiles[2] - quartiles[0], 1),
+        "rel_iqr_pct": round((quartiles[2] - quartiles[0]) / median * 100, 2) if median else 0.0
+    }
+
+def compare(current: dict, baseline: dict, threshold_pct: float) -> list[dict]:
+    rows = []
+    for name, result in current.items():
+        previous = baseline.get(name)
+        if previous is None:
+            rows.append({"name": name, "current_ns": result["min_ns"], "status": "new"})
+            continue
+        change = (result["min_ns"] - previous["min_ns"]) / previous["min_ns"] * 100
+        noise = max(threshold_pct, result["rel_iqr_pct"], previous["rel_iqr_pct"])
+        if change > noise:
+            status = "regressed"
+        elif change < -noise:
+            status = "improved"
+        else:
+            status = "unchanged"
+        rows.append({
+            "name": name,
+            "baseline_ns": previous["min_ns"],
+            "current_ns": result["min_ns"],
+            "change_pct": round(change, 2),
+            "status": status
+        })
+    return rows
+
+def environment() -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine()
+    }
+
+def load_benchmarks(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)["benchmarks"]
@@ -0,0 +1,108 @@
+import argparse
+import hashlib
+import hmac
+import json
+import sys
+import uuid
+from datetime import datetime, timedelta
+
+from app.features.api_keys.services.api_key_service import APIKeyService
+from app.features.payments.models.transaction import TransactionStatus, TransactionType
+from app.features.payments.services.paystack_service import PaystackService
+from app.features.wallet.models.wallet import Wallet
+from app.features.wallet.schemas.wallet import DepositRequest, TransferRequest
+from app.platform.auth.jwt_service import JWTService
+from app.platform.config.settings import settings
+from app.platform.response.schemas import success_response
+from scripts.benchmarks.harness import compare, environment, load_benchmarks, measure
+
+
+def build_cases() -> dict:
+    token = JWTService.create_access_token({"user_id": str(uuid.uuid4()), "email": "bench@example.com"})
+    raw_key = APIKeyService.generate_api_key()
+    key_hash = APIKeyService.hash_key(raw_key)
+    webhook_body = json.dumps({
+        "event": "charge.success",
+        "data": {
+            "id": 302961,
+            "reference": f"TXN_{uuid.uuid4().hex}",
+            "amount": 500000,
+            "status": "success",
+            "paid_at": "2026-01-01T00:00:00.000Z",
+            "channel": "card",
+            "currency": "NGN",
+            "customer": {"email": "bench@example.com", "customer_code": "CUS_bench"}
+        }
+    }).encode()
+    webhook_signature = hmac.new(settings.PAYSTACK_WEBHOOK_SECRET.encode(), webhook_body, hashlib.sha512).hexdigest()
+    now = datetime.utcnow()
+    history = [
+        {
+            "type": TransactionType.deposit if i % 3 else TransactionType.transfer,
+            "direction": "credit" if i % 2 else "debit",
+            "amount": 100 + i,
+            "status": TransactionStatus.success,
+            "created_at": now - timedelta(minutes=i),
+            "reference": f"TXN_{uuid.uuid4().hex}"
+        }
+        for i in range(20)
+    ]
+    transfer_payload = {"wallet_number": Wallet.generate_wallet_number(), "amount": 2500}
+    deposit_payload = {"amount": 5000}
+
+    return {
+        "jwt_decode_access_token": lambda: JWTService.decode_access_token(token),
+        "api_key_verify_key": lambda: APIKeyService.verify_key(raw_key, key_hash),
+        "paystack_verify_webhook_signature": lambda: PaystackService.verify_webhook_signature(webhook_body, webhook_signature),
+        "success_response_balance": lambda: success_response(message="Balance retrieved successfully", data={"balance": 125000}),
+        "success_response_history_20": lambda: success_response(message="Transaction history retrieved successfully", data=history),
+        "transfer_request_validate": lambda: TransferRequest.model_validate(transfer_payload),
+        "deposit_request_validate": lambda: DepositRequest.model_validate(deposit_payload),
+        "wallet_generate_wallet_number": Wallet.generate_wallet_number,
+    }
+
+def print_comparison(rows: list[dict]) -> None:
+    for row in rows:
+        if row["status"] == "new":
+            print(f"{row['name']:<40} {'':>12} {row['current_ns']:>12.1f} {'':>9}  new", file=sys.stderr)
+        else:
+            print(
+                f"{row['name']:<40} {row['baseline_ns']:>12.1f} {row['current_ns']:>12.1f} "
+                f"{row['change_pct']:>+8.2f}%  {row['status']}",
+                file=sys.stderr
+            )
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Microbenchmark request hot paths, optionally against a saved baseline")
+    parser.add_argument("--filter", help="only run benchmarks whose name contains this string")
+    parser.add_argument("--rounds", type=int, default=15)
+    parser.add_argument("--min-round-seconds", type=float, default=0.05, help="each round repeats the call until it takes at least this long")
+    parser.add_argument("--output")
+    parser.add_argument("--save-baseline", metavar="PATH", help="also write the results to PATH for later --compare runs")
+    parser.add_argument("--compare", metavar="PATH", help="baseline file to compare fastest rounds against; exits 1 on regression")
+    parser.add_argument("--threshold", type=float, default=10.0, help="minimum change in percent to count as a regression")
+    args = parser.parse_args()
+
+    cases = build_cases()
+    if args.filter:
+        cases = {name: fn for name, fn in cases.items() if args.filter in name}
+
+    results = {name: measure(fn, args.rounds, args.min_round_seconds) for name, fn in cases.items()}
+    report = {"environment": environment(), "benchmarks": results}
+
+    if args.compare:
+        report["comparison"] = compare(results, load_benchmarks(args.compare), args.threshold)
+        print_comparison(report["comparison"])
+
+    output = json.dumps(report, indent=2)
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as f:
+                f.write(output)
+    print(output)
+
+    if any(row["status"] == "regressed" for row in report.get("comparison", [])):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import uuid
+
+from app.platform.db import engine
+from scripts.seed import TRANSACTION_COLUMNS, SeedPlan
+
+INDEX_SETS = {
+    "before": (
+        (("reference",), True),
+        (("reference",), False),
+        (("status",), False),
+        (("transaction_type",), False),
+        (("user_id", "created_at"), False),
+        (("sender_wallet_id", "created_at"), False),
+        (("recipient_wallet_id", "created_at"), False),
+    ),
+    "after": (
+        (("reference",), True),
+        (("user_id", "created_at"), False),
+        (("sender_wallet_id", "created_at"), False),
+        (("recipient_wallet_id", "created_at"), False),
+        (("email", "amount", "created_at"), False),
+    ),
+}
+
+SINGLE_INSERT_SQL = (
+    "INSERT INTO {table} (" + ", ".join(TRANSACTION_COLUMNS) + ") VALUES ("
+    + ", ".join(f"${i}" for i in range(1, len(TRANSACTION_COLUMNS) + 1)) + ")"
+)
+
+async def create_table(driver, schema: str, name: str, indexes: tuple) -> str:
+    table = f"{schema}.{name}"
+    await driver.execute(f"DROP TABLE IF EXISTS {table}")
+    await driver.execute(f"CREATE TABLE {table} (LIKE public.transactions INCLUDING DEFAULTS, PRIMARY KEY (id))")
+    for position, (columns, unique) in enumerate(indexes):
+        await driver.execute(
+            f"CREATE {'UNIQUE ' if unique else ''}INDEX {name}_{position} ON {table} ({', '.join(columns)})"
+        )
+    return table
+
+async def copy_rows(driver, schema: str, name: str, rows: list[tuple], chunk_size: int) -> float:
+    started = time.perf_counter()
+    for start in range(0, len(rows), chunk_size):
+        await driver.copy_records_to_table(
+            name, schema_name=schema, records=rows[start:start + chunk_size], columns=list(TRANSACTION_COLUMNS)
+        )
+    return time.perf_counter() - started
+
+async def insert_rows(driver, table: str, rows: list[tuple]) -> float:
+    statement = SINGLE_INSERT_SQL.format(table=table)
+    started = time.perf_counter()
+    for row in rows:
+        await driver.execute(statement, *row)
+    return time.perf_counter() - started
+
+def summarize(rows: int, samples: list[float]) -> dict:
+    return {
+        "best_rows_per_second": round(rows / min(samples)),
+        "median_rows_per_second": round(rows / statistics.median(samples))
+    }
+
+async def run(args: argparse.Namespace) -> dict:
+    plan = SeedPlan(argparse.Namespace(
+        seed=args.seed, users=args.users, days=args.days, transactions=args.rows + args.single_inserts,
+        heavy_user_transactions=0, api_keys=0
+    ))
+    rows = list(plan.transaction_rows())
+    bulk_rows, single_rows = rows[:args.rows], rows[args.rows:]
+    schema = f"bench_index_{uuid.uuid4().hex[:8]}"
+    copy_samples = {name: [] for name in INDEX_SETS}
+    insert_samples = {name: [] for name in INDEX_SETS}
+
+    async with engine.connect() as conn:
+        if conn.dialect.driver != "asyncpg":
+            raise SystemExit("index_write_cost needs a postgresql+asyncpg DATABASE_URL")
+        driver = (await conn.get_raw_connection()).driver_connection
+        await driver.execute(f"CREATE SCHEMA {schema}")
+        try:
+            for _ in range(args.rounds):
+                for name, indexes in INDEX_SETS.items():
+                    await create_table(driver, schema, name, indexes)
+                    copy_samples[name].append(await copy_rows(driver, schema, name, bulk_rows, args.chunk_size))
+                    table = await create_table(driver, schema, name, indexes)
+                    insert_samples[name].append(await insert_rows(driver, table, single_rows))
+        finally:
+            await driver.execute(f"DROP SCHEMA {schema} CASCADE")
+    await engine.dispose()
+
+    report = {
+        "rows": args.rows,
+        "single_inserts": args.single_inserts,
+        "rounds": args.rounds,
+        "indexes": {
+            name: [", ".join(columns) + (" (unique)" if unique else "") for columns, unique in indexes]
+            for name, indexes in INDEX_SETS.items()
+        },
+        "copy": {name: summarize(args.rows, samples) for name, samples in copy_samples.items()},
+        "single_insert": {name: summarize(args.single_inserts, samples) for name, samples in insert_samples.items()}
+    }
+    for mode in ("copy", "single_insert"):
+        before, after = report[mode]["before"], report[mode]["after"]
+        report[mode]["speedup"] = round(after["best_rows_per_second"] / before["best_rows_per_second"], 3)
+    return report
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare transaction insert throughput under the old and audited index sets")
+    parser.add_argument("--rows", type=int, default=200_000, help="rows loaded with COPY per round")
+    parser.add_argument("--single-inserts", type=int, default=5_000, help="rows inserted one statement at a time per round")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--chunk-size", type=int, default=50_000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    report = json.dumps(asyncio.run(run(args)), indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report)
+    print(report)
+
+if __name__ == "__main__":
+    main()
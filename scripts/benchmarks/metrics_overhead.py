@@ -0,0 +1,72 @@
+import argparse
+import asyncio
+import json
+import time
+
+from app.platform.metrics.middleware import MetricsMiddleware
+from app.platform.metrics.registry import Registry
+
+SCOPE = {"type": "http", "method": "GET", "path": "/bench", "headers": []}
+
+class BenchRoute:
+    path = "/bench"
+
+async def endpoint(scope, receive, send) -> None:
+    scope["route"] = BenchRoute
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+async def receive() -> dict:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+async def send(message: dict) -> None:
+    pass
+
+def ns_per_op(fn, iterations: int) -> float:
+    started = time.perf_counter_ns()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter_ns() - started) / iterations
+
+async def asgi_ns_per_request(app, iterations: int) -> float:
+    started = time.perf_counter_ns()
+    for _ in range(iterations):
+        await app(dict(SCOPE), receive, send)
+    return (time.perf_counter_ns() - started) / iterations
+
+def run(iterations: int) -> dict:
+    registry = Registry()
+    counter = registry.counter("bench_total", "Benchmark counter", ("method", "route", "status"))
+    histogram = registry.histogram("bench_seconds", "Benchmark histogram", ("method", "route"))
+
+    baseline = ns_per_op(lambda: None, iterations)
+    counter_inc = ns_per_op(lambda: counter.labels("GET", "/bench", "200").inc(), iterations)
+    histogram_observe = ns_per_op(lambda: histogram.labels("GET", "/bench").observe(0.0123), iterations)
+
+    bare = asyncio.run(asgi_ns_per_request(endpoint, iterations))
+    instrumented = asyncio.run(asgi_ns_per_request(MetricsMiddleware(endpoint), iterations))
+
+    return {
+        "iterations": iterations,
+        "call_baseline_ns": round(baseline, 1),
+        "counter_inc_ns": round(counter_inc - baseline, 1),
+        "histogram_observe_ns": round(histogram_observe - baseline, 1),
+        "asgi_bare_ns": round(bare, 1),
+        "asgi_instrumented_ns": round(instrumented, 1),
+        "middleware_overhead_ns": round(instrumented - bare, 1)
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure the recording overhead of the metrics registry and middleware")
+    parser.add_argument("--iterations", type=int, default=200_000)
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    report = json.dumps(run(args.iterations), indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report)
+    print(report)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import uuid
+
+from sqlalchemy import select, text
+
+from app.features.api_keys.models import api_key  # noqa: F401
+from app.features.auth.models.user import User
+from app.features.wallet.services.wallet_service import WalletService
+from app.platform.db import AsyncSessionLocal, ReadSessionLocal, engine
+
+SEED_SQL = (
+    text("""
+        INSERT INTO users (id, email, name, google_id, created_at, updated_at)
+        VALUES (:user_id, :email, 'Read Bench', :google_id, now(), now())
+    """),
+    text("""
+        INSERT INTO wallets (id, user_id, wallet_number, balance, created_at, updated_at)
+        VALUES (:wallet_id, :user_id, :wallet_number, 0, now(), now())
+    """),
+)
+
+CLEANUP_SQL = (
+    text("DELETE FROM wallets WHERE user_id = :user_id"),
+    text("DELETE FROM users WHERE id = :user_id"),
+)
+
+async def read_balance(session, user_id: uuid.UUID) -> None:
+    session.info["user_id"] = user_id
+    await session.execute(select(User).where(User.id == user_id))
+    await WalletService.get_wallet_by_user_id(session, user_id)
+
+async def transactional_request(user_id: uuid.UUID) -> None:
+    async with AsyncSessionLocal() as session:
+        await read_balance(session, user_id)
+        await session.commit()
+
+async def read_only_request(user_id: uuid.UUID) -> None:
+    async with ReadSessionLocal() as session:
+        await read_balance(session, user_id)
+
+def summarize(samples: list[float]) -> dict:
+    ordered = sorted(samples)
+    return {
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+        "p50_ms": round(ordered[len(ordered) // 2] * 1000, 3),
+        "p99_ms": round(ordered[int(len(ordered) * 0.99) - 1] * 1000, 3)
+    }
+
+async def measure(request, user_id: uuid.UUID, iterations: int) -> dict:
+    for _ in range(min(50, iterations)):
+        await request(user_id)
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await request(user_id)
+        samples.append(time.perf_counter() - started)
+    return summarize(samples)
+
+async def run(iterations: int) -> dict:
+    user_id = uuid.uuid4()
+    async with engine.begin() as conn:
+        for statement in SEED_SQL:
+            await conn.execute(statement, {
+                "user_id": user_id,
+                "wallet_id": uuid.uuid4(),
+                "email": f"read-bench-{user_id.hex}@example.com",
+                "google_id": f"read-bench-{user_id.hex}",
+                "wallet_number": str(user_id.int)[:13]
+            })
+    try:
+        results = {
+            "iterations": iterations,
+            "commit_session": await measure(transactional_request, user_id, iterations),
+            "read_only_session": await measure(read_only_request, user_id, iterations)
+        }
+    finally:
+        async with engine.begin() as conn:
+            for statement in CLEANUP_SQL:
+                await conn.execute(statement, {"user_id": user_id})
+        await engine.dispose()
+    return results
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare read latency of commit-per-request sessions and autocommit read sessions")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    report = json.dumps(asyncio.run(run(args.iterations)), indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report)
+    print(report)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+import argparse
+import json
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi.responses import JSONResponse
+
+from app.features.payments.models.transaction import TransactionStatus, TransactionType
+from app.platform.response.schemas import SuccessResponse, success_response
+
+
+def history_rows(size: int) -> list[dict]:
+    now = datetime.utcnow()
+    return [
+        {
+            "type": TransactionType.deposit if i % 3 else TransactionType.transfer,
+            "direction": "credit" if i % 2 else "debit",
+            "amount": 100 + i,
+            "status": TransactionStatus.success,
+            "created_at": now - timedelta(seconds=i),
+            "reference": f"TXN_{uuid.uuid4().hex}"
+        }
+        for i in range(size)
+    ]
+
+def pydantic_envelope(rows: list[dict]) -> bytes:
+    data = [
+        {**row, "type": row["type"].value, "status": row["status"].value, "created_at": row["created_at"].isoformat()}
+        for row in rows
+    ]
+    response = SuccessResponse(message="Transaction history retrieved successfully", data=data)
+    return JSONResponse(content=response.model_dump()).body
+
+def orjson_envelope(rows: list[dict]) -> bytes:
+    return success_response(message="Transaction history retrieved successfully", data=rows).body
+
+def us_per_call(fn, rows: list[dict], iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn(rows)
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+def run(sizes: list[int], budget: int) -> dict:
+    results = []
+    for size in sizes:
+        rows = history_rows(size)
+        assert json.loads(pydantic_envelope(rows)) == json.loads(orjson_envelope(rows))
+        iterations = max(5, budget // max(size, 1))
+        before = us_per_call(pydantic_envelope, rows, iterations)
+        after = us_per_call(orjson_envelope, rows, iterations)
+        results.append({
+            "rows": size,
+            "bytes": len(orjson_envelope(rows)),
+            "iterations": iterations,
+            "pydantic_json_us": round(before, 1),
+            "orjson_us": round(after, 1),
+            "speedup": round(before / after, 2)
+        })
+    return {"runs": results}
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare response envelope serialization paths across payload sizes")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 100, 1000, 10000])
+    parser.add_argument("--budget", type=int, default=200_000, help="approximate rows serialized per size and path")
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    report = json.dumps(run(args.sizes, args.budget), indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report)
+    print(report)
+
+if __name__ == "__main__":
+    main()
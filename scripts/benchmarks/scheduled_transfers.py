@@ -0,0 +1,140 @@
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, func, insert, select, update
+
+from app.features.api_keys.models import api_key  # noqa: F401
+from app.features.auth.models.user import User
+from app.features.payments.models.transaction import Transaction, TransactionReference
+from app.features.wallet.models.scheduled_transfer import ScheduledTransfer, ScheduleInterval, ScheduleStatus
+from app.features.wallet.models.wallet import Wallet
+from app.features.wallet.services.scheduled_transfer_service import ScheduledTransferService
+from app.platform.db import engine
+from app.platform.db.base import AsyncSessionLocal
+from scripts.benchmarks.harness import environment
+
+STARTING_BALANCE = 10 ** 12
+
+async def seed(args: argparse.Namespace, tag: str) -> tuple[list[uuid.UUID], list[uuid.UUID]]:
+    now = datetime.utcnow()
+    users = [
+        {
+            "id": uuid.uuid4(), "email": f"bench-schedule-{tag}-{i}@example.com", "name": f"Bench {i}",
+            "google_id": f"bench-schedule-{tag}-{i}", "created_at": now, "updated_at": now
+        }
+        for i in range(args.wallets)
+    ]
+    wallets = [
+        {
+            "id": uuid.uuid4(), "user_id": user["id"], "wallet_number": f"9{tag[:6]}{i:06d}",
+            "balance": STARTING_BALANCE, "created_at": now, "updated_at": now
+        }
+        for i, user in enumerate(users)
+    ]
+    schedules = [
+        {
+            "id": uuid.uuid4(), "user_id": users[i % args.wallets]["id"],
+            "sender_wallet_id": wallets[i % args.wallets]["id"],
+            "recipient_wallet_id": wallets[(i + 1) % args.wallets]["id"],
+            "amount": 100, "interval": ScheduleInterval.daily, "status": ScheduleStatus.active,
+            "next_run_at": now, "anchor_day": now.day, "created_at": now, "updated_at": now
+        }
+        for i in range(args.schedules)
+    ]
+    async with engine.begin() as conn:
+        await conn.execute(insert(User), users)
+        await conn.execute(insert(Wallet), wallets)
+        await conn.execute(insert(ScheduledTransfer), schedules)
+    return [user["id"] for user in users], [schedule["id"] for schedule in schedules]
+
+async def drain(batch_size: int) -> None:
+    while True:
+        async with AsyncSessionLocal() as db:
+            if await ScheduledTransferService.execute_due(db, batch_size) == 0:
+                return
+
+async def run_round(args: argparse.Namespace, user_ids: list[uuid.UUID], schedule_ids: list[uuid.UUID], batch_size: int) -> dict:
+    due_at = datetime.utcnow()
+    async with engine.begin() as conn:
+        await conn.execute(
+            update(ScheduledTransfer)
+            .where(ScheduledTransfer.id.in_(schedule_ids))
+            .values(next_run_at=due_at, status=ScheduleStatus.active)
+        )
+
+    started = time.perf_counter()
+    await asyncio.gather(*(drain(batch_size) for _ in range(args.workers)))
+    elapsed = time.perf_counter() - started
+
+    async with engine.connect() as conn:
+        executed = await conn.scalar(
+            select(func.count())
+            .select_from(Transaction)
+            .where(Transaction.user_id.in_(user_ids), Transaction.created_at >= due_at)
+        )
+    return {
+        "batch_size": batch_size,
+        "executed": executed,
+        "duration_seconds": round(elapsed, 3),
+        "runs_per_second": round(executed / elapsed, 1)
+    }
+
+async def cleanup(user_ids: list[uuid.UUID]) -> None:
+    async with engine.begin() as conn:
+        await conn.execute(delete(ScheduledTransfer).where(ScheduledTransfer.user_id.in_(user_ids)))
+        await conn.execute(
+            delete(TransactionReference)
+            .where(TransactionReference.reference.in_(select(Transaction.reference).where(Transaction.user_id.in_(user_ids))))
+        )
+        await conn.execute(delete(Transaction).where(Transaction.user_id.in_(user_ids)))
+        await conn.execute(delete(Wallet).where(Wallet.user_id.in_(user_ids)))
+        await conn.execute(delete(User).where(User.id.in_(user_ids)))
+
+async def run(args: argparse.Namespace) -> dict:
+    async with engine.connect() as conn:
+        if conn.dialect.name != "postgresql":
+            raise SystemExit("scheduled_transfers needs a postgres DATABASE_URL")
+        pending = await conn.scalar(
+            select(func.count())
+            .select_from(ScheduledTransfer)
+            .where(ScheduledTransfer.status == ScheduleStatus.active, ScheduledTransfer.next_run_at <= datetime.utcnow() + timedelta(days=1))
+        )
+    if pending:
+        raise SystemExit(f"{pending} real schedules are due; run against a scratch database")
+
+    user_ids, schedule_ids = await seed(args, uuid.uuid4().hex)
+    try:
+        rounds = [await run_round(args, user_ids, schedule_ids, batch_size) for batch_size in args.batch_sizes]
+    finally:
+        await cleanup(user_ids)
+    await engine.dispose()
+
+    return {
+        "environment": environment(),
+        "schedules": args.schedules,
+        "wallets": args.wallets,
+        "workers": args.workers,
+        "rounds": rounds
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Scheduled transfer executor throughput by batch size, with concurrent workers")
+    parser.add_argument("--schedules", type=int, default=5_000)
+    parser.add_argument("--wallets", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=4, help="concurrent executors claiming with SKIP LOCKED")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 25, 200])
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    report = json.dumps(asyncio.run(run(args)), indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report)
+    print(report)
+
+if __name__ == "__main__":
+    main()
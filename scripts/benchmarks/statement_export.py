@@ -0,0 +1,147 @@
+import argparse
+import asyncio
+import json
+import resource
+import subprocess
+import sys
+import time
+import uuid
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.features.api_keys.models import api_key  # noqa: F401
+from app.features.auth.models import user  # noqa: F401
+from app.features.wallet.services.transaction_service import WalletTransactionService
+from app.features.wallet.services.wallet_service import WalletService
+from app.features.wallet.utils.statement import encode_csv_rows, encode_ndjson_rows, encode_statement
+from app.platform.config.settings import get_settings
+
+SEED_USER_SQL = text("""
+    INSERT INTO users (id, email, name, google_id, created_at, updated_at)
+    VALUES (:user_id, :email, 'Statement Bench', :google_id, now(), now())
+""")
+
+SEED_WALLET_SQL = text("""
+    INSERT INTO wallets (id, user_id, wallet_number, balance, created_at, updated_at)
+    VALUES (:wallet_id, :user_id, :wallet_number, 0, now(), now())
+""")
+
+SEED_TRANSACTIONS_SQL = text("""
+    INSERT INTO transactions (id, reference, user_id, amount, status, transaction_type, created_at, updated_at)
+    SELECT
+        gen_random_uuid(),
+        'BENCH_' || :tag || '_' || g,
+        :user_id,
+        100 + (g % 100000),
+        'success',
+        CASE WHEN g % 3 = 0 THEN 'transfer'::transactiontype ELSE 'deposit'::transactiontype END,
+        now() - make_interval(secs => g),
+        now()
+    FROM generate_series(1, :rows) AS g
+""")
+
+CLEANUP_SQL = (
+    text("DELETE FROM transactions WHERE user_id = :user_id"),
+    text("DELETE FROM wallets WHERE user_id = :user_id"),
+    text("DELETE FROM users WHERE id = :user_id"),
+)
+
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+async def seed(rows: int) -> str:
+    engine = create_async_engine(get_settings().DATABASE_URL)
+    user_id = uuid.uuid4()
+    async with engine.begin() as conn:
+        await conn.execute(SEED_USER_SQL, {
+            "user_id": user_id,
+            "email": f"bench-{user_id.hex}@example.com",
+            "google_id": f"bench-{user_id.hex}"
+        })
+        await conn.execute(SEED_WALLET_SQL, {
+            "wallet_id": uuid.uuid4(),
+            "user_id": user_id,
+            "wallet_number": str(user_id.int)[:13]
+        })
+        await conn.execute(SEED_TRANSACTIONS_SQL, {"user_id": user_id, "tag": user_id.hex[:8], "rows": rows})
+    await engine.dispose()
+    return str(user_id)
+
+async def cleanup(user_id: str) -> None:
+    engine = create_async_engine(get_settings().DATABASE_URL)
+    async with engine.begin() as conn:
+        for statement in CLEANUP_SQL:
+            await conn.execute(statement, {"user_id": uuid.UUID(user_id)})
+    await engine.dispose()
+
+async def export(user_id: str, mode: str, export_format: str) -> dict:
+    engine = create_async_engine(get_settings().DATABASE_URL)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    rss_before = peak_rss_mb()
+    started = time.perf_counter()
+    total_bytes = 0
+
+    async with session_factory() as session:
+        wallet = await WalletService.get_wallet_by_user_id(session, uuid.UUID(user_id))
+        if mode == "stream":
+            batches = WalletTransactionService.stream_wallet_transactions(session, wallet.user_id, wallet.id)
+            async for chunk in encode_statement(batches, export_format, wallet.id):
+                total_bytes += len(chunk)
+        else:
+            transactions = await WalletTransactionService.get_wallet_transactions(session, wallet.user_id, wallet.id)
+            encoder = encode_csv_rows if export_format == "csv" else encode_ndjson_rows
+            total_bytes = len(encoder(transactions, wallet.id))
+
+    elapsed = time.perf_counter() - started
+    await engine.dispose()
+    return {
+        "mode": mode,
+        "format": export_format,
+        "bytes": total_bytes,
+        "seconds": round(elapsed, 3),
+        "peak_rss_mb_before": round(rss_before, 1),
+        "peak_rss_mb": round(peak_rss_mb(), 1)
+    }
+
+def run_isolated(user_id: str, mode: str, export_format: str) -> dict:
+    completed = subprocess.run(
+        [sys.executable, "-m", "scripts.benchmarks.statement_export", "--export-only", user_id,
+         "--mode", mode, "--format", export_format],
+        check=True,
+        capture_output=True,
+        text=True
+    )
+    return json.loads(completed.stdout)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark statement export memory usage against DATABASE_URL")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--format", dest="export_format", choices=["csv", "ndjson"], default="csv")
+    parser.add_argument("--mode", choices=["stream", "list"], action="append")
+    parser.add_argument("--export-only", metavar="USER_ID")
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    if args.export_only:
+        mode = (args.mode or ["stream"])[0]
+        print(json.dumps(asyncio.run(export(args.export_only, mode, args.export_format))))
+        return
+
+    user_id = asyncio.run(seed(args.rows))
+    try:
+        results = {
+            "rows": args.rows,
+            "runs": [run_isolated(user_id, mode, args.export_format) for mode in args.mode or ["stream", "list"]]
+        }
+    finally:
+        asyncio.run(cleanup(user_id))
+
+    report = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report)
+    print(report)
+
+if __name__ == "__main__":
+    main()
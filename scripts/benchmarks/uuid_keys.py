@@ -0,0 +1,99 @@
+import argparse
+import asyncio
+import json
+import time
+import uuid
+
+from app.features.payments.utils.helpers import generate_transaction_reference
+from app.platform.db import engine
+from app.platform.db.ids import uuid7
+from scripts.benchmarks.harness import environment, measure
+
+GENERATORS = {
+    "uuid4": (uuid.uuid4, lambda: f"TXN_{uuid.uuid4().hex}"),
+    "uuid7": (uuid7, generate_transaction_reference),
+}
+
+def generation_costs(rounds: int, min_round_seconds: float) -> dict:
+    return {
+        f"{name}_{kind}": measure(fn, rounds, min_round_seconds)["min_ns"]
+        for name, generators in GENERATORS.items()
+        for kind, fn in zip(("id", "reference"), generators, strict=True)
+    }
+
+async def load(driver, schema: str, name: str, rows: int, batch_size: int) -> dict:
+    new_id, new_reference = GENERATORS[name]
+    table = f"{schema}.{name}"
+    await driver.execute(
+        f"CREATE TABLE {table} (id uuid PRIMARY KEY, reference varchar(255) NOT NULL UNIQUE, created_at timestamp NOT NULL)"
+    )
+    records = [(new_id(), new_reference()) for _ in range(rows)]
+
+    started = time.perf_counter()
+    for start in range(0, rows, batch_size):
+        await driver.executemany(
+            f"INSERT INTO {table} (id, reference, created_at) VALUES ($1, $2, now())",
+            records[start:start + batch_size]
+        )
+    elapsed = time.perf_counter() - started
+
+    sizes = await driver.fetchrow(
+        """
+        SELECT pg_relation_size($1::regclass) AS heap,
+               pg_relation_size($2::regclass) AS id_index,
+               pg_relation_size($3::regclass) AS reference_index
+        """,
+        table, f"{schema}.{name}_pkey", f"{schema}.{name}_reference_key"
+    )
+    return {
+        "rows_per_second": round(rows / elapsed),
+        "heap_bytes": sizes["heap"],
+        "id_index_bytes": sizes["id_index"],
+        "reference_index_bytes": sizes["reference_index"]
+    }
+
+async def run(args: argparse.Namespace) -> dict:
+    schema = f"bench_uuid_{uuid.uuid4().hex[:8]}"
+    inserts = {}
+    async with engine.connect() as conn:
+        if conn.dialect.driver != "asyncpg":
+            raise SystemExit("uuid_keys needs a postgresql+asyncpg DATABASE_URL")
+        driver = (await conn.get_raw_connection()).driver_connection
+        await driver.execute(f"CREATE SCHEMA {schema}")
+        try:
+            for name in GENERATORS:
+                inserts[name] = await load(driver, schema, name, args.rows, args.batch_size)
+        finally:
+            await driver.execute(f"DROP SCHEMA {schema} CASCADE")
+    await engine.dispose()
+
+    return {
+        "environment": environment(),
+        "rows": args.rows,
+        "batch_size": args.batch_size,
+        "generation_ns": generation_costs(args.rounds, args.min_round_seconds),
+        "inserts": inserts,
+        "uuid7_vs_uuid4": {
+            metric: round(inserts["uuid7"][metric] / inserts["uuid4"][metric], 3)
+            for metric in inserts["uuid4"]
+            if inserts["uuid4"][metric]
+        }
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare uuid4 and uuid7 keys: generation cost, insert throughput and index size")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--batch-size", type=int, default=1_000, help="rows per executemany call")
+    parser.add_argument("--rounds", type=int, default=15)
+    parser.add_argument("--min-round-seconds", type=float, default=0.05)
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    report = json.dumps(asyncio.run(run(args)), indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report)
+    print(report)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+import argparse
+import asyncio
+import hashlib
+import hmac
+import json
+import os
+from contextlib import asynccontextmanager
+
+import httpx
+import uvicorn
+from fastapi import BackgroundTasks, FastAPI, Form, Header
+from fastapi.responses import JSONResponse
+
+fake_app = FastAPI()
+fake_app.state.latency_seconds = 0.0
+fake_app.state.webhook_url = None
+fake_app.state.webhook_secret = ""
+fake_app.state.transfer_batches = []
+fake_app.state.transfers = {}
+
+async def simulate_latency() -> None:
+    if fake_app.state.latency_seconds:
+        await asyncio.sleep(fake_app.state.latency_seconds)
+
+@fake_app.post("/paystack/transaction/initialize")
+async def initialize_transaction(payload: dict):
+    await simulate_latency()
+    return {
+        "status": True,
+        "message": "Authorization URL created",
+        "data": {
+            "authorization_url": f"https://checkout.paystack.test/{payload['reference']}",
+            "access_code": payload["reference"],
+            "reference": payload["reference"]
+        }
+    }
+
+@fake_app.get("/paystack/transaction/verify/{reference}")
+async def verify_transaction(reference: str):
+    await simulate_latency()
+    return {"status": True, "data": {"reference": reference, "status": "success"}}
+
+@fake_app.post("/paystack/transferrecipient/bulk")
+async def create_transfer_recipients(payload: dict):
+    await simulate_latency()
+    return {
+        "status": True,
+        "message": "Recipients added successfully",
+        "data": {
+            "success": [
+                {
+                    "recipient_code": f"RCP_{recipient['bank_code']}{recipient['account_number']}",
+                    "type": recipient["type"],
+                    "name": recipient["name"],
+                    "currency": recipient["currency"],
+                    "details": {
+                        "account_number": recipient["account_number"],
+                        "account_name": recipient["name"],
+                        "bank_code": recipient["bank_code"]
+                    }
+                }
+                for recipient in payload["batch"]
+            ],
+            "errors": []
+        }
+    }
+
+def queue_transfers(requested: list[dict], currency: str, background_tasks: BackgroundTasks) -> list[dict] | None:
+    if any(transfer["reference"] in fake_app.state.transfers for transfer in requested):
+        return None
+    transfers = [
+        {
+            "reference": transfer["reference"],
+            "recipient": transfer["recipient"],
+            "amount": transfer["amount"],
+            "transfer_code": f"TRF_{transfer['reference'][-16:]}",
+            "currency": currency,
+            "status": "pending"
+        }
+        for transfer in requested
+    ]
+    fake_app.state.transfer_batches.append(len(transfers))
+    fake_app.state.transfers.update((transfer["reference"], transfer) for transfer in transfers)
+    if fake_app.state.webhook_url:
+        background_tasks.add_task(deliver_transfer_events, transfers)
+    return transfers
+
+@fake_app.post("/paystack/transfer/bulk")
+async def initiate_bulk_transfer(payload: dict, background_tasks: BackgroundTasks):
+    await simulate_latency()
+    transfers = queue_transfers(payload["transfers"], payload["currency"], background_tasks)
+    if transfers is None:
+        return JSONResponse({"status": False, "message": "Duplicate Transfer Reference"}, status_code=400)
+    return {"status": True, "message": f"{len(transfers)} transfers queued.", "data": transfers}
+
+@fake_app.post("/paystack/transfer")
+async def initiate_transfer(payload: dict, background_tasks: BackgroundTasks):
+    await simulate_latency()
+    transfers = queue_transfers([payload], payload["currency"], background_tasks)
+    if transfers is None:
+        return JSONResponse({"status": False, "message": "Duplicate Transfer Reference"}, status_code=400)
+    return {"status": True, "message": "Transfer has been queued", "data": transfers[0]}
+
+@fake_app.get("/paystack/transfer/verify/{reference}")
+async def verify_transfer(reference: str):
+    await simulate_latency()
+    transfer = fake_app.state.transfers.get(reference)
+    if transfer is None:
+        return JSONResponse({"status": False, "message": "Transfer not found"}, status_code=404)
+    return {"status": True, "message": "Transfer retrieved", "data": transfer}
+
+async def deliver_transfer_events(transfers: list[dict]) -> None:
+    async with httpx.AsyncClient() as client:
+        for transfer in transfers:
+            transfer["status"] = "success"
+            body = json.dumps({"event": "transfer.success", "data": transfer}).encode()
+            signature = hmac.new(fake_app.state.webhook_secret.encode(), body, hashlib.sha512).hexdigest()
+            await client.post(
+                fake_app.state.webhook_url,
+                content=body,
+                headers={"x-paystack-signature": signature, "content-type": "application/json"}
+            )
+
+@fake_app.post("/google/token")
+async def exchange_code(code: str = Form(...)):
+    await simulate_latency()
+    return {"access_token": code, "token_type": "Bearer", "expires_in": 3599}
+
+@fake_app.get("/google/userinfo")
+async def userinfo(authorization: str = Header(...)):
+    await simulate_latency()
+    subject = authorization.removeprefix("Bearer ")
+    return {"id": subject, "email": f"{subject}@loadtest.example", "name": f"Load Test {subject}"}
+
+def upstream_env(base_url: str) -> dict[str, str]:
+    return {
+        "PAYSTACK_BASE_URL": f"{base_url}/paystack",
+        "GOOGLE_TOKEN_URL": f"{base_url}/google/token",
+        "GOOGLE_USERINFO_URL": f"{base_url}/google/userinfo"
+    }
+
+@asynccontextmanager
+async def fake_upstreams(
+    host: str,
+    port: int,
+    latency_ms: float,
+    webhook_url: str | None = None,
+    webhook_secret: str = ""
+):
+    fake_app.state.latency_seconds = latency_ms / 1000
+    fake_app.state.webhook_url = webhook_url
+    fake_app.state.webhook_secret = webhook_secret
+    server = uvicorn.Server(uvicorn.Config(fake_app, host=host, port=port, log_level="warning", lifespan="off"))
+    serving = asyncio.create_task(server.serve())
+    while not server.started:
+        if serving.done():
+            serving.result()
+        await asyncio.sleep(0.01)
+    try:
+        yield f"http://{host}:{port}"
+    finally:
+        server.should_exit = True
+        await serving
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve fake Paystack and Google endpoints for load tests")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="delay added to every upstream response")
+    parser.add_argument("--webhook-url", help="paystack webhook endpoint that receives transfer.success for every bulk transfer")
+    parser.add_argument("--webhook-secret", default=os.environ.get("PAYSTACK_WEBHOOK_SECRET", ""))
+    args = parser.parse_args()
+
+    for name, value in upstream_env(f"http://{args.host}:{args.port}").items():
+        print(f"{name}={value}")
+    fake_app.state.latency_seconds = args.latency_ms / 1000
+    fake_app.state.webhook_url = args.webhook_url
+    fake_app.state.webhook_secret = args.webhook_secret
+    uvicorn.run(fake_app, host=args.host, port=args.port, log_level="warning")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,324 @@
+import argparse
+import asyncio
+import hashlib
+import hmac
+import itertools
+import json
+import math
+import os
+import statistics
+import subprocess
+import time
+import uuid
+from collections import Counter
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import partial
+
+import httpx
+from sqlalchemy import select
+
+from scripts.loadtest.fake_upstreams import fake_upstreams, upstream_env
+
+API = "/api/v1"
+MAX_ACTIVE_KEYS = 5
+TRANSFER_AMOUNT = 100
+DEPOSIT_AMOUNT = 5000
+
+@dataclass
+class LoadUser:
+    user_id: str
+    headers: dict[str, str]
+
+class LoadSession:
+
+    def __init__(self, client: httpx.AsyncClient, engine, webhook_secret: str, concurrency: int, deposit_auth: str):
+        self.client = client
+        self.engine = engine
+        self.webhook_secret = webhook_secret
+        self.concurrency = concurrency
+        self.deposit_auth = deposit_auth
+        self.run_id = uuid.uuid4().hex[:8]
+        self._codes = itertools.count()
+
+    def next_code(self) -> str:
+        return f"lt{self.run_id}{next(self._codes)}"
+
+    async def gather(self, coros) -> list:
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def bounded(coro):
+            async with semaphore:
+                return await coro
+
+        return await asyncio.gather(*(bounded(coro) for coro in coros))
+
+    async def login(self) -> LoadUser:
+        response = await self.client.get(f"{API}/auth/google/callback", params={"code": self.next_code()})
+        response.raise_for_status()
+        data = response.json()["data"]
+        return LoadUser(data["user"]["id"], {"Authorization": f"Bearer {data['access_token']}"})
+
+    async def create_api_key(self, user: LoadUser) -> LoadUser:
+        response = await self.client.post(
+            f"{API}/keys/create",
+            headers=user.headers,
+            json={"name": "loadtest", "permissions": ["deposit", "transfer", "read"], "expiry": "1D"}
+        )
+        response.raise_for_status()
+        return LoadUser(user.user_id, {"x-api-key": response.json()["data"]["api_key"]})
+
+    async def deposit(self, user: LoadUser, amount: int) -> str:
+        response = await self.client.post(f"{API}/wallet/deposit", headers=user.headers, json={"amount": amount})
+        response.raise_for_status()
+        return response.json()["data"]["reference"]
+
+    def charge_success(self, reference: str, amount: int) -> dict:
+        body = json.dumps({
+            "event": "charge.success",
+            "data": {"reference": reference, "amount": amount, "status": "success"}
+        }).encode()
+        signature = hmac.new(self.webhook_secret.encode(), body, hashlib.sha512).hexdigest()
+        return {
+            "content": body,
+            "headers": {"x-paystack-signature": signature, "content-type": "application/json"}
+        }
+
+    async def settle(self, reference: str, amount: int) -> None:
+        response = await self.client.post(f"{API}/payments/paystack/webhook", **self.charge_success(reference, amount))
+        response.raise_for_status()
+
+    async def funded_user(self, amount: int, deposits: int = 1) -> LoadUser:
+        user = await self.login()
+        for _ in range(deposits):
+            await self.settle(await self.deposit(user, amount), amount)
+        return user
+
+    async def wallet_number(self, user: LoadUser) -> str:
+        from app.features.wallet.models.wallet import Wallet
+
+        async with self.engine.connect() as conn:
+            result = await conn.execute(select(Wallet.wallet_number).where(Wallet.user_id == uuid.UUID(user.user_id)))
+            return result.scalar_one()
+
+async def prepare_login(session: LoadSession, count: int) -> list:
+    return [
+        partial(session.client.get, f"{API}/auth/google/callback", params={"code": session.next_code()})
+        for _ in range(count)
+    ]
+
+async def prepare_api_key_create(session: LoadSession, count: int) -> list:
+    users = await session.gather(session.login() for _ in range(math.ceil(count / MAX_ACTIVE_KEYS)))
+    return [
+        partial(
+            session.client.post,
+            f"{API}/keys/create",
+            headers=users[i // MAX_ACTIVE_KEYS].headers,
+            json={"name": f"loadtest-{i}", "permissions": ["read"], "expiry": "1D"}
+        )
+        for i in range(count)
+    ]
+
+async def prepare_deposit_init(session: LoadSession, count: int) -> list:
+    users = await session.gather(session.login() for _ in range(session.concurrency))
+    if session.deposit_auth == "api_key":
+        users = await session.gather(session.create_api_key(user) for user in users)
+    return [
+        partial(
+            session.client.post,
+            f"{API}/wallet/deposit",
+            headers=users[i % len(users)].headers,
+            json={"amount": DEPOSIT_AMOUNT}
+        )
+        for i in range(count)
+    ]
+
+async def prepare_webhook_settlement(session: LoadSession, count: int) -> list:
+    users = await session.gather(session.login() for _ in range(session.concurrency))
+    references = await session.gather(
+        session.deposit(users[i % len(users)], DEPOSIT_AMOUNT) for i in range(count)
+    )
+    return [
+        partial(
+            session.client.post,
+            f"{API}/payments/paystack/webhook",
+            **session.charge_success(reference, DEPOSIT_AMOUNT)
+        )
+        for reference in references
+    ]
+
+async def prepare_transfer(session: LoadSession, count: int) -> list:
+    per_sender = math.ceil(count / session.concurrency) * TRANSFER_AMOUNT
+    senders = await session.gather(session.funded_user(per_sender) for _ in range(session.concurrency))
+    recipient = await session.wallet_number(await session.login())
+    return [
+        partial(
+            session.client.post,
+            f"{API}/wallet/transfer",
+            headers=senders[i % len(senders)].headers,
+            json={"wallet_number": recipient, "amount": TRANSFER_AMOUNT}
+        )
+        for i in range(count)
+    ]
+
+async def prepare_withdrawal(session: LoadSession, count: int) -> list:
+    per_user = math.ceil(count / session.concurrency) * TRANSFER_AMOUNT
+    users = await session.gather(session.funded_user(per_user) for _ in range(session.concurrency))
+    return [
+        partial(
+            session.client.post,
+            f"{API}/wallet/withdraw",
+            headers=users[i % len(users)].headers,
+            json={
+                "amount": TRANSFER_AMOUNT,
+                "bank_code": "058",
+                "account_number": f"{i % len(users):010d}",
+                "account_name": "Load Test"
+            }
+        )
+        for i in range(count)
+    ]
+
+async def prepare_history(session: LoadSession, count: int, depth: int) -> list:
+    users = await session.gather(
+        session.funded_user(DEPOSIT_AMOUNT, deposits=depth) for _ in range(session.concurrency)
+    )
+    return [
+        partial(session.client.get, f"{API}/wallet/transactions", headers=users[i % len(users)].headers)
+        for i in range(count)
+    ]
+
+SCENARIOS = {
+    "login": prepare_login,
+    "api_key_create": prepare_api_key_create,
+    "deposit_init": prepare_deposit_init,
+    "webhook_settlement": prepare_webhook_settlement,
+    "transfer": prepare_transfer,
+    "withdrawal": prepare_withdrawal,
+    "history": prepare_history,
+}
+
+def percentile(ordered: list[float], fraction: float) -> float:
+    return ordered[max(math.ceil(fraction * len(ordered)) - 1, 0)]
+
+def summarize(latencies: list[float], statuses: Counter, elapsed: float) -> dict:
+    ordered = sorted(latencies)
+    errors = sum(count for status, count in statuses.items() if not status.startswith("2"))
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "duration_seconds": round(elapsed, 3),
+        "throughput_rps": round(len(ordered) / elapsed, 1) if elapsed else 0.0,
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3) if ordered else None,
+        "p50_ms": round(percentile(ordered, 0.50) * 1000, 3) if ordered else None,
+        "p95_ms": round(percentile(ordered, 0.95) * 1000, 3) if ordered else None,
+        "p99_ms": round(percentile(ordered, 0.99) * 1000, 3) if ordered else None,
+        "max_ms": round(ordered[-1] * 1000, 3) if ordered else None,
+        "status_codes": dict(sorted(statuses.items()))
+    }
+
+async def drive(requests: list, concurrency: int) -> dict:
+    latencies = []
+    statuses = Counter()
+    pending = iter(requests)
+
+    async def worker():
+        for request in pending:
+            started = time.perf_counter()
+            try:
+                response = await request()
+                status = str(response.status_code)
+            except httpx.HTTPError as e:
+                status = type(e).__name__
+            latencies.append(time.perf_counter() - started)
+            statuses[status] += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, statuses, time.perf_counter() - started)
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+async def run(args) -> dict:
+    async with AsyncExitStack() as stack:
+        if not args.base_url:
+            upstream_url = await stack.enter_async_context(
+                fake_upstreams(args.upstream_host, args.upstream_port, args.upstream_latency_ms)
+            )
+            os.environ.update(upstream_env(upstream_url))
+
+        from app.platform.config.settings import get_settings
+        from app.platform.db import engine
+
+        if args.base_url:
+            client = httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout)
+            stack.push_async_callback(engine.dispose)
+        else:
+            from app.main import app
+
+            await stack.enter_async_context(app.router.lifespan_context(app))
+            client = httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app, raise_app_exceptions=False), base_url="http://loadtest", timeout=args.timeout
+            )
+        client = await stack.enter_async_context(client)
+        session = LoadSession(
+            client,
+            engine,
+            get_settings().PAYSTACK_WEBHOOK_SECRET,
+            args.concurrency,
+            args.deposit_auth
+        )
+
+        report = {
+            "started_at": datetime.now(UTC).isoformat(),
+            "commit": git_commit(),
+            "target": args.base_url or "in-process",
+            "concurrency": args.concurrency,
+            "iterations": args.iterations,
+            "warmup": args.warmup,
+            "deposit_auth": args.deposit_auth,
+            "upstream_latency_ms": None if args.base_url else args.upstream_latency_ms,
+            "scenarios": {}
+        }
+        for name in args.scenarios:
+            prepare = SCENARIOS[name]
+            count = args.iterations + args.warmup
+            if name == "history":
+                requests = await prepare(session, count, args.history_depth)
+            else:
+                requests = await prepare(session, count)
+            await drive(requests[:args.warmup], args.concurrency)
+            report["scenarios"][name] = await drive(requests[args.warmup:], args.concurrency)
+        return report
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Drive load scenarios against the API and report latency percentiles per scenario")
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--iterations", type=int, default=500, help="measured requests per scenario")
+    parser.add_argument("--warmup", type=int, default=20, help="unmeasured requests per scenario before timing starts")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--history-depth", type=int, default=20, help="settled deposits per user before history reads")
+    parser.add_argument("--deposit-auth", choices=["jwt", "api_key"], default="jwt", help="credential used by deposit_init")
+    parser.add_argument("--base-url", help="running server to target; by default the app is driven in-process")
+    parser.add_argument("--upstream-host", default="127.0.0.1")
+    parser.add_argument("--upstream-port", type=int, default=8765)
+    parser.add_argument("--upstream-latency-ms", type=float, default=0.0)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    report = json.dumps(asyncio.run(run(args)), indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report)
+    print(report)
+
+if __name__ == "__main__":
+    main()
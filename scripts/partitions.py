@@ -0,0 +1,79 @@
+import argparse
+import asyncio
+import json
+from datetime import date, datetime
+
+from app.features.payments.models.transaction import transaction_partitions
+from app.platform.config.settings import settings
+from app.platform.db import engine
+from app.platform.db.partitions import add_months, month_start
+
+
+def parse_month(value: str) -> date:
+    return month_start(datetime.strptime(value, "%Y-%m"))
+
+async def run(args: argparse.Namespace) -> dict:
+    async with engine.connect() as conn:
+        if not await transaction_partitions.is_partitioned(conn):
+            raise SystemExit("transactions is not partitioned; run alembic upgrade head against a postgres DATABASE_URL")
+
+        if args.command == "ensure":
+            first = args.start or month_start(datetime.utcnow())
+            created = await transaction_partitions.ensure(
+                conn, first, add_months(month_start(datetime.utcnow()), args.months_ahead)
+            )
+            await conn.commit()
+            report = {"created": created}
+        elif args.command == "archive":
+            before = args.before or add_months(month_start(datetime.utcnow()), -args.keep_months)
+            candidates = [
+                partition.name for partition in await transaction_partitions.existing(conn)
+                if not partition.is_default and partition.upper <= before
+            ]
+            if args.dry_run:
+                report = {"before": before.isoformat(), "would_archive": candidates}
+            else:
+                archived = await transaction_partitions.archive(conn, before, args.schema, args.tablespace)
+                report = {"before": before.isoformat(), "archived": archived}
+        else:
+            report = {}
+
+        report["partitions"] = [
+            {
+                "name": partition.name,
+                "from": partition.lower.isoformat() if partition.lower else None,
+                "to": partition.upper.isoformat() if partition.upper else None
+            }
+            for partition in await transaction_partitions.existing(conn)
+        ]
+    await engine.dispose()
+    return report
+
+def main() -> None:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--output")
+    parser = argparse.ArgumentParser(description="Manage the monthly partitions of the transactions table")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", parents=[common], help="show attached partitions and their ranges")
+
+    ensure = commands.add_parser("ensure", parents=[common], help="create missing monthly partitions up to --months-ahead")
+    ensure.add_argument("--start", type=parse_month, help="first month to cover as YYYY-MM, defaults to the current month")
+    ensure.add_argument("--months-ahead", type=int, default=settings.TRANSACTION_PARTITION_MONTHS_AHEAD)
+
+    archive = commands.add_parser("archive", parents=[common], help="detach old partitions and move them to the archive schema")
+    archive.add_argument("--keep-months", type=int, default=12, help="full months to keep attached before the current one")
+    archive.add_argument("--before", type=parse_month, help="archive partitions that end on or before this month (YYYY-MM)")
+    archive.add_argument("--schema", default=settings.TRANSACTION_ARCHIVE_SCHEMA)
+    archive.add_argument("--tablespace", help="also move archived partitions to this tablespace")
+    archive.add_argument("--dry-run", action="store_true")
+
+    args = parser.parse_args()
+
+    report = json.dumps(asyncio.run(run(args)), indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report)
+    print(report)
+
+if __name__ == "__main__":
+    main()
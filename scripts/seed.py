@@ -0,0 +1,231 @@
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import random
+import time
+import uuid
+from collections.abc import Iterator, Sequence
+from datetime import datetime, timedelta
+
+from passlib.utils.binary import ab64_encode
+from sqlalchemy import JSON, Table, insert
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.features.api_keys.models.api_key import APIKey
+from app.features.api_keys.services.api_key_service import APIKeyService
+from app.features.auth.models.user import User
+from app.features.payments.models.transaction import (
+    Transaction,
+    TransactionStatus,
+    TransactionType,
+    transaction_partitions,
+)
+from app.features.wallet.models.wallet import Wallet
+from app.features.wallet.utils.wallet_number import WALLET_NUMBER_LENGTH, luhn_check_digit
+from app.platform.auth.jwt_service import JWTService
+from app.platform.db import engine
+from app.platform.db.partitions import month_start
+
+USER_COLUMNS = ("id", "email", "name", "google_id", "picture", "created_at", "updated_at")
+WALLET_COLUMNS = ("id", "user_id", "wallet_number", "balance", "created_at", "updated_at")
+API_KEY_COLUMNS = ("id", "user_id", "key_hash", "name", "permissions", "expires_at", "is_active", "created_at", "updated_at")
+TRANSACTION_COLUMNS = (
+    "id", "reference", "user_id", "amount", "email", "status", "transaction_type", "authorization_url",
+    "sender_wallet_id", "recipient_wallet_id", "paid_at", "created_at", "updated_at"
+)
+
+DEPOSIT_SHARE = 0.65
+DEPOSIT_STATUSES = ((TransactionStatus.success, 0.88), (TransactionStatus.pending, 0.08), (TransactionStatus.failed, 0.04))
+KEY_PERMISSIONS = (["read"], ["read", "deposit"], ["read", "deposit", "transfer"])
+MAX_ACTIVE_KEYS = 5
+
+class BulkLoader:
+
+    def __init__(self, conn: AsyncConnection, chunk_size: int):
+        self.conn = conn
+        self.chunk_size = chunk_size
+        self.driver = None
+        self.rows_loaded: dict[str, int] = {}
+
+    async def start(self) -> None:
+        if self.conn.dialect.driver == "asyncpg":
+            raw = await self.conn.get_raw_connection()
+            self.driver = raw.driver_connection
+
+    async def load(self, table: Table, columns: Sequence[str], rows: Iterator[tuple]) -> None:
+        pending = None
+        while True:
+            chunk = await asyncio.to_thread(list, itertools.islice(rows, self.chunk_size))
+            if pending is not None:
+                await pending
+            if not chunk:
+                return
+            pending = asyncio.create_task(self._flush(table, columns, chunk))
+
+    async def _flush(self, table: Table, columns: Sequence[str], chunk: list[tuple]) -> None:
+        if self.driver is not None:
+            json_positions = [i for i, name in enumerate(columns) if isinstance(table.c[name].type, JSON)]
+            if json_positions:
+                chunk = [
+                    tuple(json.dumps(value) if i in json_positions else value for i, value in enumerate(row))
+                    for row in chunk
+                ]
+            await self.driver.copy_records_to_table(table.name, records=chunk, columns=list(columns))
+        else:
+            await self.conn.execute(insert(table), [dict(zip(columns, row, strict=True)) for row in chunk])
+            await self.conn.commit()
+        self.rows_loaded[table.name] = self.rows_loaded.get(table.name, 0) + len(chunk)
+
+class SeedPlan:
+
+    def __init__(self, args: argparse.Namespace):
+        self.rng = random.Random(args.seed)
+        self.batch = f"{self.rng.getrandbits(32):08x}"
+        self.users = args.users
+        self.now = datetime.utcnow()
+        self.days = args.days
+        self.user_ids = [self.new_uuid() for _ in range(self.users)]
+        self.wallet_ids = [self.new_uuid() for _ in range(self.users)]
+        self.emails = [f"seed-{self.batch}-{i}@seed.example" for i in range(self.users)]
+        self.transaction_counts = self.distribute(args.transactions)
+        self.transaction_counts[0] += args.heavy_user_transactions
+        self.api_keys = args.api_keys
+        self.sample_api_key = APIKeyService.generate_api_key()
+        self.sample_key_hash = APIKeyService.hash_key(self.sample_api_key)
+
+    def new_uuid(self) -> uuid.UUID:
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def past(self, max_days: float) -> datetime:
+        return self.now - timedelta(seconds=self.rng.random() * max_days * 86400)
+
+    def distribute(self, total: int) -> list[int]:
+        weights = [self.rng.paretovariate(1.2) for _ in range(self.users)]
+        scale = total / sum(weights)
+        counts = [int(weight * scale) for weight in weights]
+        for i in self.rng.sample(range(self.users), total - sum(counts)):
+            counts[i] += 1
+        return counts
+
+    def users_rows(self) -> Iterator[tuple]:
+        for i, user_id in enumerate(self.user_ids):
+            created = self.past(self.days)
+            yield (user_id, self.emails[i], f"Seed User {i}", f"seed-{self.batch}-{i}", None, created, created)
+
+    def wallet_rows(self) -> Iterator[tuple]:
+        bodies = self.rng.sample(range(10 ** (WALLET_NUMBER_LENGTH - 1)), self.users)
+        for user_id, wallet_id, body in zip(self.user_ids, self.wallet_ids, bodies, strict=True):
+            digits = f"{body:0{WALLET_NUMBER_LENGTH - 1}d}"
+            balance = int(self.rng.lognormvariate(12, 2))
+            created = self.past(self.days)
+            yield (wallet_id, user_id, digits + luhn_check_digit(digits), balance, created, created)
+
+    def api_key_rows(self) -> Iterator[tuple]:
+        _, scheme, rounds, _, checksum = self.sample_key_hash.split("$")
+        for i in range(self.api_keys):
+            if i == 0:
+                key_hash = self.sample_key_hash
+            else:
+                key_hash = f"${scheme}${rounds}${ab64_encode(self.rng.randbytes(16)).decode()}${checksum}"
+            created = self.past(min(self.days, 365))
+            expires = created + timedelta(days=self.rng.choice((1, 30, 365)))
+            if i == 0:
+                expires = self.now + timedelta(days=365)
+            yield (
+                self.new_uuid(), self.user_ids[i // MAX_ACTIVE_KEYS], key_hash, f"seed-key-{i}",
+                self.rng.choice(KEY_PERMISSIONS), expires, True, created, created
+            )
+
+    def transaction_rows(self) -> Iterator[tuple]:
+        statuses = [status for status, _ in DEPOSIT_STATUSES]
+        status_weights = [weight for _, weight in DEPOSIT_STATUSES]
+        for i, count in enumerate(self.transaction_counts):
+            user_id = self.user_ids[i]
+            for _ in range(count):
+                created = self.past(self.days)
+                amount = max(100, int(self.rng.lognormvariate(13, 1.2)))
+                if self.rng.random() < DEPOSIT_SHARE:
+                    status = self.rng.choices(statuses, status_weights)[0]
+                    reference = f"TXN_{self.new_uuid().hex}"
+                    paid_at = created + timedelta(seconds=self.rng.randint(5, 300)) if status is TransactionStatus.success else None
+                    yield (
+                        self.new_uuid(), reference, user_id, amount, self.emails[i], status.name,
+                        TransactionType.deposit.name, f"https://checkout.paystack.com/{reference[4:19]}",
+                        None, None, paid_at, created, paid_at or created
+                    )
+                else:
+                    recipient = self.rng.randrange(self.users - 1)
+                    recipient += recipient >= i
+                    yield (
+                        self.new_uuid(), f"TXN_{self.new_uuid()}", user_id, amount, None,
+                        TransactionStatus.success.name, TransactionType.transfer.name, None,
+                        self.wallet_ids[i], self.wallet_ids[recipient], None, created, created
+                    )
+
+async def seed(args: argparse.Namespace) -> dict:
+    if args.api_keys > args.users * MAX_ACTIVE_KEYS:
+        raise SystemExit(f"--api-keys can be at most {MAX_ACTIVE_KEYS} per user ({args.users * MAX_ACTIVE_KEYS})")
+    if args.users < 2:
+        raise SystemExit("--users must be at least 2")
+
+    plan = SeedPlan(args)
+    timings = {}
+    async with engine.connect() as conn:
+        if await transaction_partitions.is_partitioned(conn):
+            await transaction_partitions.ensure(conn, plan.now - timedelta(days=args.days), month_start(plan.now))
+            await conn.commit()
+        loader = BulkLoader(conn, args.chunk_size)
+        await loader.start()
+        for table, columns, rows in (
+            (User.__table__, USER_COLUMNS, plan.users_rows()),
+            (Wallet.__table__, WALLET_COLUMNS, plan.wallet_rows()),
+            (APIKey.__table__, API_KEY_COLUMNS, plan.api_key_rows()),
+            (Transaction.__table__, TRANSACTION_COLUMNS, plan.transaction_rows()),
+        ):
+            started = time.perf_counter()
+            await loader.load(table, columns, rows)
+            timings[table.name] = round(time.perf_counter() - started, 2)
+    await engine.dispose()
+
+    heavy_user = plan.user_ids[0]
+    return {
+        "batch": plan.batch,
+        "method": "copy" if loader.driver is not None else "multi-row insert",
+        "rows": loader.rows_loaded,
+        "seconds": timings,
+        "rows_per_second": {
+            name: round(count / timings[name]) if timings[name] else None
+            for name, count in loader.rows_loaded.items()
+        },
+        "heavy_user": {
+            "id": str(heavy_user),
+            "transactions": plan.transaction_counts[0],
+            "access_token": JWTService.create_access_token({"user_id": str(heavy_user), "email": plan.emails[0]}),
+            "api_key": plan.sample_api_key if args.api_keys else None
+        },
+        "max_user_transactions": max(plan.transaction_counts),
+        "median_user_transactions": sorted(plan.transaction_counts)[math.ceil(len(plan.transaction_counts) / 2) - 1]
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bulk-load production-scale users, wallets, api keys and transactions into DATABASE_URL")
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--api-keys", type=int, default=5_000, help="active keys, at most five per user")
+    parser.add_argument("--transactions", type=int, default=1_000_000, help="spread across users with a long-tailed distribution")
+    parser.add_argument("--heavy-user-transactions", type=int, default=0, help="extra transactions for the first user")
+    parser.add_argument("--days", type=int, default=730, help="history window for created_at")
+    parser.add_argument("--chunk-size", type=int, default=50_000)
+    parser.add_argument("--seed", type=int, help="random seed for a reproducible dataset")
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    report = json.dumps(asyncio.run(seed(args)), indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report)
+    print(report)
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,16 @@
+import asyncio
+import uuid
+from datetime import datetime
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import delete, event, insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.features.auth.models.user import User
+from app.features.auth.schemas.auth import GoogleUserInfo
+from app.features.auth.services.auth_service import AuthService
+from app.features.wallet.models.wallet import Wallet
 
 
 @pytest.mark.asyncio
@@ -9,3 +20,78 @@ async def test_google_login_endpoint(client: AsyncClient):
     data = response.json()
     assert "google_auth_url" in data
     assert "accounts.google.com" in data["google_auth_url"]
+
+async def login(db, user_info: GoogleUserInfo, assert_max_queries) -> tuple[User, list[str], int]:
+    commits = []
+    event.listen(db.sync_session, "after_commit", lambda session: commits.append(session))
+    with assert_max_queries(10) as stats:
+        user = await AuthService.get_or_create_user(db, user_info)
+    return user, stats.statements, len(commits)
+
+@pytest.mark.asyncio
+async def test_first_login_creates_the_user_and_wallet_in_one_commit(db_sessionmaker, assert_max_queries):
+    user_info = GoogleUserInfo(sub="login-first", email="first@example.com", name="First Login")
+    async with db_sessionmaker() as db:
+        user, _, commits = await login(db, user_info, assert_max_queries)
+        assert commits == 1
+
+    async with db_sessionmaker() as db:
+        stored = await db.scalar(select(User).where(User.google_id == "login-first"))
+        assert (stored.id, stored.email, stored.name) == (user.id, "first@example.com", "First Login")
+        assert await db.scalar(select(Wallet.id).where(Wallet.user_id == user.id))
+
+@pytest.mark.asyncio
+async def test_unchanged_login_does_not_write(db_sessionmaker, seeded_users, assert_max_queries):
+    seeded = seeded_users[0]
+    async with db_sessionmaker() as db:
+        existing = await db.scalar(select(User).where(User.id == seeded.id))
+        user_info = GoogleUserInfo(sub=existing.google_id, email=existing.email, name=existing.name)
+
+    async with db_sessionmaker() as db:
+        user, statements, commits = await login(db, user_info, assert_max_queries)
+        assert user.id == seeded.id
+        assert user.updated_at == existing.updated_at
+        assert commits == 0
+        assert not [statement for statement in statements if statement.lstrip().upper().startswith("UPDATE")]
+
+@pytest.mark.asyncio
+async def test_changed_profile_is_updated_on_login(db_sessionmaker, seeded_users, assert_max_queries):
+    seeded = seeded_users[0]
+    async with db_sessionmaker() as db:
+        existing = await db.scalar(select(User).where(User.id == seeded.id))
+        user_info = GoogleUserInfo(
+            sub=existing.google_id, email=existing.email, name="Renamed User", picture="https://example.com/new.png"
+        )
+
+    async with db_sessionmaker() as db:
+        user, _, commits = await login(db, user_info, assert_max_queries)
+        assert user.id == seeded.id
+        assert commits == 1
+
+    async with db_sessionmaker() as db:
+        stored = await db.scalar(select(User).where(User.id == seeded.id))
+        assert (stored.name, stored.picture) == ("Renamed User", "https://example.com/new.png")
+        assert stored.updated_at > existing.updated_at
+
+@pytest.mark.asyncio
+async def test_concurrent_first_login_returns_the_committed_user(postgres_engine):
+    tag = uuid.uuid4().hex
+    user_info = GoogleUserInfo(sub=f"race-{tag}", email=f"race-{tag}@example.com", name="Race User")
+    user_id, now = uuid.uuid4(), datetime.utcnow()
+    sessions = async_sessionmaker(postgres_engine, expire_on_commit=False)
+    try:
+        async with sessions() as first, sessions() as second:
+            await first.execute(insert(User).values(
+                id=user_id, email=user_info.email, name=user_info.name, google_id=user_info.sub,
+                created_at=now, updated_at=now
+            ))
+            login = asyncio.create_task(AuthService.get_or_create_user(second, user_info))
+            await asyncio.sleep(0.2)
+            assert not login.done()
+
+            await first.commit()
+            user = await asyncio.wait_for(login, timeout=5)
+            assert user.id == user_id
+    finally:
+        async with postgres_engine.begin() as conn:
+            await conn.execute(delete(User).where(User.id == user_id))
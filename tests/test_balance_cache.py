@@ -0,0 +1,86 @@
+import asyncio
+import uuid
+
+import pytest
+
+from app.features.wallet.services.balance_cache import BalanceCache, CachedBalance
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_coalesce_and_writes_update_cache():
+    cache = BalanceCache(max_entries=2, ttl_seconds=60)
+    user_id = uuid.uuid4()
+    wallet_id = uuid.uuid4()
+    loads = 0
+
+    async def loader():
+        nonlocal loads
+        loads += 1
+        await asyncio.sleep(0.01)
+        return CachedBalance(wallet_id, 100)
+
+    results = await asyncio.gather(*(cache.get_or_load(user_id, loader) for _ in range(10)))
+
+    assert loads == 1
+    assert {result.balance for result in results} == {100}
+
+    assert (await cache.get_or_load(user_id, loader)).balance == 100
+    assert loads == 1
+
+    cache.invalidate(user_id)
+    assert cache.get(user_id) is None
+    assert (await cache.get_or_load(user_id, loader)).balance == 100
+    assert loads == 2
+
+    for _ in range(2):
+        await cache.get_or_load(uuid.uuid4(), loader)
+    assert cache.get(user_id) is None
+
+    stats = cache.stats()
+    assert (stats["misses"], stats["coalesced"], stats["hits"], stats["evictions"]) == (4, 9, 1, 1)
+    assert stats["invalidations"] == 1
+
+@pytest.mark.asyncio
+async def test_a_write_during_a_load_keeps_the_loaded_balance_out():
+    cache = BalanceCache(max_entries=10, ttl_seconds=60)
+    user_id = uuid.uuid4()
+    wallet_id = uuid.uuid4()
+    read = asyncio.Event()
+
+    async def loader():
+        read.set()
+        await asyncio.sleep(0.01)
+        return CachedBalance(wallet_id, 100)
+
+    load = asyncio.create_task(cache.get_or_load(user_id, loader))
+    await read.wait()
+    cache.invalidate(user_id)
+
+    assert (await load).balance == 100
+    assert cache.get(user_id) is None
+
+@pytest.mark.asyncio
+async def test_waiters_reload_when_the_leading_request_is_cancelled():
+    cache = BalanceCache(max_entries=10, ttl_seconds=60)
+    user_id = uuid.uuid4()
+    wallet_id = uuid.uuid4()
+    leader_started = asyncio.Event()
+
+    async def slow_loader():
+        leader_started.set()
+        await asyncio.sleep(60)
+
+    async def loader():
+        return CachedBalance(wallet_id, 300)
+
+    leader = asyncio.create_task(cache.get_or_load(user_id, slow_loader))
+    await leader_started.wait()
+    waiters = [asyncio.create_task(cache.get_or_load(user_id, loader)) for _ in range(3)]
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    results = await asyncio.wait_for(asyncio.gather(*waiters), timeout=1)
+
+    assert leader.cancelled()
+    assert {result.balance for result in results} == {300}
+    assert cache.get(user_id).balance == 300
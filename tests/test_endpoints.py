@@ -0,0 +1,65 @@
+import hashlib
+import hmac
+import json
+
+import pytest
+
+from app.features.payments.services.paystack_service import PaystackService
+from app.platform.config.settings import settings
+from tests.conftest import SEED_BALANCE
+
+
+async def fake_initialize_transaction(amount: int, email: str) -> dict:
+    return {"reference": f"TXN_{email}_{amount}", "authorization_url": "https://checkout.paystack.test/seed"}
+
+def signed_charge_success(reference: str) -> dict:
+    body = json.dumps({"event": "charge.success", "data": {"reference": reference}}).encode()
+    signature = hmac.new(settings.PAYSTACK_WEBHOOK_SECRET.encode(), body, hashlib.sha512).hexdigest()
+    return {"content": body, "headers": {"x-paystack-signature": signature, "content-type": "application/json"}}
+
+@pytest.mark.asyncio
+async def test_balance_read(client, seeded_users, assert_max_queries):
+    with assert_max_queries(2):
+        response = await client.get("/api/v1/wallet/balance", headers=seeded_users[0].headers)
+
+    assert response.status_code == 200
+    assert response.json()["data"]["balance"] == SEED_BALANCE
+
+@pytest.mark.asyncio
+async def test_transfer_then_history(client, seeded_users, assert_max_queries):
+    sender, recipient = seeded_users[0], seeded_users[1]
+
+    with assert_max_queries(11):
+        response = await client.post(
+            "/api/v1/wallet/transfer",
+            headers=sender.headers,
+            json={"wallet_number": recipient.wallet_number, "amount": 2500}
+        )
+    assert response.status_code == 200
+
+    with assert_max_queries(3):
+        response = await client.get("/api/v1/wallet/transactions", headers=recipient.headers)
+    assert response.status_code == 200
+    assert [(row["direction"], row["amount"]) for row in response.json()["data"]] == [("credit", 2500)]
+
+    response = await client.get("/api/v1/wallet/balance", headers=sender.headers)
+    assert response.json()["data"]["balance"] == SEED_BALANCE - 2500
+
+@pytest.mark.asyncio
+async def test_api_key_deposit_settled_by_webhook(client, seeded_users, assert_max_queries, monkeypatch):
+    monkeypatch.setattr(PaystackService, "initialize_transaction", fake_initialize_transaction)
+    user = seeded_users[0]
+
+    with assert_max_queries(7):
+        response = await client.post("/api/v1/wallet/deposit", headers={"x-api-key": user.api_key}, json={"amount": 7000})
+    assert response.status_code == 201
+    reference = response.json()["data"]["reference"]
+
+    with assert_max_queries(6):
+        response = await client.post("/api/v1/payments/paystack/webhook", **signed_charge_success(reference))
+    assert response.status_code == 200
+
+    response = await client.get(f"/api/v1/wallet/deposit/{reference}/status")
+    assert response.json()["data"]["status"] == "success"
+    response = await client.get("/api/v1/wallet/balance", headers=user.headers)
+    assert response.json()["data"]["balance"] == SEED_BALANCE + 7000
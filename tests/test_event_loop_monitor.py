@@ -0,0 +1,26 @@
+import asyncio
+import time
+
+import pytest
+
+from app.platform.metrics.event_loop import EventLoopMonitor
+from app.platform.metrics.instruments import event_loop_blocked_total, event_loop_lag_seconds
+
+
+def hash_synchronously() -> None:
+    time.sleep(0.3)
+
+@pytest.mark.asyncio
+async def test_monitor_records_lag_and_captures_blocking_stack():
+    blocked = event_loop_blocked_total.labels().value
+    observed = event_loop_lag_seconds.labels().count
+    monitor = EventLoopMonitor(0.01, 0.1, capture_stacks=True)
+    monitor.start()
+    await asyncio.sleep(0.05)
+    hash_synchronously()
+    await asyncio.sleep(0.05)
+    await monitor.stop()
+
+    assert event_loop_lag_seconds.labels().count > observed
+    assert event_loop_blocked_total.labels().value == blocked + 1
+    assert "hash_synchronously" in monitor.last_blocked_stack
@@ -0,0 +1,60 @@
+import time
+
+import httpx
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+
+from app.features.auth.services import auth_service
+from app.features.auth.services.auth_service import AuthService
+from app.features.auth.services.google_jwks import GoogleJWKSCache
+from app.platform.config.settings import settings
+
+
+@pytest.mark.asyncio
+async def test_id_token_is_verified_against_cached_jwks(monkeypatch):
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption()
+    )
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    public_jwk = {**jwk.construct(public_pem, "RS256").to_dict(), "kid": "local-key", "use": "sig"}
+
+    def jwks_endpoint(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"keys": [public_jwk]}, headers={"Cache-Control": "public, max-age=3600"})
+
+    cache = GoogleJWKSCache("https://jwks.local/certs", transport=httpx.MockTransport(jwks_endpoint))
+    monkeypatch.setattr(auth_service, "google_jwks", cache)
+
+    now = int(time.time())
+    id_token = jwt.encode(
+        {
+            "iss": "https://accounts.google.com",
+            "aud": settings.GOOGLE_CLIENT_ID,
+            "sub": "google-user-1",
+            "email": "user@example.com",
+            "email_verified": True,
+            "name": "Local User",
+            "iat": now,
+            "exp": now + 600
+        },
+        private_pem.decode(),
+        algorithm="RS256",
+        headers={"kid": "local-key"},
+        access_token="access-token"
+    )
+
+    for _ in range(3):
+        user_info = await AuthService.verify_id_token(id_token, "access-token")
+
+    assert (user_info.sub, user_info.email, user_info.name) == ("google-user-1", "user@example.com", "Local User")
+    assert cache.fetches == 1
+
+    with pytest.raises(ValueError, match="Invalid id_token"):
+        await AuthService.verify_id_token(id_token, "another-access-token")
@@ -0,0 +1,50 @@
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.features.payments.models.transaction import Transaction, TransactionStatus, TransactionType
+from app.features.payments.utils.helpers import generate_transaction_reference, reference_created_since
+from app.features.wallet.services.transaction_service import WalletTransactionService
+from app.platform.db.ids import uuid7, uuid7_datetime
+
+
+def test_uuid7_is_versioned_and_strictly_increasing():
+    ids = [uuid7() for _ in range(20_000)]
+
+    assert all(value.version == 7 and value.variant == uuid.RFC_4122 for value in ids)
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+
+def test_uuid7_embeds_its_creation_time():
+    before = datetime.utcnow() - timedelta(milliseconds=1)
+    issued_at = uuid7_datetime(uuid7())
+
+    assert before <= issued_at <= datetime.utcnow() + timedelta(seconds=1)
+    assert uuid7_datetime(uuid.uuid4()) is None
+
+def test_reference_bounds_lookups_only_for_time_ordered_references():
+    since = reference_created_since(generate_transaction_reference())
+
+    assert since is not None and since <= datetime.utcnow()
+    assert reference_created_since(f"TXN_{uuid.uuid4().hex}") is None
+    assert reference_created_since("TXN_not-a-uuid") is None
+    assert reference_created_since(None) is None
+
+@pytest.mark.asyncio
+async def test_reference_lookup_falls_back_when_the_row_predates_its_reference(db_sessionmaker, seeded_users):
+    reference = generate_transaction_reference()
+    async with db_sessionmaker() as db:
+        db.add(Transaction(
+            reference=reference,
+            user_id=seeded_users[0].id,
+            amount=100,
+            status=TransactionStatus.pending,
+            transaction_type=TransactionType.deposit,
+            created_at=datetime.utcnow() - timedelta(days=40)
+        ))
+        await db.commit()
+
+        transaction = await WalletTransactionService.get_transaction_by_reference(db, reference)
+        assert transaction is not None and transaction.reference == reference
+        assert await WalletTransactionService.get_transaction_by_reference(db, generate_transaction_reference()) is None
@@ -0,0 +1,41 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.main import app
+from app.platform.metrics.registry import Registry
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = Registry()
+    histogram = registry.histogram("job_seconds", "Job latency", ("job",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.labels("export").observe(value)
+
+    lines = registry.render().splitlines()
+
+    assert 'job_seconds_bucket{job="export",le="0.1"} 2' in lines
+    assert 'job_seconds_bucket{job="export",le="1"} 3' in lines
+    assert 'job_seconds_bucket{job="export",le="+Inf"} 4' in lines
+    assert 'job_seconds_count{job="export"} 4' in lines
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_reports_route_templates():
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        await client.get("/health")
+        await client.get("/does-not-exist")
+        response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert 'http_requests_total{method="GET",route="/health",status="200"}' in response.text
+    assert 'http_requests_total{method="GET",route="unmatched",status="404"}' in response.text
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/health",le="+Inf"}' in response.text
+
+@pytest.mark.asyncio
+async def test_requests_without_sql_are_counted():
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        await client.get("/health")
+        response = await client.get("/metrics")
+
+    assert 'http_requests_without_db_total{route="/health"}' in response.text
+    assert 'db_pool_checkouts_total{engine="primary"}' in response.text
+    assert '# TYPE db_pool_connections gauge' in response.text
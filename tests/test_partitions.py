@@ -0,0 +1,105 @@
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import select, text, update
+from sqlalchemy.exc import DBAPIError, IntegrityError
+
+from app.features.payments.models.transaction import (
+    Transaction,
+    TransactionReference,
+    TransactionStatus,
+    TransactionType,
+)
+from app.platform.db.partitions import MonthlyPartitions, add_months, month_start
+
+
+def test_add_months_crosses_years():
+    assert add_months(date(2026, 11, 1), 2) == date(2027, 1, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+@pytest.mark.asyncio
+async def test_ensure_then_archive_detaches_old_months(postgres_engine):
+    partitions = MonthlyPartitions("partition_probe")
+    async with postgres_engine.connect() as conn:
+        await conn.execute(text("DROP TABLE IF EXISTS partition_probe CASCADE"))
+        await conn.execute(text("CREATE TABLE partition_probe (created_at timestamp NOT NULL) PARTITION BY RANGE (created_at)"))
+        try:
+            created = await partitions.ensure(conn, date(2026, 1, 1), date(2026, 3, 1))
+            assert await partitions.ensure(conn, date(2026, 1, 1), date(2026, 3, 1)) == []
+            await conn.execute(text("INSERT INTO partition_probe VALUES ('2026-01-15'), ('2026-02-15'), ('2027-06-01')"))
+            await conn.commit()
+
+            archived = await partitions.archive(conn, date(2026, 2, 1), "archive_probe")
+            remaining = [partition.name for partition in await partitions.existing(conn)]
+            archived_rows = await conn.execute(text("SELECT count(*) FROM archive_probe.partition_probe_p2026_01"))
+            default_rows = await conn.execute(text("SELECT count(*) FROM partition_probe_default"))
+
+            assert created == [
+                "partition_probe_p2026_01", "partition_probe_p2026_02", "partition_probe_p2026_03", "partition_probe_default"
+            ]
+            assert archived == ["archive_probe.partition_probe_p2026_01"]
+            assert remaining == ["partition_probe_p2026_02", "partition_probe_p2026_03", "partition_probe_default"]
+            assert archived_rows.scalar() == 1
+            assert default_rows.scalar() == 1
+        finally:
+            await conn.rollback()
+            await conn.execute(text("DROP TABLE IF EXISTS partition_probe CASCADE"))
+            await conn.execute(text("DROP SCHEMA IF EXISTS archive_probe CASCADE"))
+            await conn.commit()
+
+@pytest.mark.asyncio
+async def test_references_are_unique_across_months(db_sessionmaker, seeded_users):
+    now = datetime.utcnow()
+    rows = [
+        {"reference": "TXN_DUPLICATE", "user_id": seeded_users[0].id, "amount": 100, "created_at": created_at}
+        for created_at in (now, add_months(month_start(now), -1))
+    ]
+    async with db_sessionmaker() as db:
+        db.add(Transaction(**rows[0], status=TransactionStatus.success, transaction_type=TransactionType.deposit))
+        await db.commit()
+
+        db.add(Transaction(**rows[1], status=TransactionStatus.success, transaction_type=TransactionType.deposit))
+        with pytest.raises(IntegrityError):
+            await db.commit()
+        await db.rollback()
+
+        with pytest.raises(DBAPIError, match="transaction references cannot be changed"):
+            await db.execute(
+                update(Transaction).where(Transaction.reference == "TXN_DUPLICATE").values(reference="TXN_RENAMED")
+            )
+        await db.rollback()
+        claimed = await db.scalars(select(TransactionReference.reference).where(
+            TransactionReference.reference.in_(["TXN_DUPLICATE", "TXN_RENAMED"])
+        ))
+        assert claimed.all() == ["TXN_DUPLICATE"]
+
+@pytest.mark.asyncio
+async def test_ensure_moves_rows_out_of_the_default_partition(postgres_engine):
+    partitions = MonthlyPartitions("partition_probe")
+    async with postgres_engine.connect() as conn:
+        await conn.execute(text("DROP TABLE IF EXISTS partition_probe CASCADE"))
+        await conn.execute(text(
+            "CREATE TABLE partition_probe (id serial, created_at timestamp NOT NULL, PRIMARY KEY (id, created_at)) "
+            "PARTITION BY RANGE (created_at)"
+        ))
+        try:
+            await partitions.ensure(conn, date(2026, 1, 1), date(2026, 1, 1))
+            await conn.execute(text(
+                "INSERT INTO partition_probe (created_at) VALUES ('2026-03-02'), ('2026-03-30'), ('2026-04-01'), ('2027-06-01')"
+            ))
+
+            assert await partitions.ensure(conn, date(2026, 1, 1), date(2026, 4, 1)) == [
+                "partition_probe_p2026_02", "partition_probe_p2026_03", "partition_probe_p2026_04"
+            ]
+            rows = await conn.execute(text(
+                "SELECT tableoid::regclass::text, count(*) FROM partition_probe GROUP BY 1 ORDER BY 1"
+            ))
+            assert rows.all() == [("partition_probe_default", 1), ("partition_probe_p2026_03", 2), ("partition_probe_p2026_04", 1)]
+
+            await conn.execute(text("INSERT INTO partition_probe (created_at) VALUES ('2026-03-15')"))
+            march = await conn.execute(text("SELECT count(*) FROM partition_probe_p2026_03"))
+            assert march.scalar() == 3
+        finally:
+            await conn.rollback()
+            await conn.execute(text("DROP TABLE IF EXISTS partition_probe CASCADE"))
+            await conn.commit()
@@ -0,0 +1,244 @@
+import hashlib
+import hmac
+import json
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+from sqlalchemy import select, update
+
+from app.features.payments.models.payout import Payout, PayoutStatus
+from app.features.payments.services.payout_service import PayoutService
+from app.features.payments.services.paystack_service import PaystackService
+from app.features.wallet.services.hold_service import WalletHoldService
+from app.platform.config.settings import settings
+from tests.conftest import SEED_BALANCE
+
+WITHDRAWAL = {"bank_code": "058", "account_number": "0123456789", "account_name": "Seed User"}
+
+
+class FakePaystack:
+    def __init__(self):
+        self.transfer_batches = []
+        self.transfers = {}
+        self.rejected = set()
+        self.status_code = 200
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        if self.status_code != 200:
+            return httpx.Response(self.status_code, json={"status": False, "message": "Paystack is unavailable"})
+
+        if request.url.path.startswith("/transfer/verify/"):
+            transfer = self.transfers.get(request.url.path.rsplit("/", 1)[1])
+            if transfer is None:
+                return httpx.Response(404, json={"status": False, "message": "Transfer not found"})
+            return httpx.Response(200, json={"status": True, "data": transfer})
+
+        payload = json.loads(request.content)
+        if request.url.path == "/transferrecipient/bulk":
+            recipients = [
+                {
+                    "recipient_code": f"RCP_{recipient['bank_code']}{recipient['account_number']}",
+                    "details": {"bank_code": recipient["bank_code"], "account_number": recipient["account_number"]}
+                }
+                for recipient in payload["batch"]
+            ]
+            return httpx.Response(200, json={"status": True, "data": {"success": recipients, "errors": []}})
+
+        requested = payload["transfers"] if request.url.path == "/transfer/bulk" else [payload]
+        for transfer in requested:
+            if transfer["reference"] in self.rejected or transfer["reference"] in self.transfers:
+                return httpx.Response(400, json={"status": False, "message": f"Invalid transfer {transfer['reference']}"})
+
+        self.transfer_batches.append(len(requested))
+        for transfer in requested:
+            self.transfers[transfer["reference"]] = {
+                "reference": transfer["reference"],
+                "transfer_code": f"TRF_{transfer['reference'][-16:]}",
+                "status": "pending"
+            }
+        transfers = [self.transfers[transfer["reference"]] for transfer in requested]
+        data = transfers if request.url.path == "/transfer/bulk" else transfers[0]
+        return httpx.Response(200, json={"status": True, "data": data})
+
+@pytest.fixture
+def fake_paystack(monkeypatch):
+    paystack = FakePaystack()
+    real_client = httpx.AsyncClient
+
+    def fake_client(**kwargs):
+        return real_client(transport=httpx.MockTransport(paystack.handle), **kwargs)
+
+    monkeypatch.setattr(httpx, "AsyncClient", fake_client)
+    monkeypatch.setattr(PaystackService, "BASE_URL", "http://paystack.test")
+    return paystack
+
+def signed_transfer_event(event: str, reference: str) -> dict:
+    body = json.dumps({"event": event, "data": {"reference": reference, "status": event.split(".")[1]}}).encode()
+    signature = hmac.new(settings.PAYSTACK_WEBHOOK_SECRET.encode(), body, hashlib.sha512).hexdigest()
+    return {"content": body, "headers": {"x-paystack-signature": signature, "content-type": "application/json"}}
+
+async def balance(client, user) -> tuple[int, int]:
+    data = (await client.get("/api/v1/wallet/balance", headers=user.headers)).json()["data"]
+    return data["balance"], data["held_balance"]
+
+@pytest.mark.asyncio
+async def test_withdrawals_are_batched_and_settled_by_webhooks(client, db_sessionmaker, seeded_users, fake_paystack):
+    users = seeded_users[:3]
+    references = []
+    for user in users:
+        response = await client.post("/api/v1/wallet/withdraw", headers=user.headers, json={"amount": 2000, **WITHDRAWAL})
+        assert response.status_code == 202
+        assert response.json()["data"]["status"] == "queued"
+        references.append(response.json()["data"]["reference"])
+    assert await balance(client, users[0]) == (SEED_BALANCE, 2000)
+
+    async with db_sessionmaker() as db:
+        assert await PayoutService.dispatch_batch(db, batch_size=10, window_seconds=60) == 0
+        assert await PayoutService.dispatch_batch(db, batch_size=2, window_seconds=60) == 2
+        later = datetime.utcnow() + timedelta(minutes=2)
+        assert await PayoutService.dispatch_batch(db, batch_size=10, window_seconds=60, now=later) == 1
+        assert fake_paystack.transfer_batches == [2, 1]
+
+        payouts = (await db.execute(select(Payout).where(Payout.reference.in_(references)))).scalars().all()
+        assert {payout.status for payout in payouts} == {PayoutStatus.submitted}
+        assert all(payout.transfer_code and payout.recipient_code for payout in payouts)
+
+    for event, reference in zip(("transfer.success", "transfer.success", "transfer.failed"), references, strict=True):
+        response = await client.post("/api/v1/payments/paystack/webhook", **signed_transfer_event(event, reference))
+        assert response.json()["message"] == "Webhook processed successfully"
+
+    response = await client.post("/api/v1/payments/paystack/webhook", **signed_transfer_event("transfer.failed", references[0]))
+    assert response.json()["message"] == "Payout already processed"
+
+    assert await balance(client, users[0]) == (SEED_BALANCE - 2000, 0)
+    assert await balance(client, users[2]) == (SEED_BALANCE, 0)
+
+    response = await client.get("/api/v1/wallet/transactions", headers=users[0].headers)
+    assert [(row["type"], row["direction"], row["status"]) for row in response.json()["data"]] == [
+        ("withdrawal", "debit", "success")
+    ]
+
+@pytest.mark.asyncio
+async def test_rejected_batch_only_fails_the_rejected_payout(client, db_sessionmaker, seeded_users, fake_paystack):
+    user, other = seeded_users[:2]
+    response = await client.post("/api/v1/wallet/withdraw", headers=user.headers, json={"amount": SEED_BALANCE + 1, **WITHDRAWAL})
+    assert response.status_code == 400
+
+    response = await client.post("/api/v1/wallet/withdraw", headers=user.headers, json={"amount": 5000, **WITHDRAWAL})
+    rejected = response.json()["data"]["reference"]
+    response = await client.post("/api/v1/wallet/withdraw", headers=other.headers, json={"amount": 1000, **WITHDRAWAL})
+    accepted = response.json()["data"]["reference"]
+
+    fake_paystack.rejected.add(rejected)
+    async with db_sessionmaker() as db:
+        assert await PayoutService.dispatch_batch(db, batch_size=2, window_seconds=60) == 2
+        assert (await PayoutService.get_payout_by_reference(db, rejected)).status is PayoutStatus.failed
+        assert (await PayoutService.get_payout_by_reference(db, accepted)).status is PayoutStatus.submitted
+    assert fake_paystack.transfer_batches == [1]
+
+    assert await balance(client, user) == (SEED_BALANCE, 0)
+    assert await balance(client, other) == (SEED_BALANCE, 1000)
+    response = await client.get("/api/v1/wallet/transactions", headers=user.headers)
+    assert [row["status"] for row in response.json()["data"]] == ["failed"]
+
+@pytest.mark.asyncio
+async def test_reclaimed_payouts_are_verified_instead_of_resent(client, db_sessionmaker, seeded_users, fake_paystack):
+    user = seeded_users[0]
+    response = await client.post("/api/v1/wallet/withdraw", headers=user.headers, json={"amount": 2500, **WITHDRAWAL})
+    reference = response.json()["data"]["reference"]
+
+    async with db_sessionmaker() as db:
+        assert await PayoutService.dispatch_batch(db, batch_size=1, window_seconds=60) == 1
+        await db.execute(
+            update(Payout)
+            .where(Payout.reference == reference)
+            .values(status=PayoutStatus.submitting, updated_at=datetime.utcnow() - timedelta(hours=1))
+        )
+        await db.commit()
+
+        assert await PayoutService.dispatch_batch(db, batch_size=1, window_seconds=60) == 1
+        payout = await PayoutService.get_payout_by_reference(db, reference)
+        assert payout.status is PayoutStatus.submitted
+        assert fake_paystack.transfer_batches == [1]
+
+        fake_paystack.transfers[reference]["status"] = "success"
+        await db.execute(
+            update(Payout)
+            .where(Payout.reference == reference)
+            .values(status=PayoutStatus.submitting, updated_at=datetime.utcnow() - timedelta(hours=1))
+        )
+        await db.commit()
+        assert await PayoutService.dispatch_batch(db, batch_size=1, window_seconds=60) == 1
+        payout = await PayoutService.get_payout_by_reference(db, reference)
+        assert payout.status is PayoutStatus.success
+        assert fake_paystack.transfer_batches == [1]
+
+    assert await balance(client, user) == (SEED_BALANCE - 2500, 0)
+
+@pytest.mark.asyncio
+async def test_webhook_during_submission_is_not_overwritten(client, db_sessionmaker, seeded_users, fake_paystack, monkeypatch):
+    user = seeded_users[0]
+    response = await client.post("/api/v1/wallet/withdraw", headers=user.headers, json={"amount": 3000, **WITHDRAWAL})
+    reference = response.json()["data"]["reference"]
+    initiate_bulk_transfer = PaystackService.initiate_bulk_transfer
+
+    async def settle_first(transfers):
+        async with db_sessionmaker() as db:
+            payout = await PayoutService.get_payout_by_reference(db, reference)
+            assert payout.status is PayoutStatus.submitting
+        response = await client.post("/api/v1/payments/paystack/webhook", **signed_transfer_event("transfer.success", reference))
+        assert response.json()["message"] == "Webhook processed successfully"
+        return await initiate_bulk_transfer(transfers)
+
+    monkeypatch.setattr(PaystackService, "initiate_bulk_transfer", settle_first)
+    async with db_sessionmaker() as db:
+        assert await PayoutService.dispatch_batch(db, batch_size=1, window_seconds=60) == 1
+
+    async with db_sessionmaker() as db:
+        payout = await PayoutService.get_payout_by_reference(db, reference)
+        assert payout.status is PayoutStatus.success
+        assert payout.transfer_code
+    assert await balance(client, user) == (SEED_BALANCE - 3000, 0)
+
+@pytest.mark.asyncio
+async def test_payouts_fail_after_the_attempt_cap(client, db_sessionmaker, seeded_users, fake_paystack, monkeypatch):
+    user = seeded_users[0]
+    response = await client.post("/api/v1/wallet/withdraw", headers=user.headers, json={"amount": 4000, **WITHDRAWAL})
+    reference = response.json()["data"]["reference"]
+
+    monkeypatch.setattr(settings, "PAYOUT_MAX_ATTEMPTS", 1)
+    fake_paystack.status_code = 503
+    async with db_sessionmaker() as db:
+        assert await PayoutService.dispatch_batch(db, batch_size=1, window_seconds=60) == 0
+        payout = await PayoutService.get_payout_by_reference(db, reference)
+        assert (payout.status, payout.attempts) == (PayoutStatus.queued, 1)
+
+        assert await PayoutService.dispatch_batch(db, batch_size=1, window_seconds=60) == 0
+        payout = await PayoutService.get_payout_by_reference(db, reference)
+        assert (payout.status, payout.attempts) == (PayoutStatus.queued, 1)
+        assert await balance(client, user) == (SEED_BALANCE, 4000)
+
+        fake_paystack.status_code = 200
+        assert await PayoutService.dispatch_batch(db, batch_size=1, window_seconds=60) == 1
+        payout = await PayoutService.get_payout_by_reference(db, reference)
+        assert (payout.status, payout.attempts) == (PayoutStatus.failed, 1)
+    assert fake_paystack.transfer_batches == []
+
+    assert await balance(client, user) == (SEED_BALANCE, 0)
+    response = await client.get("/api/v1/wallet/transactions", headers=user.headers)
+    assert [row["status"] for row in response.json()["data"]] == ["failed"]
+
+@pytest.mark.asyncio
+async def test_payout_holds_do_not_expire(client, db_sessionmaker, seeded_users, fake_paystack):
+    user = seeded_users[0]
+    response = await client.post("/api/v1/wallet/withdraw", headers=user.headers, json={"amount": 6000, **WITHDRAWAL})
+    reference = response.json()["data"]["reference"]
+
+    async with db_sessionmaker() as db:
+        assert await PayoutService.dispatch_batch(db, batch_size=1, window_seconds=60) == 1
+        assert await WalletHoldService.expire_holds(db, limit=10, now=datetime.utcnow() + timedelta(days=365)) == 0
+
+    response = await client.post("/api/v1/payments/paystack/webhook", **signed_transfer_event("transfer.success", reference))
+    assert response.json()["message"] == "Webhook processed successfully"
+    assert await balance(client, user) == (SEED_BALANCE - 6000, 0)
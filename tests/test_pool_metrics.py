@@ -0,0 +1,60 @@
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.platform.db.base import engine as app_engine
+from app.platform.db.base import get_db
+from app.platform.db.pool import InstrumentedAsyncAdaptedQueuePool, collect_pool_metrics, instrument_pool, pool_status
+from app.platform.metrics.registry import registry
+
+
+@pytest.mark.asyncio
+async def test_pool_status_reports_checkouts_saturation_and_timeouts(tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.05
+    )
+    instrument_pool(engine)
+
+    async with engine.connect() as first, engine.connect() as second:
+        await first.execute(text("SELECT 1"))
+        await second.execute(text("SELECT 1"))
+        status = pool_status(engine)
+        assert status["checked_out"] == 2
+        assert status["overflow"] == 1
+        assert status["saturation"] == 1.0
+
+        with pytest.raises(exc.TimeoutError):
+            await engine.connect().start()
+
+        collect_pool_metrics(app_engine, [engine])
+        lines = registry.render().splitlines()
+        assert 'db_pool_connections{engine="replica_0",state="checked_out"} 2' in lines
+        assert 'db_pool_connections{engine="replica_0",state="overflow"} 1' in lines
+        assert 'db_pool_saturation{engine="replica_0"} 1' in lines
+        assert 'db_pool_timeouts_total{engine="replica_0"} 1' in lines
+
+    await engine.dispose()
+    status = pool_status(engine)
+    assert status["checked_out"] == 0
+    assert status["checkouts"] == 2
+    assert status["connects"] == 2
+    assert status["peak_checked_out"] == 2
+    assert status["peak_overflow"] == 1
+    assert status["timeouts"] == 1
+    assert status["wait_ms_max"] >= 50
+
+@pytest.mark.asyncio
+async def test_unused_request_session_never_checks_out_a_connection():
+    checkouts = pool_status(app_engine)["checkouts"]
+    sessions = get_db()
+    session = await anext(sessions)
+
+    with pytest.raises(StopAsyncIteration):
+        await anext(sessions)
+
+    assert not session.in_transaction()
+    assert pool_status(app_engine)["checkouts"] == checkouts
@@ -0,0 +1,77 @@
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import UniqueConstraint, select, text
+
+from app.features.api_keys.models.api_key import APIKey
+from app.features.payments.models.transaction import Transaction, transaction_partitions
+from app.features.payments.services.transaction_service import TransactionService
+from app.features.wallet.models.wallet import Wallet
+from app.features.wallet.services.transaction_service import WalletTransactionService
+from app.platform.db.base import Base
+from app.platform.db.partitions import add_months, month_start
+
+
+async def _explain(conn, statement) -> str:
+    compiled = statement.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True})
+    result = await conn.execute(text(f"EXPLAIN {compiled}"))
+    return "\n".join(result.scalars())
+
+@pytest.mark.asyncio
+async def test_wallet_history_branches_use_indexes(postgres_engine):
+    async with postgres_engine.connect() as conn:
+        await conn.execute(text("SET enable_seqscan = off"))
+        plan = await _explain(conn, WalletTransactionService.wallet_history_query(uuid.uuid4(), uuid.uuid4()))
+
+    assert "Seq Scan" not in plan
+    assert "user_id_created_at_idx" in plan
+    assert "recipient_wallet_id_created_at_idx" in plan
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("statement", [
+    WalletTransactionService.wallet_history_query(uuid.uuid4(), uuid.uuid4(), since=month_start(datetime.utcnow())),
+    select(Transaction).where(
+        Transaction.reference == "TXN_plan",
+        Transaction.created_at >= month_start(datetime.utcnow())
+    ).with_for_update(),
+    TransactionService.recent_transaction_query("plan@example.com", 5000, datetime.utcnow() - timedelta(minutes=1)),
+], ids=["history_since", "reference_since", "recent_deposit"])
+async def test_date_bounded_queries_prune_old_partitions(postgres_engine, statement):
+    current = month_start(datetime.utcnow())
+    async with postgres_engine.connect() as conn:
+        plan = await _explain(conn, statement)
+
+    assert transaction_partitions.partition_name(current) in plan
+    assert transaction_partitions.partition_name(add_months(current, -1)) not in plan
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("statement", "index"), [
+    (select(Transaction).where(Transaction.reference == "TXN_plan").with_for_update(), "reference_created_at_idx"),
+    (
+        TransactionService.recent_transaction_query("plan@example.com", 5000, datetime.utcnow() - timedelta(minutes=1)),
+        "email_amount_created_at_idx"
+    ),
+    (select(Wallet).where(Wallet.wallet_number == "1234567890128"), "ix_wallets_wallet_number"),
+    (select(Wallet).where(Wallet.user_id == uuid.uuid4()), "wallets_user_id_key"),
+    (select(APIKey).where(APIKey.key_hash == "plan"), "ix_api_keys_key_hash"),
+    (select(APIKey).where(APIKey.user_id == uuid.uuid4(), APIKey.is_active), "idx_api_key_user_active"),
+], ids=["reference", "recent_deposit", "wallet_number", "wallet_user", "key_hash", "active_keys"])
+async def test_hot_lookups_use_indexes(postgres_engine, statement, index):
+    async with postgres_engine.connect() as conn:
+        await conn.execute(text("SET enable_seqscan = off"))
+        plan = await _explain(conn, statement)
+
+    assert "Seq Scan" not in plan
+    assert index in plan
+
+def test_no_table_indexes_the_same_columns_twice():
+    for table in Base.metadata.sorted_tables:
+        keys = [tuple(column.name for column in index.columns) for index in table.indexes]
+        keys += [
+            tuple(column.name for column in constraint.columns)
+            for constraint in table.constraints
+            if isinstance(constraint, UniqueConstraint)
+        ]
+        keys.append(tuple(column.name for column in table.primary_key.columns))
+        assert len(keys) == len(set(keys)), table.name
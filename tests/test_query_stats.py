@@ -0,0 +1,39 @@
+import logging
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.main import app
+from app.platform.db.profiling import instrument_queries
+
+
+@pytest.mark.asyncio
+async def test_queries_are_counted_and_slow_ones_logged(assert_max_queries, caplog):
+    engine = create_async_engine("sqlite+aiosqlite://")
+    instrument_queries(engine, slow_query_seconds=0)
+
+    with caplog.at_level(logging.WARNING, logger="app.platform.db.profiling"):
+        with assert_max_queries(2) as stats:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                await conn.execute(text("SELECT 2"))
+
+    assert stats.count == 2
+    assert "Slow query" in caplog.text and "SELECT 2" in caplog.text
+
+    with pytest.raises(AssertionError, match="at most 1 queries, ran 2"):
+        with assert_max_queries(1):
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                await conn.execute(text("SELECT 2"))
+
+    await engine.dispose()
+
+@pytest.mark.asyncio
+async def test_server_timing_header_in_debug():
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/health")
+
+    assert response.headers["server-timing"] == 'db;dur=0.0;desc="0 queries"'
@@ -0,0 +1,86 @@
+import math
+import uuid
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.platform.db.routing import ReplicaRouter, RoutingSession
+
+
+async def _database(path, name: str):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path / name}.db")
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE instance (name TEXT)"))
+        await conn.execute(text("INSERT INTO instance VALUES (:name)"), {"name": name})
+    return engine
+
+async def _served_by(session_factory, user_id=None) -> str:
+    async with session_factory() as session:
+        session.info["user_id"] = user_id
+        return (await session.execute(text("SELECT name FROM instance"))).scalar_one()
+
+@pytest.mark.asyncio
+async def test_reads_route_to_replica_unless_recent_write_or_lag(tmp_path):
+    primary = await _database(tmp_path, "primary")
+    replica = await _database(tmp_path, "replica")
+    router = ReplicaRouter(primary, [replica], max_lag_seconds=5, read_your_writes_seconds=30)
+    session_factory = async_sessionmaker(class_=AsyncSession, sync_session_class=RoutingSession, router=router)
+    user_id = uuid.uuid4()
+
+    assert await _served_by(session_factory, user_id) == "replica"
+
+    router.mark_write(user_id)
+    assert await _served_by(session_factory, user_id) == "primary"
+    assert await _served_by(session_factory, uuid.uuid4()) == "replica"
+
+    router.replica_lag[replica] = math.inf
+    assert await _served_by(session_factory) == "primary"
+
+    await router.refresh_lag()
+    assert await _served_by(session_factory) == "replica"
+
+    await primary.dispose()
+    await replica.dispose()
+
+@pytest.mark.asyncio
+async def test_a_read_session_stays_on_one_replica(tmp_path):
+    primary = await _database(tmp_path, "primary")
+    replicas = [await _database(tmp_path, "replica_a"), await _database(tmp_path, "replica_b")]
+    router = ReplicaRouter(primary, replicas, max_lag_seconds=5, read_your_writes_seconds=30)
+    session_factory = async_sessionmaker(class_=AsyncSession, sync_session_class=RoutingSession, router=router)
+    user_id = uuid.uuid4()
+
+    async with session_factory() as first, session_factory() as second:
+        served = [(await session.execute(text("SELECT name FROM instance"))).scalar_one() for session in (first,) * 3 + (second,) * 3]
+        assert served[:3] == [served[0]] * 3
+        assert served[3:] == [served[3]] * 3
+        assert served[0] != served[3]
+
+        router.mark_write(user_id)
+        first.info["user_id"] = user_id
+        assert (await first.execute(text("SELECT name FROM instance"))).scalar_one() == "primary"
+
+    await primary.dispose()
+    for replica in replicas:
+        await replica.dispose()
+
+@pytest.mark.asyncio
+async def test_read_sessions_can_run_in_autocommit(tmp_path):
+    primary = await _database(tmp_path, "primary")
+    router = ReplicaRouter(primary, [], max_lag_seconds=5, read_your_writes_seconds=30)
+    session_factory = async_sessionmaker(
+        class_=AsyncSession,
+        sync_session_class=RoutingSession,
+        router=router,
+        isolation_level="AUTOCOMMIT"
+    )
+
+    async with session_factory() as session:
+        await session.execute(text("SELECT 1"))
+        connection = await session.connection()
+        assert connection.sync_connection.get_execution_options()["isolation_level"] == "AUTOCOMMIT"
+
+    assert router.bind_for_read(None, "AUTOCOMMIT") is router.bind_for_read(None, "AUTOCOMMIT")
+
+    await primary.dispose()
@@ -0,0 +1,30 @@
+import json
+import uuid
+from datetime import datetime
+
+from app.features.payments.models.transaction import TransactionStatus
+from app.platform.response.schemas import ErrorCode, error_response, success_response
+
+
+def test_envelope_keeps_shape_and_serializes_native_types():
+    reference = uuid.uuid4()
+    response = success_response(
+        message="ok",
+        data=[{"status": TransactionStatus.success, "created_at": datetime(2026, 1, 2, 3, 4, 5, 6), "id": reference}]
+    )
+
+    assert json.loads(response.body) == {
+        "status": "success",
+        "message": "ok",
+        "data": [{"status": "success", "created_at": "2026-01-02T03:04:05.000006", "id": str(reference)}]
+    }
+
+def test_error_envelope_matches_previous_encoding():
+    response = error_response(message="Wallet not found", status_code=404, error_code=ErrorCode.WALLET_NOT_FOUND)
+
+    assert response.status_code == 404
+    assert response.headers["content-type"] == "application/json"
+    assert response.body == json.dumps(
+        {"status": "error", "message": "Wallet not found", "error_code": "WALLET_NOT_FOUND", "data": None},
+        separators=(",", ":")
+    ).encode()
@@ -0,0 +1,87 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.features.wallet.models.scheduled_transfer import ScheduleInterval
+from app.features.wallet.services.scheduled_transfer_service import ScheduledTransferService
+from tests.conftest import SEED_BALANCE
+
+
+async def balance(client, user) -> int:
+    return (await client.get("/api/v1/wallet/balance", headers=user.headers)).json()["data"]["balance"]
+
+async def schedules(client, user) -> list[dict]:
+    return (await client.get("/api/v1/wallet/schedules", headers=user.headers)).json()["data"]
+
+def test_monthly_schedules_keep_the_day_within_short_months():
+    assert ScheduleInterval.monthly.advance(datetime(2026, 1, 31, 9)) == datetime(2026, 2, 28, 9)
+    assert ScheduleInterval.monthly.advance(datetime(2026, 12, 15)) == datetime(2027, 1, 15)
+    assert ScheduleInterval.once.advance(datetime(2026, 1, 1)) is None
+
+    runs = [datetime(2026, 1, 31, 9)]
+    for _ in range(4):
+        runs.append(ScheduleInterval.monthly.advance(runs[-1], anchor_day=31))
+    assert runs[1:] == [datetime(2026, 2, 28, 9), datetime(2026, 3, 31, 9), datetime(2026, 4, 30, 9), datetime(2026, 5, 31, 9)]
+
+@pytest.mark.asyncio
+async def test_due_schedules_run_in_batches_until_complete(client, db_sessionmaker, seeded_users):
+    sender, first, second = seeded_users[:3]
+    start = datetime.utcnow() - timedelta(minutes=1)
+    for recipient, body in (
+        (first, {"amount": 1500, "interval": "daily", "occurrences": 2}),
+        (second, {"amount": 700, "interval": "once"})
+    ):
+        response = await client.post(
+            "/api/v1/wallet/schedules",
+            headers=sender.headers,
+            json={"wallet_number": recipient.wallet_number, "start_at": start.isoformat(), **body}
+        )
+        assert response.status_code == 201
+
+    async with db_sessionmaker() as db:
+        assert await ScheduledTransferService.execute_due(db, batch_size=1) == 1
+        assert await ScheduledTransferService.execute_due(db, batch_size=10) == 1
+        assert await ScheduledTransferService.execute_due(db, batch_size=10) == 0
+
+    assert await balance(client, sender) == SEED_BALANCE - 2200
+    assert await balance(client, second) == SEED_BALANCE + 700
+    assert sorted((row["interval"], row["status"], row["remaining_runs"]) for row in await schedules(client, sender)) == [
+        ("daily", "active", 1), ("once", "completed", 0)
+    ]
+
+    async with db_sessionmaker() as db:
+        assert await ScheduledTransferService.execute_due(db, batch_size=10, now=start + timedelta(days=1, seconds=1)) == 1
+
+    assert await balance(client, first) == SEED_BALANCE + 3000
+    assert {row["status"] for row in await schedules(client, sender)} == {"completed"}
+
+    response = await client.get("/api/v1/wallet/transactions", headers=first.headers)
+    assert [(row["type"], row["direction"], row["amount"]) for row in response.json()["data"]] == [
+        ("transfer", "credit", 1500), ("transfer", "credit", 1500)
+    ]
+
+@pytest.mark.asyncio
+async def test_failed_runs_are_recorded_and_cancelled_schedules_stop(client, db_sessionmaker, seeded_users):
+    sender, recipient = seeded_users[:2]
+    response = await client.post(
+        "/api/v1/wallet/schedules",
+        headers=sender.headers,
+        json={"wallet_number": recipient.wallet_number, "amount": SEED_BALANCE + 1, "interval": "weekly"}
+    )
+    schedule_id = response.json()["data"]["id"]
+
+    async with db_sessionmaker() as db:
+        assert await ScheduledTransferService.execute_due(db, batch_size=10) == 1
+
+    [row] = await schedules(client, sender)
+    assert (row["status"], row["last_error"]) == ("active", "Insufficient balance")
+    assert datetime.fromisoformat(row["next_run_at"]) > datetime.utcnow() + timedelta(days=6)
+
+    response = await client.delete(f"/api/v1/wallet/schedules/{schedule_id}", headers=sender.headers)
+    assert response.json()["data"]["status"] == "cancelled"
+    response = await client.delete(f"/api/v1/wallet/schedules/{schedule_id}", headers=sender.headers)
+    assert response.status_code == 404
+
+    async with db_sessionmaker() as db:
+        assert await ScheduledTransferService.execute_due(db, batch_size=10, now=datetime.utcnow() + timedelta(weeks=2)) == 0
+    assert await balance(client, recipient) == SEED_BALANCE
@@ -0,0 +1,42 @@
+import json
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from app.features.payments.models.transaction import TransactionStatus, TransactionType
+from app.features.wallet.utils.statement import encode_statement
+
+
+async def _batches(*batches):
+    for batch in batches:
+        yield batch
+
+def _row(reference: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        transaction_type=TransactionType.deposit,
+        recipient_wallet_id=None,
+        amount=5000,
+        status=TransactionStatus.success,
+        created_at=datetime(2025, 1, 2, 3, 4, 5),
+        reference=reference
+    )
+
+@pytest.mark.asyncio
+async def test_statement_export_encodes_batches():
+    csv_chunks = [chunk async for chunk in encode_statement(_batches([_row("TXN_1")], [_row("TXN_2")]), "csv", None)]
+    assert b"".join(csv_chunks).decode().splitlines() == [
+        "type,direction,amount,status,created_at,reference",
+        "deposit,credit,5000,success,2025-01-02T03:04:05,TXN_1",
+        "deposit,credit,5000,success,2025-01-02T03:04:05,TXN_2",
+    ]
+
+    ndjson_chunks = [chunk async for chunk in encode_statement(_batches([_row("TXN_1")]), "ndjson", None)]
+    assert json.loads(b"".join(ndjson_chunks)) == {
+        "type": "deposit",
+        "direction": "credit",
+        "amount": 5000,
+        "status": "success",
+        "created_at": "2025-01-02T03:04:05",
+        "reference": "TXN_1"
+    }
@@ -0,0 +1,60 @@
+import httpx
+import pytest
+from httpx import ASGITransport, AsyncClient
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.features.api_keys.services.api_key_service import APIKeyService
+from app.main import app
+from app.platform.metrics.instruments import track_outbound
+from app.platform.tracing.provider import OUTBOUND_EVENT_HOOKS, configure_tracing, tracer
+from app.platform.tracing.sql import instrument_query_spans
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+
+
+@pytest.fixture(scope="module")
+def exporter():
+    exporter = InMemorySpanExporter()
+    configure_tracing(exporter, sample_ratio=1.0, service_name="test", batch=False)
+    return exporter
+
+@pytest.fixture
+def spans(exporter):
+    exporter.clear()
+    yield exporter.get_finished_spans
+    exporter.clear()
+
+@pytest.mark.asyncio
+async def test_route_span_continues_incoming_trace(spans):
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        await client.get("/health", headers={"traceparent": f"00-{TRACE_ID}-00f067aa0ba902b7-01"})
+
+    (span,) = [span for span in spans() if span.name == "GET /health"]
+    assert f"{span.context.trace_id:032x}" == TRACE_ID
+    assert span.attributes["http.response.status_code"] == 200
+
+@pytest.mark.asyncio
+async def test_sql_outbound_and_hashing_spans_nest_under_parent(spans):
+    engine = create_async_engine("sqlite+aiosqlite://")
+    instrument_query_spans(engine)
+    received = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        received.update(request.headers)
+        return httpx.Response(200, json={"status": True})
+
+    with tracer.start_as_current_span("deposit") as parent:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler), event_hooks=OUTBOUND_EVENT_HOOKS) as client:
+            await track_outbound("paystack", "initialize_transaction", client.get("https://api.paystack.co/x"))
+        APIKeyService.verify_key("sk_live_key", APIKeyService.hash_key("sk_live_key"))
+    await engine.dispose()
+
+    children = {span.name: span for span in spans() if span.parent and span.parent.span_id == parent.context.span_id}
+    assert {"SELECT", "paystack initialize_transaction", "api_key.verify"} <= children.keys()
+    assert children["SELECT"].attributes["db.system.name"] == "sqlite"
+    outbound = children["paystack initialize_transaction"]
+    assert received["traceparent"].startswith(f"00-{parent.context.trace_id:032x}-{outbound.context.span_id:016x}-")
@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.features.wallet.models.hold import HoldStatus
+from app.features.wallet.models.wallet import Wallet
+from app.features.wallet.services.hold_service import WalletHoldService
+from tests.conftest import SEED_BALANCE
+
+
+async def wallet_balances(db, wallet_id) -> tuple[int, int]:
+    wallet = await db.get(Wallet, wallet_id, populate_existing=True)
+    return wallet.balance, wallet.held_balance
+
+@pytest.mark.asyncio
+async def test_capture_and_release_settle_held_funds(db_sessionmaker, seeded_users):
+    user = seeded_users[0]
+    async with db_sessionmaker() as db:
+        captured = await WalletHoldService.place_hold(db, user.wallet_id, 4000, "HOLD_capture")
+        released = await WalletHoldService.place_hold(db, user.wallet_id, 1000, "HOLD_release")
+        assert await wallet_balances(db, user.wallet_id) == (SEED_BALANCE, 5000)
+
+        await WalletHoldService.capture_hold(db, captured.id)
+        await WalletHoldService.release_hold(db, released.id)
+        assert await wallet_balances(db, user.wallet_id) == (SEED_BALANCE - 4000, 0)
+
+        with pytest.raises(ValueError, match="Hold is not active"):
+            await WalletHoldService.capture_hold(db, captured.id)
+        with pytest.raises(ValueError, match="Hold is not active"):
+            await WalletHoldService.capture_hold(db, released.id)
+        assert await wallet_balances(db, user.wallet_id) == (SEED_BALANCE - 4000, 0)
+
+@pytest.mark.asyncio
+async def test_holds_cannot_exceed_available_balance(db_sessionmaker, seeded_users):
+    user = seeded_users[0]
+    async with db_sessionmaker() as db:
+        await WalletHoldService.place_hold(db, user.wallet_id, SEED_BALANCE - 100, "HOLD_most")
+
+        with pytest.raises(ValueError, match="Insufficient balance"):
+            await WalletHoldService.place_hold(db, user.wallet_id, 101, "HOLD_over")
+        await WalletHoldService.place_hold(db, user.wallet_id, 100, "HOLD_rest")
+        assert await wallet_balances(db, user.wallet_id) == (SEED_BALANCE, SEED_BALANCE)
+
+@pytest.mark.asyncio
+async def test_expired_holds_release_funds(db_sessionmaker, seeded_users):
+    first, second = seeded_users[0], seeded_users[1]
+    async with db_sessionmaker() as db:
+        stale = [
+            await WalletHoldService.place_hold(db, first.wallet_id, 300, "HOLD_stale_a", ttl_seconds=1),
+            await WalletHoldService.place_hold(db, first.wallet_id, 200, "HOLD_stale_b", ttl_seconds=1),
+            await WalletHoldService.place_hold(db, second.wallet_id, 500, "HOLD_stale_c", ttl_seconds=1)
+        ]
+        fresh = await WalletHoldService.place_hold(db, second.wallet_id, 700, "HOLD_fresh", ttl_seconds=3600)
+
+        later = datetime.utcnow() + timedelta(minutes=1)
+        assert await WalletHoldService.expire_holds(db, limit=2, now=later) == 2
+        assert await WalletHoldService.expire_holds(db, limit=2, now=later) == 1
+        assert await WalletHoldService.expire_holds(db, limit=2, now=later) == 0
+
+        assert await wallet_balances(db, first.wallet_id) == (SEED_BALANCE, 0)
+        assert await wallet_balances(db, second.wallet_id) == (SEED_BALANCE, 700)
+        for hold in stale:
+            await db.refresh(hold)
+            assert hold.status is HoldStatus.expired
+        await db.refresh(fresh)
+        assert fresh.status is HoldStatus.active
+
+@pytest.mark.asyncio
+async def test_transfer_and_balance_respect_holds(client, db_sessionmaker, seeded_users):
+    sender, recipient = seeded_users[0], seeded_users[1]
+    async with db_sessionmaker() as db:
+        await WalletHoldService.place_hold(db, sender.wallet_id, SEED_BALANCE - 1000, "HOLD_transfer")
+
+    response = await client.post(
+        "/api/v1/wallet/transfer",
+        headers=sender.headers,
+        json={"wallet_number": recipient.wallet_number, "amount": 1001}
+    )
+    assert response.status_code == 400
+
+    response = await client.get("/api/v1/wallet/balance", headers=sender.headers)
+    data = response.json()["data"]
+    assert (data["balance"], data["held_balance"], data["available_balance"]) == (SEED_BALANCE, SEED_BALANCE - 1000, 1000)
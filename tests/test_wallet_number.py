@@ -0,0 +1,65 @@
+import uuid
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert, select
+
+from app.features.auth.models.user import User
+from app.features.wallet.models.wallet import Wallet
+from app.features.wallet.services.wallet_service import WalletService
+from app.features.wallet.utils import wallet_number
+from app.features.wallet.utils.wallet_number import has_valid_check_digit, validate_wallet_number
+from app.platform.config.settings import settings
+
+
+def test_generated_wallet_numbers_carry_check_digit(monkeypatch):
+    numbers = {Wallet.generate_wallet_number() for _ in range(100)}
+
+    assert all(len(number) == 13 and number.isdigit() for number in numbers)
+    assert all(has_valid_check_digit(number) for number in numbers)
+
+    typo = next(iter(numbers))
+    typo = typo[:5] + str((int(typo[5]) + 1) % 10) + typo[6:]
+    assert validate_wallet_number(typo) == typo
+
+    monkeypatch.setattr(wallet_number.settings, "WALLET_NUMBER_CHECK_DIGIT_ENFORCED", True)
+    with pytest.raises(ValueError, match="check digit"):
+        validate_wallet_number(typo)
+
+@pytest_asyncio.fixture
+async def new_user_id(db_connection) -> uuid.UUID:
+    user_id, now = uuid.uuid4(), datetime.utcnow()
+    await db_connection.execute(insert(User).values(
+        id=user_id, email=f"{user_id.hex}@example.com", name="New User", google_id=user_id.hex,
+        created_at=now, updated_at=now
+    ))
+    return user_id
+
+@pytest.mark.asyncio
+async def test_create_wallet_retries_a_taken_wallet_number(db_sessionmaker, seeded_users, new_user_id, monkeypatch):
+    fresh = Wallet.generate_wallet_number()
+    numbers = iter([seeded_users[0].wallet_number, seeded_users[1].wallet_number, fresh])
+    monkeypatch.setattr(Wallet, "generate_wallet_number", staticmethod(lambda: next(numbers)))
+
+    async with db_sessionmaker() as db:
+        wallet = await WalletService.create_wallet(db, new_user_id)
+    assert (wallet.user_id, wallet.wallet_number) == (new_user_id, fresh)
+    assert next(numbers, None) is None
+
+@pytest.mark.asyncio
+async def test_create_wallet_gives_up_after_the_attempt_cap(db_sessionmaker, seeded_users, new_user_id, monkeypatch):
+    attempts = []
+
+    def taken_number() -> str:
+        attempts.append(seeded_users[0].wallet_number)
+        return seeded_users[0].wallet_number
+
+    monkeypatch.setattr(Wallet, "generate_wallet_number", staticmethod(taken_number))
+    monkeypatch.setattr(settings, "WALLET_NUMBER_MAX_ATTEMPTS", 3)
+
+    async with db_sessionmaker() as db:
+        with pytest.raises(RuntimeError, match="unique wallet number"):
+            await WalletService.create_wallet(db, new_user_id)
+        assert await db.scalar(select(Wallet.id).where(Wallet.user_id == new_user_id)) is None
+    assert len(attempts) == 3